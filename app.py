@@ -1,85 +1,38 @@
 import streamlit as st
-import joblib
-import pandas as pd
-import re
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from streamlit_option_menu import option_menu
 from io import StringIO
+import queue
+import sys
 import time
 
+import model_store
+from inference import classify_chunked, classify_rows, needs_chunking
+from metrics import STAGE_SECONDS, timed, write_metrics_file
+from prediction_cache import PredictionCache, content_hash
+from resume_parsing import build_skill_matcher, parse_resume, skill_coverage
+from resume_data import (
+    APP_CSS, GENERAL_CONTENT, build_content_index, insights_frames, missing_content, sample_resumes,
+)
+from text_processing import clean_text
+
 # Force light theme
 st._config.set_option("theme.base", "light")
 
 # PDF processing imports
-try:
-    import PyPDF2
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-    st.warning("PyPDF2 not available. PDF processing will be limited. Install with: pip install PyPDF2")
+from pdf_extraction import PDF_AVAILABLE, PDFPLUMBER_AVAILABLE
+from extraction_pool import PdfExtractionPool
+from micro_batching import MicroBatcher
 
-# Alternative PDF processing
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
+# Hard limit for a single uploaded PDF; the parsing worker is killed after this
+PDF_TIMEOUT_SECONDS = 30
+EXTRACTION_WORKERS = 2
 
-# PDF text extraction function
-def extract_text_from_pdf(pdf_file):
-    """
-    Extract text from PDF file using multiple methods for better compatibility
-    """
-    try:
-        # Method 1: Try PyPDF2 first
-        if PDF_AVAILABLE:
-            try:
-                pdf_reader = PyPDF2.PdfReader(pdf_file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                if text.strip():
-                    return text.strip()
-            except Exception as e:
-                # Log error internally but don't show to user
-                pass
-        
-        # Method 2: Try pdfplumber as alternative
-        if PDFPLUMBER_AVAILABLE:
-            try:
-                with pdfplumber.open(pdf_file) as pdf:
-                    text = ""
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                    if text.strip():
-                        return text.strip()
-            except Exception as e:
-                # Log error internally but don't show to user
-                pass
-        
-        # Method 3: Fallback - try to read as bytes and decode
-        try:
-            pdf_file.seek(0)  # Reset file pointer
-            content = pdf_file.read()
-            # Try to extract text using basic text extraction
-            text = content.decode('utf-8', errors='ignore')
-            # Remove non-printable characters
-            text = re.sub(r'[^\x20-\x7E\n\r\t]', '', text)
-            if text.strip():
-                return text.strip()
-        except Exception as e:
-            # Log error internally but don't show to user
-            pass
-        
-        return None
-        
-    except Exception as e:
-        st.error(f"Error processing PDF: {str(e)}")
-        return None
+# Stage latency histograms are rewritten here after every analysis (Prometheus text format)
+METRICS_PATH = 'resume_metrics.prom'
+
+if not PDF_AVAILABLE:
+    st.warning("PyPDF2 not available. PDF processing will be limited. Install with: pip install PyPDF2")
 
 # Set page config first
 st.set_page_config(
@@ -90,445 +43,75 @@ st.set_page_config(
 )
 
 # Custom CSS for styling
-st.markdown("""
-<style>
-    /* Main styles */
-    .main-header {
-        font-size: 3rem;
-        color: #1E3A8A;
-        font-weight: 700;
-        margin-bottom: 0.5rem;
-    }
-    
-    .sub-header {
-        font-size: 1.2rem;
-        color: #64748B;
-        margin-bottom: 2rem;
-    }
-    
-    .card {
-        background-color: #FFFFFF;
-        border-radius: 12px;
-        padding: 1.5rem;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        margin-bottom: 1.5rem;
-        border-left: 4px solid #3B82F6;
-    }
-    
-    .result-card {
-        background: linear-gradient(135deg, #1E40AF 0%, #3B82F6 100%);
-        color: white;
-        border-radius: 12px;
-        padding: 2rem;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    
-    .confidence-meter {
-        height: 8px;
-        background-color: #E5E7EB;
-        border-radius: 4px;
-        margin: 1rem 0;
-        overflow: hidden;
-    }
-    
-    .confidence-fill {
-        height: 100%;
-        background: linear-gradient(90deg, #10B981 0%, #3B82F6 100%);
-        border-radius: 4px;
-    }
-    
-    .job-card {
-        background-color: #F8FAFC;
-        border-radius: 8px;
-        padding: 1rem;
-        margin-bottom: 0.5rem;
-        border-left: 3px solid #3B82F6;
-        transition: all 0.3s ease;
-    }
-    
-    .job-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 12px rgba(0, 0, 0, 0.1);
-    }
-    
-    .skill-pill {
-        display: inline-block;
-        background-color: #DBEAFE;
-        color: #1E40AF;
-        padding: 0.3rem 0.8rem;
-        border-radius: 20px;
-        margin: 0.2rem;
-        font-size: 0.8rem;
-    }
-    
-    .stProgress > div > div > div > div {
-        background: linear-gradient(90deg, #10B981 0%, #3B82F6 100%);
-    }
-    
-    /* Sidebar styles */
-    .sidebar-header {
-        text-align: center;
-        padding: 1rem 0;
-        border-bottom: 1px solid #E5E7EB;
-        margin-bottom: 1rem;
-    }
-    
-    /* Button styles */
-    .stButton > button {
-        background: linear-gradient(135deg, #1E40AF 0%, #3B82F6 100%);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 0.7rem 1.5rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(59, 130, 246, 0.4);
-    }
-    
-    /* Text area styling */
-    .stTextArea > div > div > textarea {
-        border-radius: 8px;
-        border: 2px solid #E5E7EB;
-        padding: 1rem;
-    }
-    
-    /* Metric styling */
-    .stMetric {
-        background-color: #F8FAFC;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #3B82F6;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Text cleaning function
-def clean_text(text):
-    if isinstance(text, str):
-        text = text.lower()
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
-    return ""
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
-# Job recommendations
-def get_recommendations(category):
-    recommendations = {
-        'Data Science': [
-            {"title": "Data Scientist", "companies": ["Google", "Amazon", "Netflix", "Meta", "Microsoft"], "skills": ["Python", "Machine Learning", "Statistics", "SQL", "Data Visualization"]},
-            {"title": "Machine Learning Engineer", "companies": ["Facebook", "Apple", "Uber", "Tesla", "OpenAI"], "skills": ["TensorFlow", "PyTorch", "Deep Learning", "MLOps", "Cloud Platforms"]},
-            {"title": "Data Analyst", "companies": ["Microsoft", "Spotify", "Airbnb", "Salesforce", "Adobe"], "skills": ["SQL", "Excel", "Tableau", "Python", "Business Intelligence"]},
-            {"title": "Data Engineer", "companies": ["Netflix", "Uber", "Airbnb", "Stripe", "Shopify"], "skills": ["Apache Spark", "Hadoop", "Kafka", "Python", "Data Pipelines"]}
-        ],
-        'Design': [
-            {"title": "UI/UX Designer", "companies": ["Adobe", "Figma", "InVision", "Google", "Apple"], "skills": ["Figma", "User Research", "Wireframing", "Prototyping", "Design Systems"]},
-            {"title": "Product Designer", "companies": ["Apple", "Google", "Facebook", "Netflix", "Airbnb"], "skills": ["Design Thinking", "Prototyping", "User Testing", "Product Strategy", "Visual Design"]},
-            {"title": "Graphic Designer", "companies": ["Canva", "Adobe", "Behance", "Nike", "Coca-Cola"], "skills": ["Illustrator", "Photoshop", "Typography", "Brand Identity", "Print Design"]},
-            {"title": "Visual Designer", "companies": ["Spotify", "Instagram", "TikTok", "Snapchat", "Pinterest"], "skills": ["Motion Graphics", "3D Design", "Animation", "Visual Effects", "Digital Art"]}
-        ],
-        'Web Development': [
-            {"title": "Frontend Developer", "companies": ["Netflix", "Twitter", "Shopify", "Discord", "Notion"], "skills": ["React", "JavaScript", "CSS", "TypeScript", "Responsive Design"]},
-            {"title": "Backend Developer", "companies": ["Amazon", "PayPal", "Stripe", "Uber", "Airbnb"], "skills": ["Node.js", "Python", "APIs", "Databases", "Microservices"]},
-            {"title": "Full Stack Developer", "companies": ["Google", "Microsoft", "Meta", "Netflix", "Spotify"], "skills": ["MERN Stack", "DevOps", "Databases", "Cloud Services", "System Design"]},
-            {"title": "DevOps Engineer", "companies": ["Netflix", "Uber", "Airbnb", "Spotify", "Discord"], "skills": ["Docker", "Kubernetes", "AWS", "CI/CD", "Infrastructure"]}
-        ],
-        'Mobile Development': [
-            {"title": "iOS Developer", "companies": ["Apple", "Uber", "Instagram", "TikTok", "Spotify"], "skills": ["Swift", "SwiftUI", "iOS SDK", "Core Data", "App Store"]},
-            {"title": "Android Developer", "companies": ["Google", "Snapchat", "Discord", "TikTok", "Uber"], "skills": ["Kotlin", "Android SDK", "Jetpack", "Material Design", "Google Play"]},
-            {"title": "React Native Developer", "companies": ["Facebook", "Instagram", "Discord", "Skype", "Shopify"], "skills": ["React Native", "JavaScript", "Mobile Development", "Cross-platform", "Native Modules"]}
-        ],
-        'Software Engineering': [
-            {"title": "Software Engineer", "companies": ["Google", "Microsoft", "Amazon", "Meta", "Apple"], "skills": ["Algorithms", "Data Structures", "System Design", "Programming", "Problem Solving"]},
-            {"title": "Cloud Engineer", "companies": ["Amazon", "Microsoft", "Google", "Netflix", "Uber"], "skills": ["AWS", "Azure", "GCP", "Terraform", "Kubernetes"]},
-            {"title": "Security Engineer", "companies": ["Google", "Microsoft", "Amazon", "Meta", "Netflix"], "skills": ["Cybersecurity", "Network Security", "Penetration Testing", "Security Tools", "Compliance"]}
-        ],
-        'Marketing': [
-            {"title": "Digital Marketing Manager", "companies": ["Google", "Facebook", "Amazon", "Netflix", "Spotify"], "skills": ["SEO", "SEM", "Social Media", "Analytics", "Content Strategy"]},
-            {"title": "Content Marketing Specialist", "companies": ["HubSpot", "Mailchimp", "Canva", "Buffer", "Hootsuite"], "skills": ["Content Creation", "SEO", "Social Media", "Email Marketing", "Analytics"]},
-            {"title": "Growth Marketing Manager", "companies": ["Uber", "Airbnb", "Spotify", "Discord", "Notion"], "skills": ["Growth Hacking", "A/B Testing", "Conversion Optimization", "Data Analysis", "Marketing Automation"]}
-        ],
-        'Sales': [
-            {"title": "Sales Development Representative", "companies": ["Salesforce", "HubSpot", "Microsoft", "Oracle", "Adobe"], "skills": ["Lead Generation", "Cold Calling", "CRM", "Sales Process", "Communication"]},
-            {"title": "Account Executive", "companies": ["Salesforce", "Microsoft", "Oracle", "Adobe", "Workday"], "skills": ["Relationship Building", "Solution Selling", "Negotiation", "Pipeline Management", "Revenue Growth"]}
-        ],
-        'Finance': [
-            {"title": "Financial Analyst", "companies": ["Goldman Sachs", "JPMorgan", "Morgan Stanley", "BlackRock", "Vanguard"], "skills": ["Financial Modeling", "Excel", "VBA", "Financial Analysis", "Risk Assessment"]},
-            {"title": "Investment Banker", "companies": ["Goldman Sachs", "JPMorgan", "Morgan Stanley", "Bank of America", "Citigroup"], "skills": ["Financial Modeling", "Valuation", "M&A", "Capital Markets", "Financial Analysis"]}
-        ],
-        'Healthcare': [
-            {"title": "Healthcare Data Analyst", "companies": ["UnitedHealth", "Anthem", "Kaiser", "CVS Health", "Walgreens"], "skills": ["Healthcare Data", "SQL", "Python", "Statistical Analysis", "Healthcare Regulations"]},
-            {"title": "Clinical Research Associate", "companies": ["Pfizer", "Johnson & Johnson", "Roche", "Novartis", "Merck"], "skills": ["Clinical Trials", "Regulatory Compliance", "Data Management", "Medical Writing", "Research Protocols"]}
-        ],
-        'Education': [
-            {"title": "Educational Technology Specialist", "companies": ["Coursera", "Udemy", "edX", "Khan Academy", "Duolingo"], "skills": ["EdTech", "Learning Management Systems", "Instructional Design", "Digital Learning", "Educational Content"]},
-            {"title": "Curriculum Developer", "companies": ["Khan Academy", "Coursera", "Udemy", "edX", "Codecademy"], "skills": ["Curriculum Design", "Instructional Design", "Educational Content", "Assessment Design", "Learning Objectives"]}
-        ]
-    }
-    
-    # Handle case where category might not match exactly
-    for key in recommendations:
-        if key.lower() in category.lower():
-            return recommendations[key]
-    return [{"title": "Senior roles in your field", "companies": ["Various"], "skills": ["Leadership", "Strategy", "Management", "Communication", "Problem Solving"]}]
+# PDF parsing runs in worker processes so a pathological file can't stall the app.
+# PdfExtractionPool serves one caller at a time, so concurrent sessions each borrow a
+# single-worker pool instead of queueing behind one shared pool
+@st.cache_resource
+def get_extraction_pools():
+    pools = queue.Queue()
+    for _ in range(EXTRACTION_WORKERS):
+        pools.put(PdfExtractionPool(workers=1, timeout=PDF_TIMEOUT_SECONDS))
+    return pools
+
+def extract_pdf(data):
+    pools = get_extraction_pools()
+    pool = pools.get()
+    try:
+        return pool.extract(data)
+    finally:
+        pools.put(pool)
 
-# Skill suggestions based on category
-def get_skill_suggestions(category):
-    suggestions = {
-        'Data Science': ["Python", "R", "SQL", "Machine Learning", "Statistics", "Data Visualization", "Big Data", "Deep Learning", "TensorFlow", "PyTorch", "Scikit-learn", "Pandas", "NumPy", "Matplotlib", "Seaborn", "Jupyter", "Git", "Docker", "AWS", "Azure"],
-        'Design': ["Figma", "Adobe Creative Suite", "UI/UX Design", "Typography", "Color Theory", "Wireframing", "Prototyping", "User Research", "Design Systems", "Sketch", "InVision", "Principle", "After Effects", "Illustrator", "Photoshop", "XD", "User Testing", "Accessibility"],
-        'Web Development': ["JavaScript", "HTML/CSS", "React", "Node.js", "APIs", "Databases", "Git", "DevOps", "TypeScript", "Vue.js", "Angular", "Express.js", "MongoDB", "PostgreSQL", "MySQL", "AWS", "Docker", "Kubernetes", "CI/CD", "REST APIs"],
-        'Mobile Development': ["Swift", "Kotlin", "React Native", "Flutter", "iOS Development", "Android Development", "Mobile UI/UX", "App Store", "Google Play", "Mobile Testing", "Performance Optimization", "Push Notifications", "In-App Purchases", "Mobile Analytics"],
-        'Software Engineering': ["Algorithms", "Data Structures", "System Design", "Programming", "Problem Solving", "Java", "C++", "Python", "Go", "Rust", "Microservices", "API Design", "Database Design", "System Architecture", "Code Review", "Testing", "Agile", "Scrum"],
-        'Marketing': ["SEO", "SEM", "Social Media Marketing", "Content Marketing", "Email Marketing", "Google Analytics", "Facebook Ads", "Google Ads", "Marketing Automation", "A/B Testing", "Conversion Optimization", "Brand Management", "Market Research", "Customer Segmentation"],
-        'Sales': ["Lead Generation", "Cold Calling", "CRM", "Sales Process", "Communication", "Negotiation", "Relationship Building", "Solution Selling", "Pipeline Management", "Revenue Growth", "Sales Strategy", "Account Management", "Prospecting", "Closing Techniques"],
-        'Finance': ["Financial Modeling", "Excel", "VBA", "Financial Analysis", "Risk Assessment", "Valuation", "Investment Analysis", "Portfolio Management", "Financial Planning", "Accounting", "Budgeting", "Forecasting", "Financial Reporting", "Compliance"],
-        'Healthcare': ["Healthcare Data", "SQL", "Python", "Statistical Analysis", "Healthcare Regulations", "Clinical Trials", "Medical Terminology", "Health Informatics", "Patient Data", "Medical Coding", "HIPAA Compliance", "Healthcare Analytics", "Population Health"],
-        'Education': ["EdTech", "Learning Management Systems", "Instructional Design", "Digital Learning", "Educational Content", "Curriculum Design", "Assessment Design", "Learning Objectives", "Student Engagement", "Educational Technology", "Online Learning", "Blended Learning"]
-    }
-    
-    for key in suggestions:
-        if key.lower() in category.lower():
-            return suggestions[key]
-    return ["Python", "JavaScript", "SQL", "Communication", "Project Management", "Leadership", "Problem Solving", "Critical Thinking", "Teamwork", "Adaptability"]
+# Re-uploads of the same file skip extraction and scoring; entries are tied to the model version
+@st.cache_resource
+def get_prediction_cache():
+    return PredictionCache(model_store.model_version())
 
 # Load models with error handling
 @st.cache_resource
 def load_models():
-    try:
-        tfidf = joblib.load('vectorizer.pkl')
-        label_encoder = joblib.load('labelencoder.pkl')
-        model = joblib.load('classifier.pkl')
-        return tfidf, label_encoder, model, None
-    except Exception as e:
-        return None, None, None, str(e)
-
-# Sample resume texts
-sample_resumes = {
-    "Data Science": """John Doe
-Data Scientist
-San Francisco, CA | john.doe@email.com | (123) 456-7890
-
-SUMMARY
-Experienced Data Scientist with 5+ years of expertise in machine learning, statistical analysis, and data visualization. Skilled in Python, R, SQL, and various ML frameworks.
-
-EXPERIENCE
-Senior Data Scientist, Tech Company Inc. (2020-Present)
-- Developed predictive models that improved customer retention by 25%
-- Implemented machine learning pipelines processing 1TB+ of daily data
-- Created data visualizations that informed key business decisions
-
-Data Analyst, Analytics Corp (2018-2020)
-- Performed statistical analysis on large datasets
-- Built ETL processes to streamline data workflows
-- Created dashboards for executive reporting
-
-SKILLS
-Python, R, SQL, TensorFlow, PyTorch, Scikit-learn, Pandas, NumPy, Data Visualization, Statistical Analysis, Machine Learning, Big Data
-
-EDUCATION
-MS in Data Science, University of Technology (2018)
-BS in Computer Science, State University (2016)""",
-
-    "Web Development": """Jane Smith
-Full Stack Developer
-New York, NY | jane.smith@email.com | (987) 654-3210
-
-SUMMARY
-Full Stack Developer with 6 years of experience building scalable web applications. Proficient in JavaScript, React, Node.js, and modern development practices.
-
-EXPERIENCE
-Senior Developer, Web Solutions Inc. (2019-Present)
-- Led development of customer-facing React applications serving 100k+ users
-- Built RESTful APIs using Node.js and Express
-- Implemented CI/CD pipelines reducing deployment time by 40%
-
-Frontend Developer, Digital Agency LLC (2017-2019)
-- Developed responsive web applications using React and Vue.js
-- Collaborated with designers to implement UI/UX best practices
-- Optimized frontend performance improving load times by 30%
-
-SKILLS
-JavaScript, TypeScript, React, Node.js, Express, HTML5, CSS3, MongoDB, PostgreSQL, Git, AWS, Docker, REST APIs
-
-EDUCATION
-BS in Computer Science, Tech University (2017)""",
-
-    "Design": """Alex Johnson
-Product Designer
-Austin, TX | alex.j@email.com | (555) 123-4567
-
-SUMMARY
-Creative Product Designer with 4+ years of experience in UI/UX design for digital products. Passionate about creating intuitive user experiences.
-
-EXPERIENCE
-Lead Product Designer, Design Studio (2020-Present)
-- Designed mobile and web applications for Fortune 500 clients
-- Conducted user research and usability testing
-- Created design systems and component libraries
-
-UI Designer, Creative Agency (2018-2020)
-- Designed interfaces for e-commerce platforms
-- Created wireframes, prototypes, and high-fidelity mockups
-- Collaborated with developers to ensure design implementation
-
-SKILLS
-Figma, Sketch, Adobe Creative Suite, UI Design, UX Research, Wireframing, Prototyping, Design Systems, User Testing, HTML/CSS
-
-EDUCATION
-BFA in Design, Art Institute (2018)""",
-
-    "Mobile Development": """Sarah Chen
-iOS Developer
-Seattle, WA | sarah.chen@email.com | (206) 555-0123
-
-SUMMARY
-iOS Developer with 4+ years of experience building native iOS applications. Expert in Swift, SwiftUI, and iOS development best practices.
-
-EXPERIENCE
-Senior iOS Developer, Mobile Tech Inc. (2020-Present)
-- Led development of iOS apps with 500k+ downloads
-- Implemented advanced features using Core Data and Core Animation
-- Mentored junior developers and conducted code reviews
-
-iOS Developer, App Studio (2018-2020)
-- Developed consumer-facing iOS applications
-- Integrated third-party APIs and payment systems
-- Optimized app performance and reduced crash rates
-
-SKILLS
-Swift, SwiftUI, iOS SDK, Core Data, Core Animation, Xcode, Git, REST APIs, JSON, App Store Connect, TestFlight
-
-EDUCATION
-BS in Computer Science, University of Washington (2018)""",
+    return model_store.load_models()
 
-    "Software Engineering": """Michael Rodriguez
-Software Engineer
-Mountain View, CA | michael.r@email.com | (650) 555-0456
-
-SUMMARY
-Software Engineer with 6+ years of experience in system design, algorithms, and scalable software development. Passionate about clean code and efficient solutions.
-
-EXPERIENCE
-Senior Software Engineer, Tech Giant Inc. (2019-Present)
-- Designed and implemented microservices architecture serving 10M+ users
-- Led technical design reviews and architecture decisions
-- Mentored junior engineers and conducted technical interviews
-
-Software Engineer, Startup Corp (2017-2019)
-- Built backend services using Java and Spring Boot
-- Implemented CI/CD pipelines and automated testing
-- Collaborated with cross-functional teams on product features
-
-SKILLS
-Java, Python, C++, Algorithms, Data Structures, System Design, Microservices, Docker, Kubernetes, AWS, Git, Agile, Scrum
-
-EDUCATION
-MS in Computer Science, Stanford University (2017)
-BS in Computer Science, UC Berkeley (2015)""",
-
-    "Marketing": """Emily Watson
-Digital Marketing Manager
-Los Angeles, CA | emily.w@email.com | (310) 555-0789
-
-SUMMARY
-Digital Marketing Manager with 5+ years of experience in digital marketing, growth strategies, and campaign optimization. Results-driven professional with proven track record.
-
-EXPERIENCE
-Digital Marketing Manager, E-commerce Inc. (2020-Present)
-- Managed $2M+ annual digital marketing budget
-- Increased conversion rates by 35% through A/B testing
-- Led team of 5 marketing specialists
-
-Marketing Specialist, Digital Agency (2018-2020)
-- Executed paid advertising campaigns across multiple platforms
-- Developed content marketing strategies and social media presence
-- Analyzed campaign performance and provided optimization recommendations
-
-SKILLS
-SEO, SEM, Google Ads, Facebook Ads, Google Analytics, Content Marketing, Social Media Marketing, Email Marketing, A/B Testing, Conversion Optimization
-
-EDUCATION
-BS in Marketing, UCLA (2018)""",
-
-    "Finance": """David Kim
-Financial Analyst
-New York, NY | david.kim@email.com | (212) 555-0321
-
-SUMMARY
-Financial Analyst with 4+ years of experience in financial modeling, analysis, and reporting. Strong analytical skills and attention to detail.
-
-EXPERIENCE
-Senior Financial Analyst, Investment Bank (2020-Present)
-- Built complex financial models for M&A transactions
-- Conducted due diligence and financial analysis
-- Prepared presentations for senior management and clients
-
-Financial Analyst, Corporate Finance (2018-2020)
-- Created monthly financial reports and variance analysis
-- Assisted with budgeting and forecasting processes
-- Developed financial dashboards and KPIs
-
-SKILLS
-Financial Modeling, Excel, VBA, Financial Analysis, Valuation, M&A, Capital Markets, Bloomberg Terminal, PowerPoint, Accounting, Risk Assessment
-
-EDUCATION
-BS in Finance, NYU Stern (2018)""",
-
-    "Healthcare": """Dr. Lisa Thompson
-Healthcare Data Analyst
-Boston, MA | lisa.thompson@email.com | (617) 555-0654
-
-SUMMARY
-Healthcare Data Analyst with 3+ years of experience in healthcare analytics and data management. Background in clinical research and healthcare informatics.
-
-EXPERIENCE
-Healthcare Data Analyst, Health System Inc. (2020-Present)
-- Analyzed patient data to identify trends and improve care quality
-- Developed healthcare dashboards and reporting systems
-- Ensured HIPAA compliance in all data handling processes
-
-Clinical Research Coordinator, Medical Center (2018-2020)
-- Coordinated clinical trials and research studies
-- Collected and managed clinical data
-- Prepared regulatory submissions and reports
-
-SKILLS
-Healthcare Data, SQL, Python, Statistical Analysis, Healthcare Regulations, Clinical Trials, Medical Terminology, Health Informatics, HIPAA Compliance
-
-EDUCATION
-MPH in Epidemiology, Harvard University (2018)
-BS in Biology, Boston University (2016)""",
-
-    "Education": """Robert Wilson
-Educational Technology Specialist
-San Diego, CA | robert.w@email.com | (619) 555-0987
+# Concurrent "Analyze Resume" clicks from different sessions are scored together in one batch
+@st.cache_resource
+def get_classifier_batcher():
+    tfidf, label_encoder, model, _ = load_models()
 
-SUMMARY
-Educational Technology Specialist with 4+ years of experience in edtech, instructional design, and digital learning solutions. Passionate about improving education through technology.
+    def score(cleaned):
+        # Every row carries the vectorize/predict timings of the batch it was scored in
+        timings = {}
+        rows = classify_rows(cleaned, tfidf, label_encoder, model, timings)
+        return [row + (timings,) for row in rows]
 
-EXPERIENCE
-Educational Technology Specialist, EdTech Company (2020-Present)
-- Designed and implemented learning management systems
-- Created interactive digital learning content
-- Provided training and support to educators
+    return MicroBatcher(score)
 
-Instructional Designer, University (2018-2020)
-- Developed online courses and curriculum materials
-- Implemented educational technology solutions
-- Conducted faculty training on digital tools
+# The skill automaton is compiled once per process and shared by every session
+@st.cache_resource
+def get_skill_matcher():
+    return build_skill_matcher()
 
-SKILLS
-EdTech, Learning Management Systems, Instructional Design, Digital Learning, Educational Content, Curriculum Design, Assessment Design, User Experience, Training
+# Recommendations, skills and tips for every trained label, resolved once per process
+@st.cache_resource
+def get_content_index():
+    _, label_encoder, _, _ = load_models()
+    index = build_content_index(label_encoder.classes_ if label_encoder is not None else [])
+    missing = missing_content(index)
+    if missing:
+        print(f"No tailored content for {len(missing)} categories, showing general tips: {', '.join(missing)}",
+              file=sys.stderr)
+    return index
+
+def get_category_content(category):
+    return get_content_index().get(category, GENERAL_CONTENT)
+
+# Insights charts are built once per process and shared by every session
+@st.cache_resource
+def get_insights_frames():
+    return insights_frames()
 
-EDUCATION
-MEd in Educational Technology, San Diego State University (2018)
-BS in Education, UC San Diego (2016)"""
-}
+def format_seconds(seconds):
+    return f"{seconds * 1000:.0f} ms" if seconds < 1 else f"{seconds:.2f}s"
 
 # Main app
 def main():
@@ -593,6 +176,8 @@ def main():
     
     # Load models
     tfidf, label_encoder, model, error = load_models()
+    get_content_index()
+    get_skill_matcher()
     
     if selected == "Home":
         show_home_page()
@@ -762,6 +347,7 @@ def show_classify_page(tfidf, label_encoder, model, error):
         input_method = st.radio("Choose input method:", ["Paste text", "Upload file"], horizontal=True)
         
         resume_text = ""
+        content_key = None
         if input_method == "Paste text":
             resume_text = st.text_area(
                 "Paste your resume content:",
@@ -778,6 +364,8 @@ def show_classify_page(tfidf, label_encoder, model, error):
                 st.info("Run: `pip install PyPDF2 pdfplumber`")
             
             if uploaded_file is not None:
+                content_key = content_hash(uploaded_file.getvalue())
+                cached = get_prediction_cache().get(content_key)
                 if uploaded_file.type == "text/plain":
                     # Handle text files
                     stringio = StringIO(uploaded_file.getvalue().decode("utf-8"))
@@ -792,7 +380,15 @@ def show_classify_page(tfidf, label_encoder, model, error):
                         st.info("**Or paste your resume text below:**")
                     else:
                         with st.spinner("Processing PDF file..."):
-                            pdf_text = extract_text_from_pdf(uploaded_file)
+                            if cached and cached['extracted_text']:
+                                pdf_text, pdf_error = cached['extracted_text'], None
+                            else:
+                                start = time.perf_counter()
+                                pdf_text, pdf_error = extract_pdf(uploaded_file.getvalue())
+                                # Extraction happens on upload, a rerun before Analyze; keep its time for the results
+                                st.session_state.extraction_timing = (content_key, time.perf_counter() - start)
+                                if pdf_text:
+                                    get_prediction_cache().put(content_key, extracted_text=pdf_text)
                             if pdf_text:
                                 resume_text = pdf_text
                                 st.success("✅ PDF processed successfully!")
@@ -811,6 +407,8 @@ def show_classify_page(tfidf, label_encoder, model, error):
                                         st.error("❌ **Low Quality**: Limited text extracted, recommend manual input")
                             else:
                                 st.error("❌ Failed to extract text from PDF. Please try pasting the text instead.")
+                                if pdf_error and pdf_error.startswith('timed out'):
+                                    st.info(f"⏱️ Processing was stopped after {PDF_TIMEOUT_SECONDS} seconds.")
                                 st.info("💡 **Tips for better PDF processing:**")
                                 st.info("• Ensure the PDF contains selectable text (not just images)")
                                 st.info("• Try copying text directly from the PDF and pasting it")
@@ -892,24 +490,60 @@ def show_classify_page(tfidf, label_encoder, model, error):
         
         if 'sample_text' in st.session_state:
             resume_text = st.session_state.sample_text
+            content_key = None
         
         if st.button("Analyze Resume", type="primary", use_container_width=True):
             if resume_text and len(resume_text.strip()) > 50:
                 with st.spinner('Analyzing your resume...'):
-                    # Preprocess
-                    cleaned_text = clean_text(resume_text)
-                    # Vectorize
-                    text_vector = tfidf.transform([cleaned_text])
-                    # Predict
-                    prediction = model.predict(text_vector)
-                    probability = model.predict_proba(text_vector)
+                    start = time.perf_counter()
+                    timings = {}
+                    extraction = st.session_state.get('extraction_timing')
+                    if content_key and extraction and extraction[0] == content_key:
+                        timings['extract'] = extraction[1]
+
+                    cache = get_prediction_cache()
+                    content_key = content_key or content_hash(resume_text)
+                    cached = cache.get(content_key)
+                    
+                    if cached and cached['category'] is not None:
+                        category = cached['category']
+                        confidence = cached['confidence']
+                        probabilities = np.asarray(cached['probabilities'])
+                    else:
+                        # Preprocess
+                        with timed('clean', timings):
+                            cleaned_text = clean_text(resume_text)
+                        # Vectorize and predict; long CVs are scored from their leading windows instead
+                        if needs_chunking(cleaned_text):
+                            category, confidence, probabilities = classify_chunked(
+                                cleaned_text, tfidf, label_encoder, model, timings=timings
+                            )
+                        else:
+                            category, confidence, probabilities, score_timings = get_classifier_batcher()(cleaned_text)
+                            timings.update(score_timings)
+                        cache.put(content_key, resume_text, cleaned_text, category, confidence, probabilities)
+                    
+                    # Sections and known skills, parsed once here so the results page only reads them
+                    with timed('parse', timings):
+                        resume = parse_resume(resume_text, get_skill_matcher())
+                    
+                    timings['total'] = timings.get('extract', 0.0) + time.perf_counter() - start
+                    STAGE_SECONDS.observe(timings['total'], 'total')
+                    try:
+                        write_metrics_file(METRICS_PATH)
+                    except OSError:
+                        # Metrics export is best effort; a read-only directory must not break analysis
+                        pass
                     
                     # Store results in session state
                     st.session_state.results = {
-                        'category': label_encoder.inverse_transform(prediction)[0],
-                        'confidence': np.max(probability) * 100,
-                        'probabilities': probability[0],
-                        'categories': label_encoder.classes_
+                        'category': category,
+                        'confidence': confidence,
+                        'probabilities': probabilities,
+                        'categories': label_encoder.classes_,
+                        'timings': timings,
+                        'resume': resume,
+                        'from_cache': bool(cached and cached['category'] is not None),
                     }
                     
                     # Redirect to results page
@@ -954,6 +588,9 @@ def show_classify_page(tfidf, label_encoder, model, error):
         """, unsafe_allow_html=True)
 
 def show_results_page():
+    # pandas is only needed for the charts; importing it here keeps it off the cold start
+    import pandas as pd
+
     if 'results' not in st.session_state:
         st.warning("No analysis results found. Please analyze a resume first.")
         return
@@ -977,7 +614,16 @@ def show_results_page():
         st.metric("Confidence Score", f"{results['confidence']:.1f}%")
     
     with col3:
-        st.metric("Analysis Time", "2.3s")
+        timings = results.get('timings', {})
+        st.metric("Analysis Time", format_seconds(timings['total']) if 'total' in timings else "n/a")
+        if results.get('from_cache'):
+            st.caption("Served from cache")
+        else:
+            stages = [("Extract", 'extract'), ("Clean", 'clean'), ("Vectorize", 'vectorize'), ("Predict", 'predict'),
+                      ("Parse", 'parse')]
+            st.caption(" · ".join(
+                f"{label} {format_seconds(timings[stage])}" for label, stage in stages if stage in timings
+            ))
     
     # Confidence meter
     st.markdown("""
@@ -1009,10 +655,14 @@ def show_results_page():
     
     # Recommendations
     st.subheader("💼 Recommended Job Roles")
-    recommendations = get_recommendations(results['category'])
+    content = get_category_content(results['category'])
+    resume = results.get('resume')
     
-    for job in recommendations:
+    for job in content['recommendations']:
         with st.expander(f"{job['title']}"):
+            if resume is not None:
+                found, _ = skill_coverage(resume, job['skills'])
+                st.caption(f"Your resume mentions {len(found)} of its {len(job['skills'])} key skills")
             st.markdown(f"""
             **Top Companies:** {', '.join(job['companies'])}
             
@@ -1026,114 +676,32 @@ def show_results_page():
     
     # Skill analysis
     st.subheader("📊 Skill Analysis")
-    suggested_skills = get_skill_suggestions(results['category'])
-    
-    st.write("**Skills to highlight based on your domain:**")
-    for skill in suggested_skills:
-        st.markdown(f'<span class="skill-pill">{skill}</span>', unsafe_allow_html=True)
+    if resume is None:
+        st.write("**Skills to highlight based on your domain:**")
+        for skill in content['skills']:
+            st.markdown(f'<span class="skill-pill">{skill}</span>', unsafe_allow_html=True)
+    else:
+        found, missing = skill_coverage(resume, content['skills'])
+        st.write(f"**Found in your resume ({len(found)} of {len(content['skills'])} key skills for your domain):**")
+        if found:
+            st.markdown(''.join(f'<span class="skill-pill">{skill}</span>' for skill in found), unsafe_allow_html=True)
+        else:
+            st.caption("None of the key skills were found; list them explicitly in a Skills section.")
+        if missing:
+            st.write("**Missing, worth adding if you have them:**")
+            st.markdown(''.join(f'<span class="skill-pill missing">{skill}</span>' for skill in missing),
+                        unsafe_allow_html=True)
+        other = [skill for skill in resume['skills'] if skill not in content['skills']]
+        if other:
+            st.write("**Other skills detected:**")
+            st.markdown(''.join(f'<span class="skill-pill">{skill}</span>' for skill in other), unsafe_allow_html=True)
+        if not resume['sections']['skills']:
+            st.caption("No Skills section was found; a dedicated SKILLS header helps both recruiters and parsers.")
     
     # Improvement tips
     st.subheader("🚀 Improvement Tips")
     
-    if 'data' in results['category'].lower():
-        st.info("""
-        **📊 Data Science & Analytics:**
-        - Showcase specific ML projects with metrics and business impact
-        - Highlight your proficiency with Python data stack (Pandas, NumPy, Scikit-learn)
-        - Include any cloud platform experience (AWS, GCP, Azure)
-        - Quantify your impact with percentages and numbers
-        - Add data visualization examples and storytelling skills
-        """)
-    elif 'design' in results['category'].lower():
-        st.info("""
-        **🎨 Design & Creative:**
-        - Create a comprehensive portfolio with case studies
-        - Highlight your design process and thinking methodology
-        - Include specific tools proficiency (Figma, Adobe XD, Sketch)
-        - Show before/after examples and user research insights
-        - Demonstrate understanding of accessibility and user experience
-        """)
-    elif 'web' in results['category'].lower():
-        st.info("""
-        **🌐 Web Development:**
-        - Highlight specific technologies and frameworks you've used
-        - Include GitHub profile with sample projects and contributions
-        - Mention performance optimization and scalability experience
-        - Detail any DevOps, CI/CD, or deployment experience
-        - Showcase responsive design and cross-browser compatibility skills
-        """)
-    elif 'mobile' in results['category'].lower():
-        st.info("""
-        **📱 Mobile Development:**
-        - Showcase apps in app stores with download numbers
-        - Highlight platform-specific skills (iOS/Android)
-        - Include performance optimization and testing experience
-        - Demonstrate knowledge of mobile UI/UX best practices
-        - Show experience with cross-platform frameworks if applicable
-        """)
-    elif 'software' in results['category'].lower():
-        st.info("""
-        **⚙️ Software Engineering:**
-        - Highlight system design and architecture experience
-        - Showcase algorithm and data structure knowledge
-        - Include experience with microservices and distributed systems
-        - Demonstrate code quality and testing practices
-        - Show leadership and mentoring experience
-        """)
-    elif 'marketing' in results['category'].lower():
-        st.info("""
-        **📈 Marketing & Growth:**
-        - Quantify campaign results with specific metrics
-        - Highlight experience with marketing automation tools
-        - Showcase A/B testing and conversion optimization skills
-        - Include experience with various marketing channels
-        - Demonstrate data-driven decision making
-        """)
-    elif 'sales' in results['category'].lower():
-        st.info("""
-        **💼 Sales & Business Development:**
-        - Highlight revenue generation and quota achievement
-        - Showcase relationship building and negotiation skills
-        - Include experience with CRM systems and sales processes
-        - Demonstrate market research and prospecting abilities
-        - Show leadership in sales teams if applicable
-        """)
-    elif 'finance' in results['category'].lower():
-        st.info("""
-        **💰 Finance & Investment:**
-        - Highlight financial modeling and analysis skills
-        - Showcase experience with financial software and tools
-        - Include specific deal experience and transaction sizes
-        - Demonstrate understanding of regulations and compliance
-        - Show quantitative and analytical capabilities
-        """)
-    elif 'healthcare' in results['category'].lower():
-        st.info("""
-        **🏥 Healthcare & Life Sciences:**
-        - Highlight healthcare-specific data analysis experience
-        - Showcase knowledge of healthcare regulations (HIPAA, etc.)
-        - Include experience with clinical trials or patient data
-        - Demonstrate understanding of healthcare workflows
-        - Show experience with healthcare-specific tools and systems
-        """)
-    elif 'education' in results['category'].lower():
-        st.info("""
-        **🎓 Education & Learning:**
-        - Highlight instructional design and curriculum development
-        - Showcase experience with learning management systems
-        - Include experience with different learning methodologies
-        - Demonstrate understanding of educational technology trends
-        - Show experience with student engagement and assessment
-        """)
-    else:
-        st.info("""
-        **💡 General Career Tips:**
-        - Quantify your achievements with specific numbers and metrics
-        - Highlight leadership and project management experience
-        - Showcase continuous learning and skill development
-        - Include industry-specific certifications and training
-        - Demonstrate problem-solving and critical thinking abilities
-        """)
+    st.info(content['tips'])
     
     # Action buttons
     col1, col2, col3 = st.columns(3)
@@ -1149,6 +717,8 @@ def show_results_page():
         st.button("Share Results", help="Share these results with others")
 
 def show_insights_page():
+    frames = get_insights_frames()
+
     st.markdown('<h1 class="main-header">Market Insights & Trends</h1>', unsafe_allow_html=True)
     
     st.markdown("""
@@ -1161,21 +731,7 @@ def show_insights_page():
         # Salary insights
     st.subheader("💰 Salary Distribution by Experience Level")
     
-    salary_data = pd.DataFrame({
-        'Level': ['Entry (0-2 yrs)', 'Mid (3-5 yrs)', 'Senior (6-8 yrs)', 'Lead (8+ yrs)'],
-        'Data Science': [85000, 125000, 165000, 210000],
-        'Web Development': [75000, 115000, 155000, 190000],
-        'Design': [70000, 100000, 140000, 175000],
-        'Mobile Development': [80000, 120000, 160000, 200000],
-        'Software Engineering': [90000, 130000, 170000, 220000],
-        'Marketing': [65000, 95000, 130000, 160000],
-        'Sales': [70000, 110000, 150000, 200000],
-        'Finance': [75000, 115000, 155000, 200000],
-        'Healthcare': [70000, 100000, 135000, 170000],
-        'Education': [60000, 85000, 115000, 140000]
-    })
-    
-    st.bar_chart(salary_data.set_index('Level'))
+    st.bar_chart(frames['salary'])
     
     # Skill demand analysis
     st.subheader("🔥 Most In-Demand Skills by Domain")
@@ -1184,39 +740,17 @@ def show_insights_page():
     
     with col1:
         # Tech skills
-        tech_skills = pd.DataFrame({
-            'Skill': ['Python', 'JavaScript', 'React', 'SQL', 'Machine Learning', 'AWS', 'Docker', 'Kubernetes'],
-            'Demand Score': [95, 92, 88, 85, 90, 87, 82, 78]
-        }).sort_values('Demand Score', ascending=False)
         st.markdown("**💻 Tech Skills**")
-        st.bar_chart(tech_skills.set_index('Skill'))
+        st.bar_chart(frames['tech_skills'])
     
     with col2:
         # Business skills
-        business_skills = pd.DataFrame({
-            'Skill': ['SEO', 'Google Analytics', 'Sales CRM', 'Financial Modeling', 'Project Management', 'Leadership', 'Communication'],
-            'Demand Score': [85, 80, 75, 88, 82, 90, 95]
-        }).sort_values('Demand Score', ascending=False)
         st.markdown("**📈 Business Skills**")
-        st.bar_chart(business_skills.set_index('Skill'))
+        st.bar_chart(frames['business_skills'])
     
     # Hiring trends
     st.subheader("📈 Hiring Trends (Last 12 Months)")
-    trends_data = pd.DataFrame({
-        'Month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
-        'Data Science': [100, 120, 130, 115, 140, 160, 150, 145, 155, 165, 170, 180],
-        'Web Development': [150, 160, 170, 165, 180, 190, 185, 190, 195, 200, 210, 220],
-        'Design': [80, 90, 95, 100, 110, 120, 115, 120, 125, 130, 135, 140],
-        'Mobile Development': [70, 80, 85, 90, 95, 100, 105, 110, 115, 120, 125, 130],
-        'Software Engineering': [120, 130, 140, 135, 150, 160, 155, 160, 165, 170, 175, 180],
-        'Marketing': [90, 100, 110, 105, 115, 125, 120, 125, 130, 135, 140, 145],
-        'Sales': [110, 120, 130, 125, 135, 145, 140, 145, 150, 155, 160, 165],
-        'Finance': [85, 95, 100, 95, 105, 115, 110, 115, 120, 125, 130, 135],
-        'Healthcare': [60, 70, 75, 80, 85, 90, 95, 100, 105, 110, 115, 120],
-        'Education': [50, 60, 65, 70, 75, 80, 85, 90, 95, 100, 105, 110]
-    })
-    
-    st.line_chart(trends_data.set_index('Month'))
+    st.line_chart(frames['trends'])
     
     # Company insights
     st.subheader("🏢 Top Companies by Domain")
@@ -1283,14 +817,7 @@ def show_insights_page():
     # Regional insights
     st.subheader("🌍 Regional Salary Variations")
     
-    regional_data = pd.DataFrame({
-        'Region': ['San Francisco', 'New York', 'Seattle', 'Austin', 'Boston', 'Los Angeles', 'Chicago', 'Denver'],
-        'Data Science': [180000, 175000, 170000, 160000, 165000, 155000, 150000, 145000],
-        'Web Development': [170000, 165000, 160000, 150000, 155000, 145000, 140000, 135000],
-        'Design': [150000, 145000, 140000, 130000, 135000, 125000, 120000, 115000]
-    })
-    
-    st.bar_chart(regional_data.set_index('Region'))
+    st.bar_chart(frames['regional'])
     
     # Action items
     st.subheader("💡 Actionable Insights")
@@ -0,0 +1,232 @@
+"""
+Headless batch classification of resume files.
+
+Usage:
+    python batch_classify.py resumes/ --output predictions.csv
+    python batch_classify.py manifest.txt --output predictions.parquet --batch-size 512
+    python batch_classify.py uploads/ --cache prediction_cache.sqlite3 --dedupe-index near_duplicates.npz
+"""
+import argparse
+import os
+import sys
+import time
+from importlib.util import find_spec
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from extraction_pool import DEFAULT_MAX_MEMORY_MB, DEFAULT_TIMEOUT, PdfExtractionPool
+from inference import classify_documents
+from metrics import timed, write_metrics_file
+from model_store import load_models, model_version
+from near_duplicates import DEFAULT_THRESHOLD, NearDuplicateIndex
+from pdf_extraction import DEFAULT_MAX_CHARS, DEFAULT_MAX_PAGES
+from prediction_cache import PredictionCache, file_hash
+from text_processing import clean_text
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.txt')
+# pandas writes parquet through either engine
+PARQUET_AVAILABLE = find_spec('pyarrow') is not None or find_spec('fastparquet') is not None
+
+def collect_paths(source):
+    """
+    Return resume paths from a directory (walked recursively) or a manifest file.
+    A manifest is either a CSV with a 'path' column or a plain list, one path per line.
+    """
+    if os.path.isdir(source):
+        paths = []
+        for root, _, files in os.walk(source):
+            for name in sorted(files):
+                if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                    paths.append(os.path.join(root, name))
+        return sorted(paths)
+
+    if source.lower().endswith('.csv'):
+        return pd.read_csv(source)['path'].dropna().astype(str).tolist()
+
+    with open(source, encoding='utf-8') as manifest:
+        return [line.strip() for line in manifest if line.strip()]
+
+def iter_batches(items, batch_size):
+    items = iter(items)
+    while True:
+        batch = list(islice(items, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def empty_rows(paths, errors, label_encoder):
+    prob_columns = [f'prob_{label}' for label in label_encoder.classes_]
+    rows = pd.DataFrame(float('nan'), index=range(len(paths)), columns=prob_columns)
+    rows.insert(0, 'path', paths)
+    rows.insert(1, 'category', None)
+    rows.insert(2, 'confidence', float('nan'))
+    rows.insert(3, 'error', errors)
+    return rows, prob_columns
+
+def collapse_near_duplicates(doc_keys, cleaned, dedupe, predictions, cache=None):
+    """
+    Split a batch into the documents that still need scoring and the ones whose
+    prediction can be copied from a near-duplicate. Returns (to_score, representatives):
+    positions to score, and the representative key of every document. `predictions`
+    maps representative keys scored earlier to (category, confidence, probabilities).
+    """
+    with timed('dedupe'):
+        representatives = dedupe.add_batch(doc_keys, cleaned)
+    to_score, scheduled = [], set()
+    for j, representative in enumerate(representatives):
+        if representative in scheduled or representative in predictions:
+            continue
+        entry = cache.get(representative) if cache is not None else None
+        if entry is not None and entry['category'] is not None:
+            # Scored in an earlier run under the current model
+            predictions[representative] = (entry['category'], entry['confidence'], entry['probabilities'])
+            continue
+        to_score.append(j)
+        scheduled.add(representative)
+    return to_score, representatives
+
+def classify_batch(extracted, tfidf, label_encoder, model, cache=None, keys=None, dedupe=None, predictions=None):
+    """
+    Classify one batch of (path, text, error) tuples, returning a DataFrame with one row per path.
+    Successful predictions are written to `cache` under the file hashes in `keys`. With
+    a NearDuplicateIndex as `dedupe`, only one document per group of near-duplicates is
+    scored and the others reuse its prediction, kept in the `predictions` dict across batches.
+    """
+    paths = [path for path, _, _ in extracted]
+    errors = [error for _, _, error in extracted]
+    readable = [i for i, (_, text, error) in enumerate(extracted) if error is None]
+    texts = [extracted[i][1] for i in readable]
+    rows, prob_columns = empty_rows(paths, errors, label_encoder)
+
+    if readable:
+        with timed('clean'):
+            cleaned = [clean_text(text) for text in texts]
+        if dedupe is None:
+            categories, confidences, probabilities = classify_documents(cleaned, tfidf, label_encoder, model)
+        else:
+            doc_keys = [keys[paths[i]] if keys else paths[i] for i in readable]
+            to_score, representatives = collapse_near_duplicates(doc_keys, cleaned, dedupe, predictions, cache)
+            if to_score:
+                scored = classify_documents([cleaned[j] for j in to_score], tfidf, label_encoder, model)
+                for j, category, confidence, probs in zip(to_score, *scored):
+                    predictions[representatives[j]] = (category, confidence, probs)
+            categories, confidences, probabilities = zip(*(predictions[rep] for rep in representatives))
+            probabilities = np.array(probabilities)
+        rows.loc[readable, 'category'] = categories
+        rows.loc[readable, 'confidence'] = confidences
+        rows.loc[readable, prob_columns] = probabilities
+        if cache is not None:
+            for j, i in enumerate(readable):
+                cache.put(keys[paths[i]], texts[j], cleaned[j], categories[j],
+                          confidences[j], probabilities[j])
+
+    return rows
+
+def cached_rows(paths, entries, label_encoder):
+    """
+    Build result rows for files whose prediction was found in the cache.
+    """
+    rows, prob_columns = empty_rows(paths, [None] * len(paths), label_encoder)
+    rows['category'] = [entry['category'] for entry in entries]
+    rows['confidence'] = [entry['confidence'] for entry in entries]
+    rows[prob_columns] = [entry['probabilities'] for entry in entries]
+    return rows
+
+def write_results(frames, output):
+    results = pd.concat(frames, ignore_index=True)
+    if output.lower().endswith('.parquet'):
+        results.to_parquet(output, index=False)
+    else:
+        results.to_csv(output, index=False)
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Classify a directory or manifest of resumes in batches.")
+    parser.add_argument('source', help="Directory of .pdf/.txt resumes, or a manifest (.csv with a 'path' column, or one path per line)")
+    parser.add_argument('--output', '-o', default='predictions.csv', help="Output file (.csv or .parquet)")
+    parser.add_argument('--batch-size', '-b', type=int, default=256, help="Documents per vectorize/predict call")
+    parser.add_argument('--workers', '-w', type=int, default=None, help="Extraction processes (default: CPU count)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="Per-file extraction timeout in seconds")
+    parser.add_argument('--max-memory-mb', type=int, default=DEFAULT_MAX_MEMORY_MB, help="Address-space cap per extraction worker")
+    parser.add_argument('--max-pages', type=int, default=DEFAULT_MAX_PAGES, help="Only parse the first N pages of each PDF")
+    parser.add_argument('--max-chars', type=int, default=DEFAULT_MAX_CHARS, help="Stop extracting after N characters per file")
+    parser.add_argument('--cache', default=None, help="SQLite prediction cache to reuse results for unchanged files")
+    parser.add_argument('--dedupe', action='store_true', help="Score one resume per group of near-duplicates (MinHash/LSH)")
+    parser.add_argument('--dedupe-index', default=None, help="Load and save the near-duplicate index here across runs (implies --dedupe)")
+    parser.add_argument('--dedupe-threshold', type=float, default=None,
+                        help=f"Estimated Jaccard similarity for near-duplicates (default {DEFAULT_THRESHOLD}); an existing "
+                             "--dedupe-index keeps the threshold it was built with, and a different value here is an error")
+    parser.add_argument('--metrics-file', default=None, help="Write per-stage latency histograms (Prometheus text) here")
+    args = parser.parse_args(argv)
+    # Checked up front so a missing engine doesn't surface only after every file has been scored
+    if args.output.lower().endswith('.parquet') and not PARQUET_AVAILABLE:
+        print("Writing .parquet needs pyarrow (pip install pyarrow); use a .csv output instead", file=sys.stderr)
+        return 1
+
+    tfidf, label_encoder, model, error = load_models()
+    if error:
+        print(f"Error loading models: {error}", file=sys.stderr)
+        print("Please run the training script first to generate the models.", file=sys.stderr)
+        return 1
+
+    paths = collect_paths(args.source)
+    total = len(paths)
+    if not paths:
+        print(f"No resumes found in {args.source}", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    frames = []
+    cache, keys = None, None
+    if args.cache:
+        # Files already seen under the current model skip extraction and scoring entirely
+        cache = PredictionCache(model_version(), args.cache)
+        keys = {path: file_hash(path) for path in paths if os.path.isfile(path)}
+        hits = {path: cache.get(key) for path, key in keys.items()}
+        hits = {path: entry for path, entry in hits.items() if entry and entry['category'] is not None}
+        if hits:
+            frames.append(cached_rows(list(hits), list(hits.values()), label_encoder))
+            print(f"  {len(hits)} resumes served from cache")
+        paths = [path for path in paths if path not in hits]
+
+    dedupe, predictions = None, None
+    if args.dedupe or args.dedupe_index:
+        if args.dedupe_index and os.path.exists(args.dedupe_index):
+            dedupe = NearDuplicateIndex.load(args.dedupe_index)
+            # The LSH bands were laid out for the stored threshold, so it can't be changed per run
+            if args.dedupe_threshold is not None and args.dedupe_threshold != dedupe.threshold:
+                print(f"--dedupe-threshold {args.dedupe_threshold} differs from the threshold {dedupe.threshold} "
+                      f"{args.dedupe_index} was built with; omit it or start a new index", file=sys.stderr)
+                return 1
+        else:
+            dedupe = NearDuplicateIndex(DEFAULT_THRESHOLD if args.dedupe_threshold is None else args.dedupe_threshold)
+        predictions = {}
+
+    print(f"Classifying {len(paths)} resumes in batches of {args.batch_size}...")
+    with PdfExtractionPool(args.workers, args.timeout, args.max_memory_mb,
+                           args.max_pages, args.max_chars) as pool:
+        # Files stream out of the pool as they finish, so one slow PDF never holds up a batch
+        extracted = ((paths[i], text, error) for i, text, error in pool.imap_unordered(paths))
+        for batch in iter_batches(extracted, args.batch_size):
+            frames.append(classify_batch(batch, tfidf, label_encoder, model, cache, keys, dedupe, predictions))
+            done = sum(len(frame) for frame in frames)
+            print(f"  {done}/{total} done")
+
+    results = write_results(frames, args.output)
+    elapsed = time.perf_counter() - start
+    failed = results['error'].notna().sum()
+    print(f"Saved {len(results)} predictions to {args.output} "
+          f"({failed} failed, {len(results) / elapsed:.1f} docs/s)")
+    if dedupe is not None:
+        print(f"  {len(predictions)} distinct resumes scored or reused, {len(dedupe)} in the near-duplicate index")
+        if args.dedupe_index:
+            dedupe.save(args.dedupe_index)
+    if args.metrics_file:
+        write_metrics_file(args.metrics_file)
+        print(f"Stage latency histograms written to {args.metrics_file}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
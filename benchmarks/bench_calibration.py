@@ -0,0 +1,95 @@
+"""
+Accuracy / cost comparison of the two calibrated-SVM layouts trainning.py can produce:
+one calibrated LinearSVC per CV fold (--svm-calibration ensemble) against a single
+LinearSVC calibrated on out-of-fold scores (--svm-calibration single).
+
+Both use the same TF-IDF features and stratified split of Cleaned_Data.csv as
+trainning.py; the liblinear LogisticRegression is included as a reference.
+
+Usage:
+    python benchmarks/bench_calibration.py --data Cleaned_Data.csv
+    python benchmarks/bench_calibration.py --json calibration.json
+"""
+import argparse
+import json
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, log_loss
+from sklearn.model_selection import train_test_split
+from sklearn.svm import LinearSVC
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_utils import percentile_ms
+from text_processing import clean_texts
+
+def bench(name, model, X_train, X_test, y_train, y_test, single_rows):
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    proba = model.predict_proba(X_test)
+    batch_seconds = time.perf_counter() - start
+
+    single = []
+    for row in single_rows:
+        start = time.perf_counter()
+        model.predict_proba(row)
+        single.append(time.perf_counter() - start)
+
+    return {
+        'model': name,
+        'accuracy': accuracy_score(y_test, model.classes_[np.argmax(proba, axis=1)]),
+        'log_loss': log_loss(y_test, proba, labels=model.classes_),
+        'fit_s': fit_seconds,
+        'predict_docs_per_s': X_test.shape[0] / batch_seconds,
+        'single_p50_ms': percentile_ms(single, 50),
+        'single_p99_ms': percentile_ms(single, 99),
+        'pickle_mb': len(pickle.dumps(model)) / 1e6,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--data', default='Cleaned_Data.csv')
+    parser.add_argument('--single-docs', type=int, default=200, help="Documents scored one at a time")
+    parser.add_argument('--json', default=None, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    df = pd.read_csv(args.data).dropna()
+    tfidf = TfidfVectorizer(max_features=5000, ngram_range=(1, 2), min_df=2, max_df=0.85, sublinear_tf=True)
+    X = tfidf.fit_transform(clean_texts(df['Text']))
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, df['Category'].to_numpy(), test_size=0.2, random_state=42, stratify=df['Category']
+    )
+    single_rows = [X_test[i] for i in range(min(args.single_docs, X_test.shape[0]))]
+
+    def svm():
+        return LinearSVC(C=0.5, max_iter=2000, random_state=42, dual=False)
+
+    candidates = [
+        ('svm ensemble (cv=3)', CalibratedClassifierCV(svm(), cv=3, ensemble=True)),
+        ('svm single (cv=3)', CalibratedClassifierCV(svm(), cv=3, ensemble=False)),
+        ('logistic regression', LogisticRegression(C=1.0, solver='liblinear', max_iter=1000, random_state=42)),
+    ]
+    results = []
+    for name, model in candidates:
+        print(f"Benchmarking {name}...")
+        results.append(bench(name, model, X_train, X_test, y_train, y_test, single_rows))
+
+    print()
+    print(pd.DataFrame(results).set_index('model').round(4).to_string())
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Long-document scoring: whole-text classification against chunked windows.
+
+Builds --docs long CVs of --pages pages (--words-per-page words each) by concatenating
+training resumes (Text, cleaned as in training) of one category, then classifies each
+one whole with classify_one and with classify_chunked under both aggregations, with
+and without early exit. For every mode it reports p50/p99 latency, accuracy against
+the category the CV was built from and agreement with the whole-text prediction.
+
+Run from the directory holding the trained model.
+
+Usage:
+    python benchmarks/bench_chunked.py --data Cleaned_Data.csv
+    python benchmarks/bench_chunked.py --pages 40 --docs 200 --window-words 500 --json chunked.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_utils import percentile_ms
+from inference import DEFAULT_EARLY_EXIT_CONFIDENCE, DEFAULT_MAX_WINDOWS, DEFAULT_WINDOW_WORDS, classify_chunked, classify_one
+from model_store import load_models
+from text_processing import clean_texts
+
+def long_documents(data, n, n_words, seed=0):
+    """
+    Return (texts, categories) for n CVs of at least n_words words, each made of
+    randomly drawn resumes of a single category.
+    """
+    rng = np.random.default_rng(seed)
+    by_category = {category: group.tolist() for category, group in data.groupby('Category')['Cleaned']}
+    categories = rng.choice(sorted(by_category), size=n)
+    texts = []
+    for category in categories:
+        resumes = by_category[category]
+        words = []
+        while len(words) < n_words:
+            words.extend(resumes[rng.integers(len(resumes))].split())
+        texts.append(' '.join(words))
+    return texts, categories.tolist()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--data', default='Cleaned_Data.csv', help="Training CSV with Category and Text columns")
+    parser.add_argument('--docs', type=int, default=100, help="Long CVs to classify")
+    parser.add_argument('--pages', type=int, default=40, help="Pages per CV")
+    parser.add_argument('--words-per-page', type=int, default=500, help="Words per page")
+    parser.add_argument('--window-words', type=int, default=DEFAULT_WINDOW_WORDS, help="Words per window")
+    parser.add_argument('--max-windows', type=int, default=DEFAULT_MAX_WINDOWS, help="Leading windows scored at most")
+    parser.add_argument('--early-exit', type=float, default=DEFAULT_EARLY_EXIT_CONFIDENCE,
+                        help="Confidence (%%) at which chunked scoring stops")
+    parser.add_argument('--json', default=None, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    tfidf, label_encoder, model, error = load_models()
+    if error:
+        print(f"Error loading models: {error}", file=sys.stderr)
+        return 1
+    data = pd.read_csv(args.data).dropna(subset=['Category', 'Text'])
+    data['Cleaned'] = clean_texts(data['Text'])
+    texts, truth = long_documents(data, args.docs, args.pages * args.words_per_page)
+
+    modes = {'whole': lambda text: classify_one(text, tfidf, label_encoder, model)}
+    for aggregate in ('mean', 'max'):
+        for early_exit in (args.early_exit, None):
+            name = f"chunked_{aggregate}" + ('' if early_exit is None else '_early_exit')
+            modes[name] = (lambda text, aggregate=aggregate, early_exit=early_exit: classify_chunked(
+                text, tfidf, label_encoder, model, args.window_words, aggregate, early_exit, args.max_windows))
+
+    results = {'docs': args.docs, 'words_per_doc': args.pages * args.words_per_page,
+               'window_words': args.window_words, 'max_windows': args.max_windows, 'modes': {}}
+    whole = None
+    for name, classify in modes.items():
+        classify(texts[0])
+        latencies, predicted = [], []
+        for text in texts:
+            start = time.perf_counter()
+            predicted.append(classify(text)[0])
+            latencies.append(time.perf_counter() - start)
+        whole = predicted if whole is None else whole
+        results['modes'][name] = {
+            'p50_ms': percentile_ms(latencies, 50),
+            'p99_ms': percentile_ms(latencies, 99),
+            'accuracy': float(np.mean([p == t for p, t in zip(predicted, truth)])),
+            'agreement_with_whole': float(np.mean([p == w for p, w in zip(predicted, whole)])),
+        }
+
+    print(f"{args.docs} CVs of {results['words_per_doc']} words, windows of {args.window_words} words "
+          f"(at most {args.max_windows})")
+    print(f"{'mode':<26}{'p50_ms':>10}{'p99_ms':>10}{'accuracy':>10}{'agree':>8}")
+    for name, result in results['modes'].items():
+        print(f"{name:<26}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+              f"{result['accuracy']:>10.3f}{result['agreement_with_whole']:>8.3f}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
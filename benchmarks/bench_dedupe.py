@@ -0,0 +1,157 @@
+"""
+Near-duplicate detection benchmark at ingestion scale.
+
+Builds --docs cleaned resumes: --unique-fraction of them are distinct (--words words
+drawn from a Zipf distribution over the sample resumes' vocabulary plus generated
+words) and the rest are copies of earlier ones with --edits random word
+substitutions, in shuffled order.
+They are streamed through NearDuplicateIndex.add_batch in --batch-size batches, as
+batch_classify.py --dedupe does, and the report covers:
+
+    throughput      documents per second through signatures + LSH lookup/insert
+    recall          copies collapsed onto the document they were made from (or one of its copies)
+    false merges    distinct documents collapsed onto a different one
+    scoring saved   classify_cleaned time for all documents vs only the representatives
+
+Run from the directory holding the trained model.
+
+Usage:
+    python benchmarks/bench_dedupe.py
+    python benchmarks/bench_dedupe.py --docs 100000 --edits 5 --json dedupe.json
+"""
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from inference import classify_cleaned
+from model_store import load_models
+from near_duplicates import DEFAULT_THRESHOLD, NearDuplicateIndex
+from resume_data import sample_resumes
+from text_processing import clean_text
+
+LETTERS = np.array(list('abcdefghijklmnopqrstuvwxyz'))
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def random_word(rng):
+    return ''.join(rng.choice(LETTERS, size=rng.integers(4, 10)))
+
+def vocabulary(size, rng):
+    words = sorted({word for text in sample_resumes.values() for word in clean_text(text).split()})
+    while len(words) < size:
+        words.append(random_word(rng))
+    return np.array(words)
+
+def substitute(words, edits, rng):
+    words = list(words)
+    for _ in range(edits):
+        words[rng.integers(len(words))] = random_word(rng)
+    return words
+
+def synthetic_uploads(n, unique_fraction, edits, n_words, batch_size, seed=0):
+    """
+    Yield batches of (texts, origins): origins[i] is the distinct document text i was
+    copied from. Distinct documents are held as vocabulary ranks and only turned into
+    text one batch at a time, so a million uploads fit in memory.
+    """
+    rng = np.random.default_rng(seed)
+    vocab = vocabulary(20000, rng)
+    n_unique = max(1, int(n * unique_fraction))
+    uniques = (np.minimum(rng.zipf(1.2, size=(n_unique, n_words)), len(vocab)) - 1).astype(np.int32)
+    origins = np.concatenate([np.arange(n_unique), rng.integers(0, n_unique, size=n - n_unique)])
+    rng.shuffle(origins)
+    seen = np.zeros(n_unique, dtype=bool)
+    for offset in range(0, n, batch_size):
+        batch = origins[offset:offset + batch_size]
+        texts = []
+        for origin in batch:
+            words = vocab[uniques[origin]].tolist()
+            if seen[origin]:
+                words = substitute(words, edits, rng)
+            seen[origin] = True
+            texts.append(' '.join(words))
+        yield texts, batch
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--docs', type=int, default=1000000, help="Uploaded resumes to ingest")
+    parser.add_argument('--unique-fraction', type=float, default=0.2, help="Share of distinct resumes")
+    parser.add_argument('--edits', type=int, default=3, help="Word substitutions per near-duplicate copy")
+    parser.add_argument('--words', type=int, default=300, help="Words per resume")
+    parser.add_argument('--batch-size', type=int, default=10000, help="Documents per add_batch call")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="Near-duplicate Jaccard threshold")
+    parser.add_argument('--json', default=None, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    print(f"Ingesting {args.docs} uploads ({args.unique_fraction:.0%} distinct)...")
+    index = NearDuplicateIndex(args.threshold)
+    representatives, origins, sample = [], [], None
+    ingest_seconds = 0.0
+    for texts, batch_origins in synthetic_uploads(args.docs, args.unique_fraction, args.edits, args.words,
+                                                  args.batch_size):
+        # Only add_batch is timed, not generating the synthetic text
+        keys = range(len(origins), len(origins) + len(texts))
+        start = time.perf_counter()
+        representatives.extend(index.add_batch(keys, texts))
+        ingest_seconds += time.perf_counter() - start
+        origins.extend(batch_origins)
+        sample = texts if sample is None else sample
+        if len(origins) % (10 * args.batch_size) == 0:
+            print(f"  {len(origins)} ingested, {len(index)} distinct, {len(origins) / ingest_seconds:.0f} docs/s")
+
+    representatives = np.array(representatives)
+    origins = np.array(origins)
+    is_copy = representatives != np.arange(len(origins))
+    first_of_origin = {}
+    for i, origin in enumerate(origins):
+        first_of_origin.setdefault(origin, i)
+    expected_copy = np.array([first_of_origin[origin] != i for i, origin in enumerate(origins)])
+    correct = origins[representatives] == origins
+    recall = float(np.mean(is_copy[expected_copy] & correct[expected_copy])) if expected_copy.any() else 1.0
+    false_merges = int(np.sum(is_copy & ~correct))
+
+    results = {
+        'docs': args.docs,
+        'distinct_docs': int(len(first_of_origin)),
+        'threshold': args.threshold,
+        'bands': index.bands,
+        'rows': index.rows,
+        'ingest_seconds': ingest_seconds,
+        'ingest_docs_per_s': args.docs / ingest_seconds,
+        'indexed': len(index),
+        'recall': recall,
+        'false_merges': false_merges,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+    tfidf, label_encoder, model, error = load_models()
+    if error is None:
+        start = time.perf_counter()
+        classify_cleaned(sample, tfidf, label_encoder, model)
+        per_doc = (time.perf_counter() - start) / len(sample)
+        results['scoring_all_seconds'] = per_doc * args.docs
+        results['scoring_representatives_seconds'] = per_doc * len(index)
+
+    print(f"ingested {args.docs} docs in {ingest_seconds:.1f}s ({results['ingest_docs_per_s']:.0f} docs/s, "
+          f"LSH {index.bands} bands x {index.rows} rows), peak RSS {results['peak_rss_mb']:.0f} MB")
+    print(f"distinct {results['distinct_docs']}, indexed {len(index)}; recall {recall:.4f}, "
+          f"false merges {false_merges}")
+    if 'scoring_all_seconds' in results:
+        print(f"scoring: {results['scoring_all_seconds']:.1f}s for every upload vs "
+              f"{results['scoring_representatives_seconds']:.1f}s for representatives only")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Cold-start profile: import time and resident memory of a fresh interpreter that
+imports the app (or any other module), as a new Streamlit worker would.
+
+Each run uses `python -X importtime`, so the report also lists the slowest
+imports the module makes and which heavy optional libraries ended up loaded.
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --module service --runs 10 --json import.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ('matplotlib', 'seaborn', 'pandas', 'sklearn', 'scipy', 'PyPDF2', 'pdfplumber', 'joblib')
+
+PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+peak_mb = peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+loaded = [name for name in {heavy!r} if name in sys.modules]
+print('RESULT', elapsed, peak_mb, ','.join(loaded))
+"""
+
+def profile_once(module):
+    code = PROBE.format(module=module, heavy=HEAVY_MODULES)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, os.environ.get('PYTHONPATH', '')]))
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    result = next(line for line in output.stdout.splitlines() if line.startswith('RESULT'))
+    _, elapsed, peak_mb, loaded = result.split(' ', 3)
+
+    # "import time: self [us] | cumulative | imported package", nested two spaces per level;
+    # the direct imports of the module under test sit one level down
+    direct = {}
+    for line in output.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        name = name[1:]
+        if name.startswith('  ') and not name.startswith('    '):
+            direct[name.strip()] = int(cumulative) / 1e6
+    return float(elapsed), float(peak_mb), [name for name in loaded.split(',') if name], direct
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--module', default='app', help="Module to import (default: the Streamlit app)")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters to average over")
+    parser.add_argument('--top', type=int, default=15, help="Slowest direct imports to list")
+    parser.add_argument('--json', default=None, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    runs = [profile_once(args.module) for _ in range(args.runs)]
+    import_s = [elapsed for elapsed, _, _, _ in runs]
+    peak_mb = [peak for _, peak, _, _ in runs]
+    loaded = runs[-1][2]
+    names = set().union(*(top for _, _, _, top in runs))
+    slowest = sorted(
+        ((name, float(np.median([top.get(name, 0.0) for _, _, _, top in runs]))) for name in names),
+        key=lambda item: item[1], reverse=True,
+    )[:args.top]
+
+    results = {
+        'module': args.module,
+        'runs': args.runs,
+        'import_p50_s': float(np.median(import_s)),
+        'import_min_s': float(np.min(import_s)),
+        'peak_rss_mb': float(np.median(peak_mb)),
+        'heavy_modules_loaded': loaded,
+        'slowest_imports_s': dict(slowest),
+    }
+
+    print(f"import {args.module}: p50 {results['import_p50_s'] * 1000:.0f} ms, "
+          f"min {results['import_min_s'] * 1000:.0f} ms, peak RSS {results['peak_rss_mb']:.0f} MB")
+    print(f"heavy modules loaded: {', '.join(loaded) or 'none'}")
+    print(f"slowest imports made by {args.module}:")
+    for name, seconds in slowest:
+        print(f"  {seconds * 1000:8.1f} ms  {name}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
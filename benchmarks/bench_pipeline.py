@@ -0,0 +1,201 @@
+"""
+End-to-end pipeline benchmark: per-stage throughput and p50/p95/p99 latency.
+
+Stages:
+    extract_<backend>_<n>p  PDF text extraction per installed backend, on synthetic
+                            PDFs of n pages built from the sample resumes
+    clean_text              text normalisation of one resume
+    vectorize               tfidf.transform of one cleaned resume
+    predict                 predict_proba of one vectorized resume
+    classify                clean + vectorize + predict through inference.classify_one
+    load_models_cold        model_store.load_models() in a fresh interpreter
+
+Run from the directory holding the trained model. Results are written as JSON so
+runs can be compared across commits; with --baseline the run fails (exit 1) when a
+stage's p50 or p95 is more than --threshold slower than in the baseline file.
+
+Usage:
+    python benchmarks/bench_pipeline.py --json bench.json
+    python benchmarks/bench_pipeline.py --json new.json --baseline bench.json --threshold 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from io import BytesIO
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import model_store
+from inference import classify_one
+from pdf_extraction import PDF_BACKENDS
+from resume_data import sample_resumes
+from text_processing import clean_text
+
+PAGE_COUNTS = (1, 5, 20)
+LINES_PER_PAGE = 50
+
+def _pdf_escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def make_pdf(pages):
+    """
+    Build a minimal PDF (Helvetica text, one content stream per page) from a list of
+    pages, each a list of text lines. Enough for PyPDF2 and pdfplumber to extract.
+    """
+    objects = [b'<< /Type /Catalog /Pages 2 0 R >>', None, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    page_ids = []
+    for lines in pages:
+        ascii_lines = (line.encode('ascii', 'ignore').decode('ascii') for line in lines)
+        text = ''.join(f'({_pdf_escape(line)}) Tj T*\n' for line in ascii_lines)
+        stream = f'BT /F1 10 Tf 12 TL 50 780 Td\n{text}ET'.encode('latin-1')
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+        objects.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % len(objects))
+        page_ids.append(len(objects))
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids).encode('ascii')
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(page_ids))
+
+    out = BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b'%d 0 obj\n%s\nendobj\n' % (number, body))
+    xref = out.tell()
+    out.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b'%010d 00000 n \n' % offset)
+    out.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref))
+    return out.getvalue()
+
+def synthetic_pdf(n_pages):
+    lines = [line for text in sample_resumes.values() for line in text.splitlines() if line.strip()]
+    pages = [[lines[(page * LINES_PER_PAGE + i) % len(lines)] for i in range(LINES_PER_PAGE)]
+             for page in range(n_pages)]
+    return make_pdf(pages)
+
+def summarize(samples, items=None):
+    samples = np.asarray(samples)
+    return {
+        'n': len(samples),
+        'throughput_per_s': (items or len(samples)) / samples.sum(),
+        'p50_ms': float(np.percentile(samples, 50) * 1000),
+        'p95_ms': float(np.percentile(samples, 95) * 1000),
+        'p99_ms': float(np.percentile(samples, 99) * 1000),
+    }
+
+def time_calls(fn, inputs, repeat):
+    # One untimed pass first so one-off costs (imports, caches) don't skew the percentiles
+    for item in inputs:
+        fn(item)
+    samples = []
+    for _ in range(repeat):
+        for item in inputs:
+            start = time.perf_counter()
+            fn(item)
+            samples.append(time.perf_counter() - start)
+    return samples
+
+def cold_load_samples(runs):
+    code = ("import time; t = time.perf_counter(); import model_store; "
+            "error = model_store.load_models()[3]; print(time.perf_counter() - t if error is None else -1)")
+    samples = []
+    for _ in range(runs):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, os.environ.get('PYTHONPATH', '')]))
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, env=env)
+        seconds = float(output.stdout.strip().splitlines()[-1])
+        if seconds < 0:
+            raise RuntimeError("load_models() failed; run the training script first")
+        samples.append(seconds)
+    return samples
+
+def run(repeat, pdf_repeat, cold_runs):
+    stages = {}
+    for n_pages in PAGE_COUNTS:
+        data = synthetic_pdf(n_pages)
+        for name, backend in PDF_BACKENDS.items():
+            samples = time_calls(lambda pdf: '\n'.join(backend(BytesIO(pdf), None)), [data], pdf_repeat)
+            stages[f'extract_{name}_{n_pages}p'] = summarize(samples)
+
+    texts = list(sample_resumes.values())
+    cleaned = [clean_text(text) for text in texts]
+    stages['clean_text'] = summarize(time_calls(clean_text, texts, repeat))
+
+    tfidf, label_encoder, model, error = model_store.load_models()
+    if error:
+        raise RuntimeError(f"error loading models: {error}")
+    stages['vectorize'] = summarize(time_calls(lambda doc: tfidf.transform([doc]), cleaned, repeat))
+    vectors = [tfidf.transform([doc]) for doc in cleaned]
+    stages['predict'] = summarize(time_calls(model.predict_proba, vectors, repeat))
+    stages['classify'] = summarize(time_calls(
+        lambda text: classify_one(clean_text(text), tfidf, label_encoder, model), texts, repeat
+    ))
+    stages['load_models_cold'] = summarize(cold_load_samples(cold_runs))
+    return stages
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def regressions(stages, baseline, threshold):
+    found = []
+    for name, result in stages.items():
+        previous = baseline.get('stages', {}).get(name)
+        if previous is None:
+            continue
+        for metric in ('p50_ms', 'p95_ms'):
+            if result[metric] > previous[metric] * (1 + threshold):
+                found.append(f"{name} {metric}: {previous[metric]:.3f} -> {result[metric]:.3f}")
+    return found
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=50, help="Passes over the sample resumes per text stage")
+    parser.add_argument('--pdf-repeat', type=int, default=10, help="Extractions per synthetic PDF and backend")
+    parser.add_argument('--cold-runs', type=int, default=5, help="Fresh interpreters for load_models_cold")
+    parser.add_argument('--json', default=None, help="Write the results to this file")
+    parser.add_argument('--baseline', default=None, help="Earlier results to compare against")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Allowed slowdown vs the baseline (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    stages = run(args.repeat, args.pdf_repeat, args.cold_runs)
+    results = {
+        'commit': git_commit(),
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'model_version': model_store.model_version(),
+        'stages': stages,
+    }
+
+    print(f"{'stage':<26}{'n':>6}{'per_s':>12}{'p50_ms':>10}{'p95_ms':>10}{'p99_ms':>10}")
+    for name, result in stages.items():
+        print(f"{name:<26}{result['n']:>6}{result['throughput_per_s']:>12.1f}"
+              f"{result['p50_ms']:>10.3f}{result['p95_ms']:>10.3f}{result['p99_ms']:>10.3f}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            found = regressions(stages, json.load(f), args.threshold)
+        if found:
+            print(f"\nRegressions beyond {args.threshold:.0%}:", file=sys.stderr)
+            for line in found:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
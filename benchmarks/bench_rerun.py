@@ -0,0 +1,83 @@
+"""
+Per-rerun CPU cost of the Streamlit app.
+
+Streamlit re-executes app.py on every click, so whatever a render builds is paid on
+every interaction. This reports CPU time per call for:
+    script_rerun       a full rerun of app.py (home page) through streamlit.testing
+    insights_build     building the insights DataFrames from scratch
+    insights_cached    the cached lookup the insights page does instead
+    category_content   the recommendations/skills/tips lookup for every trained category
+
+Run from the directory holding the trained model.
+
+Usage:
+    python benchmarks/bench_rerun.py
+    python benchmarks/bench_rerun.py --reruns 50 --json rerun.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_utils import percentile_ms
+
+def cpu_samples(fn, repeat):
+    fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        samples.append(time.process_time() - start)
+    return samples
+
+def summarize(samples):
+    return {
+        'n': len(samples),
+        'mean_ms': float(np.mean(samples) * 1000),
+        'p50_ms': percentile_ms(samples, 50),
+        'p95_ms': percentile_ms(samples, 95),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--reruns', type=int, default=20, help="Full script reruns to time")
+    parser.add_argument('--repeat', type=int, default=2000, help="Calls per data-layer measurement")
+    parser.add_argument('--json', default=None, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    from streamlit import logger as streamlit_logger
+    from streamlit.testing.v1 import AppTest
+
+    app_test = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=120)
+    results = {'script_rerun': summarize(cpu_samples(app_test.run, args.reruns))}
+
+    # Importing the app outside `streamlit run` executes it once in bare mode
+    streamlit_logger.set_log_level('error')
+    import app
+    import resume_data
+
+    categories = list(app.get_content_index()) + ['Unknown']
+
+    def category_content():
+        for category in categories:
+            app.get_category_content(category)
+
+    results['insights_build'] = summarize(cpu_samples(resume_data.insights_frames, max(args.repeat // 20, 10)))
+    results['insights_cached'] = summarize(cpu_samples(app.get_insights_frames, args.repeat))
+    results['category_content'] = summarize(cpu_samples(category_content, args.repeat))
+
+    print(f"{'measurement':<20}{'n':>6}{'mean_ms':>10}{'p50_ms':>10}{'p95_ms':>10}")
+    for name, result in results.items():
+        print(f"{name:<20}{result['n']:>6}{result['mean_ms']:>10.3f}{result['p50_ms']:>10.3f}{result['p95_ms']:>10.3f}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
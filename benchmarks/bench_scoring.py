@@ -0,0 +1,70 @@
+"""
+Single-document scoring latency: sklearn transform + predict_proba against the
+compiled kernel (inference.classify_one on the resume_model_compiled/ arrays).
+
+Run from the directory holding the trained artifacts (resume_pipeline.joblib and
+resume_model_compiled/). Documents are taken from Cleaned_Data.csv.
+
+Usage:
+    python benchmarks/bench_scoring.py --data Cleaned_Data.csv
+    python benchmarks/bench_scoring.py --docs 1000 --json scoring.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_utils import percentile_ms
+from compiled_model import COMPILED_DIR, load_compiled
+from inference import classify_one
+from model_store import load_pipeline
+from text_processing import clean_texts
+
+def bench(name, docs, tfidf, label_encoder, model):
+    latencies, probabilities = [], []
+    for doc in docs:
+        start = time.perf_counter()
+        _, _, proba = classify_one(doc, tfidf, label_encoder, model)
+        latencies.append(time.perf_counter() - start)
+        probabilities.append(proba)
+    return {
+        'path': name,
+        'p50_ms': percentile_ms(latencies, 50),
+        'p99_ms': percentile_ms(latencies, 99),
+        'docs_per_s': len(docs) / sum(latencies),
+    }, np.array(probabilities)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--data', default='Cleaned_Data.csv')
+    parser.add_argument('--docs', type=int, default=500, help="Documents scored one at a time")
+    parser.add_argument('--json', default=None, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    docs = list(clean_texts(pd.read_csv(args.data).dropna()['Text'])[:args.docs])
+    tfidf, label_encoder, model, _ = load_pipeline()
+    compiled_tfidf, compiled_labels, compiled_model, _ = load_compiled(COMPILED_DIR)
+
+    # Warm up both paths so first-call costs (page faults, regex compilation) are not timed
+    classify_one(docs[0], tfidf, label_encoder, model)
+    classify_one(docs[0], compiled_tfidf, compiled_labels, compiled_model)
+
+    sklearn_result, expected = bench('sklearn', docs, tfidf, label_encoder, model)
+    compiled_result, actual = bench('compiled', docs, compiled_tfidf, compiled_labels, compiled_model)
+    compiled_result['speedup'] = sklearn_result['p50_ms'] / compiled_result['p50_ms']
+    compiled_result['max_proba_diff'] = float(np.abs(expected - actual).max())
+    results = [sklearn_result, compiled_result]
+
+    print(pd.DataFrame(results).set_index('path').to_string())
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""
+Resume search benchmark: index build and incremental add throughput, and top-k
+query latency against a pool of resumes.
+
+The pool is built from the training CSV (Text, cleaned as in training), repeated with a random
+leading cut per copy until it holds --docs resumes, and added in --batch-size
+segments through search_index.ResumeIndex. Queries are job descriptions built from
+the recommended roles and their skills, plus a few corpus resumes. Every query's top-k is checked against a
+brute-force cosine over the full matrix.
+
+Run from the directory holding the trained model.
+
+Usage:
+    python benchmarks/bench_search.py --data Cleaned_Data.csv
+    python benchmarks/bench_search.py --data Cleaned_Data.csv --docs 20000 --top-k 10 --json search.json
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_utils import percentile_ms
+from model_store import load_models, model_version
+from resume_data import JOB_RECOMMENDATIONS
+from search_index import ResumeIndex
+from text_processing import clean_text, clean_texts
+
+def synthetic_pool(docs, n, seed=0):
+    rng = np.random.default_rng(seed)
+    pool = []
+    for i in range(n):
+        words = docs[i % len(docs)].split()
+        pool.append(' '.join(words[rng.integers(0, max(len(words) // 4, 1)):]))
+    return pool
+
+def job_descriptions():
+    return [f"{job['title']} {' '.join(job['skills'])} {' '.join(job['companies'])}"
+            for jobs in JOB_RECOMMENDATIONS.values() for job in jobs]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--data', default='Cleaned_Data.csv', help="Training CSV with a Text column")
+    parser.add_argument('--docs', type=int, default=100000, help="Resumes in the pool")
+    parser.add_argument('--batch-size', type=int, default=5000, help="Resumes per add() call")
+    parser.add_argument('--top-k', type=int, default=50, help="Results per query")
+    parser.add_argument('--resume-queries', type=int, default=20, help="Corpus resumes used as extra queries")
+    parser.add_argument('--repeat', type=int, default=5, help="Passes over the queries")
+    parser.add_argument('--json', default=None, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    tfidf, _, _, error = load_models()
+    if error:
+        print(f"Error loading models: {error}", file=sys.stderr)
+        return 1
+    docs = clean_texts(pd.read_csv(args.data)['Text'].dropna()).tolist()
+    pool = synthetic_pool(docs, args.docs)
+    queries = job_descriptions() + docs[:args.resume_queries]
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = ResumeIndex(tfidf, model_version(), directory)
+        start = time.perf_counter()
+        for offset in range(0, len(pool), args.batch_size):
+            batch = pool[offset:offset + args.batch_size]
+            index.add(range(offset, offset + len(batch)), batch)
+        build_seconds = time.perf_counter() - start
+        segments = index.n_segments
+
+        # Reopen from disk, as a search process would
+        index = ResumeIndex(tfidf, model_version(), directory)
+        vectors = [index.vectorize([clean_text(query)]) for query in queries]
+        for vector in vectors:
+            index.search_vector(vector, args.top_k)
+        search_s = []
+        for _ in range(args.repeat):
+            for vector in vectors:
+                start = time.perf_counter()
+                index.search_vector(vector, args.top_k)
+                search_s.append(time.perf_counter() - start)
+
+        # Brute force over the whole matrix, for correctness and as the baseline to beat
+        X = index.vectorize(pool)
+        brute_s = []
+        mismatches = 0
+        for vector in vectors:
+            start = time.perf_counter()
+            scores = X.dot(vector.T).toarray().ravel()
+            expected = np.sort(scores)[::-1][:args.top_k]
+            brute_s.append(time.perf_counter() - start)
+            got = np.array([score for _, score in index.search_vector(vector, args.top_k)])
+            expected = expected[expected > 0]
+            if len(got) != len(expected) or not np.allclose(got, expected, atol=1e-9):
+                mismatches += 1
+
+        add_s = []
+        extra = synthetic_pool(docs, 20, seed=1)
+        for i, text in enumerate(extra):
+            start = time.perf_counter()
+            index.add([f'extra-{i}'], [text])
+            add_s.append(time.perf_counter() - start)
+
+    results = {
+        'docs': args.docs,
+        'model_version': model_version(),
+        'build_seconds': build_seconds,
+        'build_docs_per_s': args.docs / build_seconds,
+        'segments': segments,
+        'top_k': args.top_k,
+        'queries': len(search_s),
+        'search_p50_ms': percentile_ms(search_s, 50),
+        'search_p95_ms': percentile_ms(search_s, 95),
+        'search_p99_ms': percentile_ms(search_s, 99),
+        'brute_force_p50_ms': percentile_ms(brute_s, 50),
+        'single_add_p50_ms': percentile_ms(add_s, 50),
+        'mismatched_queries': mismatches,
+    }
+
+    print(f"index: {args.docs} resumes in {build_seconds:.1f}s "
+          f"({results['build_docs_per_s']:.0f} docs/s, {segments} segments)")
+    print(f"search top-{args.top_k}: p50 {results['search_p50_ms']:.2f} ms, "
+          f"p95 {results['search_p95_ms']:.2f} ms, p99 {results['search_p99_ms']:.2f} ms "
+          f"(brute force p50 {results['brute_force_p50_ms']:.2f} ms)")
+    print(f"single-resume add: p50 {results['single_add_p50_ms']:.2f} ms")
+    print(f"top-k mismatches vs brute force: {mismatches}/{len(vectors)}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 1 if mismatches else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
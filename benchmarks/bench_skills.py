@@ -0,0 +1,136 @@
+"""
+Skill extraction benchmark: the compiled SkillMatcher against a naive loop of `in`
+checks, as the skill catalog grows.
+
+Documents are --docs resumes of --lines lines drawn at random from the sample resumes.
+The catalog is resume_data.skill_catalog() (suggestions plus job recommendations),
+grown by each of --extra-skills synthetic two- and three-word skills made from the
+same vocabulary, so some of them occur in the text. For each catalog size it reports
+docs/s for:
+
+    naive_in        `skill in text` per skill: presence only, no offsets, no word boundaries
+    find_many       SkillMatcher.find_many over the batch: distinct skills per document
+    finditer        SkillMatcher.finditer: every occurrence with its character offsets
+
+It also reports how many `in` hits per document are substring false positives
+("r" inside every word with an r, "go" inside "Google") and checks the automaton
+against a brute-force token-window scan on the first --check documents.
+
+Usage:
+    python benchmarks/bench_skills.py
+    python benchmarks/bench_skills.py --docs 5000 --extra-skills 0 1000 10000 --json skills.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from resume_data import sample_resumes, skill_catalog
+from skill_matcher import EXACT_CASE_MAX_LENGTH, SkillMatcher, _TOKEN
+
+def synthetic_resumes(n, n_lines, seed=0):
+    rng = np.random.default_rng(seed)
+    lines = [line for text in sample_resumes.values() for line in text.splitlines() if line.strip()]
+    return ['\n'.join(lines[i] for i in rng.integers(0, len(lines), size=n_lines)) for _ in range(n)]
+
+def synthetic_skills(n, seed=0):
+    rng = np.random.default_rng(seed)
+    words = sorted({word for text in sample_resumes.values() for word in text.split() if word.isalpha()})
+    return [' '.join(rng.choice(words, size=rng.integers(2, 4))) for _ in range(n)]
+
+def brute_force(matcher, text):
+    """
+    Every (start token, end token, skill) by comparing every skill against every token
+    window that starts with the skill's first token.
+    """
+    original = _TOKEN.findall(text)
+    lowered = [token.lower() for token in original]
+    positions = {}
+    for i, token in enumerate(lowered):
+        positions.setdefault(token, []).append(i)
+    found = []
+    for skill in matcher.skills:
+        pattern = [token.lower() for token in _TOKEN.findall(skill)]
+        exact = _TOKEN.findall(skill) if len(skill) <= EXACT_CASE_MAX_LENGTH else None
+        for i in positions.get(pattern[0], ()):
+            if lowered[i:i + len(pattern)] == pattern and (exact is None or original[i:i + len(exact)] == exact):
+                found.append((i, i + len(pattern), skill))
+    return sorted(found)
+
+def token_spans(matcher, text):
+    # finditer's character offsets mapped back to token positions, for the brute-force comparison
+    starts, position = {}, 0
+    for i, token in enumerate(_TOKEN.findall(text)):
+        position = text.index(token, position)
+        starts[position] = i
+        position += len(token)
+    return sorted((starts[start], starts[start] + len(_TOKEN.findall(text[start:end])), skill)
+                  for start, end, skill in matcher.finditer(text))
+
+def docs_per_s(fn, docs):
+    start = time.perf_counter()
+    fn(docs)
+    return len(docs) / (time.perf_counter() - start)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--docs', type=int, default=2000, help="Resumes to match")
+    parser.add_argument('--lines', type=int, default=30, help="Lines per resume")
+    parser.add_argument('--extra-skills', type=int, nargs='+', default=[0, 1000, 10000],
+                        help="Synthetic skills added to the catalog, one run per value")
+    parser.add_argument('--check', type=int, default=50, help="Documents checked against a brute-force scan")
+    parser.add_argument('--json', default=None, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    docs = synthetic_resumes(args.docs, args.lines)
+    results = {'docs': args.docs, 'chars_per_doc': float(np.mean([len(doc) for doc in docs])), 'runs': []}
+    for extra in args.extra_skills:
+        catalog = skill_catalog() + synthetic_skills(extra)
+        start = time.perf_counter()
+        matcher = SkillMatcher(catalog)
+        build_ms = (time.perf_counter() - start) * 1000
+        lowered_skills = [skill.lower() for skill in matcher.skills]
+
+        def naive_in(texts):
+            hits = []
+            for text in texts:
+                text = text.lower()
+                hits.append([skill for skill in lowered_skills if skill in text])
+            return hits
+
+        def finditer(texts):
+            return [list(matcher.finditer(text)) for text in texts]
+
+        naive_hits = naive_in(docs)
+        found = matcher.find_many(docs)
+        false_positives = [len(hits) - len(skills) for hits, skills in zip(naive_hits, found)]
+        mismatches = sum(token_spans(matcher, doc) != brute_force(matcher, doc) for doc in docs[:args.check])
+
+        run = {
+            'skills': len(matcher),
+            'build_ms': build_ms,
+            'naive_in_docs_per_s': docs_per_s(naive_in, docs),
+            'find_many_docs_per_s': docs_per_s(matcher.find_many, docs),
+            'finditer_docs_per_s': docs_per_s(finditer, docs),
+            'skills_per_doc': float(np.mean([len(skills) for skills in found])),
+            'naive_in_extra_hits_per_doc': float(np.mean(false_positives)),
+            'brute_force_mismatches': int(mismatches),
+        }
+        results['runs'].append(run)
+        print(f"{run['skills']} skills (built in {build_ms:.1f} ms): naive_in {run['naive_in_docs_per_s']:.0f} docs/s, "
+              f"find_many {run['find_many_docs_per_s']:.0f} docs/s, finditer {run['finditer_docs_per_s']:.0f} docs/s; "
+              f"{run['skills_per_doc']:.1f} skills/doc, `in` adds {run['naive_in_extra_hits_per_doc']:.1f} "
+              f"substring hits/doc; {mismatches}/{min(args.check, len(docs))} brute-force mismatches")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 1 if any(run['brute_force_mismatches'] for run in results['runs']) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
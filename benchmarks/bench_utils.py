@@ -0,0 +1,11 @@
+"""
+Helpers shared by the benchmark scripts, which import this module from their own
+directory (python puts a script's directory on sys.path).
+"""
+import numpy as np
+
+def percentile_ms(samples, q):
+    """
+    The q-th percentile of `samples` (seconds) in milliseconds, NaN when there are none.
+    """
+    return float(np.percentile(samples, q) * 1000) if len(samples) else float('nan')
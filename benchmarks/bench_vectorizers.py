@@ -0,0 +1,97 @@
+"""
+Accuracy / latency comparison of the vocabulary TF-IDF vectorizer and the hashed
+TF-IDF mode (hashing_features.HashedTfidfVectorizer).
+
+Both feature sets are fed to the same LogisticRegression as trainning.py, on the
+same stratified split of Cleaned_Data.csv.
+
+Usage:
+    python benchmarks/bench_vectorizers.py --data Cleaned_Data.csv
+    python benchmarks/bench_vectorizers.py --hash-features 65536 262144 --json vectorizers.json
+"""
+import argparse
+import json
+import os
+import pickle
+import sys
+import time
+
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_utils import percentile_ms
+from hashing_features import HashedTfidfVectorizer
+from text_processing import clean_texts
+
+def bench(name, vectorizer, train_docs, test_docs, y_train, y_test, single_docs):
+    start = time.perf_counter()
+    X_train = vectorizer.fit_transform(train_docs)
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    X_test = vectorizer.transform(test_docs)
+    batch_seconds = time.perf_counter() - start
+
+    single = []
+    for doc in single_docs:
+        start = time.perf_counter()
+        vectorizer.transform([doc])
+        single.append(time.perf_counter() - start)
+
+    model = LogisticRegression(C=1.0, solver='liblinear', max_iter=1000, random_state=42)
+    model.fit(X_train, y_train)
+    accuracy = accuracy_score(y_test, model.predict(X_test))
+
+    return {
+        'vectorizer': name,
+        'accuracy': accuracy,
+        'n_features': X_train.shape[1],
+        'fit_s': fit_seconds,
+        'transform_docs_per_s': len(test_docs) / batch_seconds,
+        'single_p50_ms': percentile_ms(single, 50),
+        'single_p99_ms': percentile_ms(single, 99),
+        'vectorizer_pickle_mb': len(pickle.dumps(vectorizer)) / 1e6,
+        'classifier_pickle_mb': len(pickle.dumps(model)) / 1e6,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--data', default='Cleaned_Data.csv')
+    parser.add_argument('--hash-features', type=int, nargs='+', default=[2 ** 16, 2 ** 18])
+    parser.add_argument('--single-docs', type=int, default=200, help="Documents timed one at a time")
+    parser.add_argument('--json', default=None, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    df = pd.read_csv(args.data).dropna()
+    docs = clean_texts(df['Text'])
+    train_docs, test_docs, y_train, y_test = train_test_split(
+        docs, df['Category'], test_size=0.2, random_state=42, stratify=df['Category']
+    )
+    single_docs = list(test_docs[:args.single_docs])
+
+    candidates = [('tfidf (max_features=5000)', TfidfVectorizer(
+        max_features=5000, ngram_range=(1, 2), min_df=2, max_df=0.85, sublinear_tf=True
+    ))]
+    for n_features in args.hash_features:
+        candidates.append((f'hashing (n_features={n_features})', HashedTfidfVectorizer(
+            n_features=n_features, ngram_range=(1, 2), min_df=2, max_df=0.85, sublinear_tf=True
+        )))
+
+    results = []
+    for name, vectorizer in candidates:
+        print(f"Benchmarking {name}...")
+        results.append(bench(name, vectorizer, train_docs, test_docs, y_train, y_test, single_docs))
+
+    print()
+    print(pd.DataFrame(results).set_index('vectorizer').round(4).to_string())
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
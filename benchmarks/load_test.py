@@ -0,0 +1,121 @@
+"""
+Sustained-throughput load test for service.py.
+
+Opens `--concurrency` keep-alive connections and has each one POST resumes to
+/classify back to back for `--duration` seconds, then reports requests/s and
+latency percentiles. With --target-rps the exit status is 1 when throughput falls
+short or any request failed, so the check can run in CI.
+
+Usage:
+    python service.py --port 8000 &
+    python benchmarks/load_test.py --url http://127.0.0.1:8000 --data Cleaned_Data.csv
+    python benchmarks/load_test.py --concurrency 64 --duration 30 --target-rps 200 --json load.json
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+from bench_utils import percentile_ms
+
+async def _post(reader, writer, host, path, body):
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode('latin-1') + body
+    )
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ', 2)[1])
+    length = 0
+    for line in lines[1:]:
+        if line.lower().startswith('content-length:'):
+            length = int(line.split(':', 1)[1])
+    await reader.readexactly(length)
+    return status
+
+async def _client(host, port, path, bodies, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for body in bodies:
+            if time.perf_counter() >= deadline:
+                break
+            start = time.perf_counter()
+            try:
+                status = await _post(reader, writer, host, path, body)
+            except (ConnectionError, asyncio.IncompleteReadError) as e:
+                errors.append(str(e))
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+                continue
+            if status == 200:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors.append(f'HTTP {status}')
+    finally:
+        writer.close()
+
+async def run(url, texts, concurrency, duration, batch_size):
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    if batch_size > 1:
+        path = '/classify/batch'
+        payloads = [{'texts': texts[i:i + batch_size]} for i in range(0, len(texts), batch_size)]
+    else:
+        path = '/classify'
+        payloads = [{'text': text} for text in texts]
+    bodies = [json.dumps(payload).encode('utf-8') for payload in payloads]
+
+    latencies, errors = [], []
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(
+        _client(host, port, path, itertools.islice(itertools.cycle(bodies), i, None), deadline, latencies, errors)
+        for i in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+    return {
+        'endpoint': path,
+        'concurrency': concurrency,
+        'batch_size': batch_size,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'requests_per_s': len(latencies) / elapsed,
+        'documents_per_s': len(latencies) * batch_size / elapsed,
+        'p50_ms': percentile_ms(latencies, 50),
+        'p95_ms': percentile_ms(latencies, 95),
+        'p99_ms': percentile_ms(latencies, 99),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--data', default='Cleaned_Data.csv', help="CSV whose Text column supplies the resumes")
+    parser.add_argument('--docs', type=int, default=1000, help="Distinct resumes to cycle through")
+    parser.add_argument('--concurrency', '-c', type=int, default=32)
+    parser.add_argument('--duration', '-d', type=float, default=15.0, help="Seconds to keep sending")
+    parser.add_argument('--batch-size', type=int, default=1, help="Documents per request (>1 uses /classify/batch)")
+    parser.add_argument('--target-rps', type=float, default=None, help="Fail unless at least this many requests/s")
+    parser.add_argument('--json', default=None, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    texts = pd.read_csv(args.data)['Text'].dropna().astype(str).head(args.docs).tolist()
+    result = asyncio.run(run(args.url, texts, args.concurrency, args.duration, args.batch_size))
+
+    for name, value in result.items():
+        print(f"{name:>16}: {value:.2f}" if isinstance(value, float) else f"{name:>16}: {value}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+    if args.target_rps is not None and (result['requests_per_s'] < args.target_rps or result['errors']):
+        print(f"FAILED: target {args.target_rps} requests/s with no errors", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,329 @@
+"""
+Flat-array model format for serving.
+
+`export_compiled` turns the fitted TF-IDF vectorizer, label encoder and linear
+classifier into plain .npy files: a feature-major weight matrix, intercepts,
+the IDF vector, calibration parameters and a hash-sorted vocabulary index.
+`load_compiled` memory-maps them read-only, so every worker process on a box
+shares one physical copy from the page cache and startup does no unpickling.
+
+The loaded objects are drop-in stand-ins for the sklearn ones used by
+inference.classify_cleaned: `vectorizer.transform`, `classifier.predict_proba`
+/ `classifier.classes_` and `labels.classes_` / `labels.inverse_transform`.
+"""
+import json
+import os
+import re
+import zlib
+from collections import Counter
+from itertools import repeat
+
+import numpy as np
+from scipy import sparse
+
+COMPILED_DIR = 'resume_model_compiled'
+COMPILED_FORMAT_VERSION = 2
+
+_ARRAYS = (
+    'weights', 'intercepts', 'idf', 'vocab_hash', 'vocab_index', 'vocab_offsets', 'vocab_terms',
+    'calibration_a', 'calibration_b', 'calibration_x', 'calibration_y', 'calibration_offsets',
+)
+# Only the large arrays are memory-mapped; the calibration arrays are tiny (and possibly empty)
+_MAPPED = ('weights', 'idf', 'vocab_hash', 'vocab_index', 'vocab_offsets', 'vocab_terms')
+
+def _term_hash(term_bytes):
+    return zlib.crc32(term_bytes)
+
+def _linear_parts(model):
+    """
+    Return (coef, intercept, mode, calibration) for a supported classifier.
+    coef has one row per output column; for calibrated models the columns of all
+    cross-validation folds are stacked, fold after fold, and `calibration` holds the
+    per-column sigmoid parameters or isotonic lookup tables in the same order.
+    """
+    calibration = {
+        'calibration_a': [], 'calibration_b': [], 'calibration_x': [], 'calibration_y': [],
+    }
+    if not hasattr(model, 'calibrated_classifiers_'):
+        multi_class = getattr(model, 'multi_class', 'auto')
+        if multi_class == 'ovr' or getattr(model, 'solver', None) == 'liblinear':
+            mode = 'ovr'
+        else:
+            mode = 'softmax'
+        intercept = np.broadcast_to(model.intercept_, len(model.coef_))
+        return model.coef_, intercept, mode, calibration
+
+    coefs, intercepts = [], []
+    mode = 'sigmoid' if model.method == 'sigmoid' else 'isotonic'
+    for calibrated in model.calibrated_classifiers_:
+        estimator = getattr(calibrated, 'estimator', None) or calibrated.base_estimator
+        if len(calibrated.calibrators) != len(model.classes_):
+            raise ValueError("every calibration fold must see every class")
+        for calibrator in calibrated.calibrators:
+            if mode == 'sigmoid':
+                calibration['calibration_a'].append(calibrator.a_)
+                calibration['calibration_b'].append(calibrator.b_)
+            else:
+                calibration['calibration_x'].append(calibrator.X_thresholds_)
+                calibration['calibration_y'].append(calibrator.y_thresholds_)
+        coefs.append(estimator.coef_)
+        intercepts.append(np.broadcast_to(estimator.intercept_, len(estimator.coef_)))
+    return np.vstack(coefs), np.concatenate(intercepts), mode, calibration
+
+def export_compiled(tfidf, label_encoder, model, directory=COMPILED_DIR, source_sha256=None):
+    """
+    Write the flat-array form of a fitted vectorizer + linear classifier to `directory`.
+    """
+    if not hasattr(tfidf, 'vocabulary_'):
+        raise ValueError("hashed features have no vocabulary to compile")
+    if (tfidf.analyzer != 'word' or tfidf.stop_words is not None or tfidf.strip_accents is not None
+            or tfidf.preprocessor is not None or tfidf.tokenizer is not None):
+        raise ValueError("only plain word-analyzer vectorizers can be compiled")
+    if len(model.classes_) < 3:
+        raise ValueError("compiled models need at least three classes")
+
+    coef, intercept, mode, calibration = _linear_parts(model)
+    # Isotonic tables differ in length, so they are stored concatenated with offsets
+    table_sizes = [len(x) for x in calibration['calibration_x']]
+
+    # Vocabulary as parallel arrays sorted by term hash; the loader builds its term dict from them
+    terms = [(term.encode('utf-8'), index) for term, index in tfidf.vocabulary_.items()]
+    terms.sort(key=lambda item: _term_hash(item[0]))
+    term_bytes = [term for term, _ in terms]
+    arrays = {
+        'weights': np.ascontiguousarray(coef.T, dtype=np.float64),
+        'intercepts': np.asarray(intercept, dtype=np.float64),
+        'idf': np.asarray(tfidf.idf_, dtype=np.float64),
+        'vocab_hash': np.array([_term_hash(term) for term in term_bytes], dtype=np.uint32),
+        'vocab_index': np.array([index for _, index in terms], dtype=np.int32),
+        'vocab_offsets': np.concatenate([[0], np.cumsum([len(term) for term in term_bytes])]).astype(np.int64),
+        'vocab_terms': np.frombuffer(b''.join(term_bytes), dtype=np.uint8),
+        'calibration_a': np.asarray(calibration['calibration_a'], dtype=np.float64),
+        'calibration_b': np.asarray(calibration['calibration_b'], dtype=np.float64),
+        'calibration_x': np.concatenate([np.zeros(0)] + calibration['calibration_x']).astype(np.float64),
+        'calibration_y': np.concatenate([np.zeros(0)] + calibration['calibration_y']).astype(np.float64),
+        'calibration_offsets': np.concatenate([[0], np.cumsum(table_sizes, dtype=np.int64)]).astype(np.int64),
+    }
+
+    os.makedirs(directory, exist_ok=True)
+    for name in _ARRAYS:
+        np.save(os.path.join(directory, f'{name}.npy'), arrays[name])
+
+    meta = {
+        'format_version': COMPILED_FORMAT_VERSION,
+        'source_sha256': source_sha256,
+        'mode': mode,
+        'classes': [str(label) for label in label_encoder.classes_],
+        'n_features': len(tfidf.vocabulary_),
+        'token_pattern': tfidf.token_pattern,
+        'ngram_range': list(tfidf.ngram_range),
+        'lowercase': tfidf.lowercase,
+        'binary': tfidf.binary,
+        'sublinear_tf': tfidf.sublinear_tf,
+        'norm': tfidf.norm,
+        'use_idf': tfidf.use_idf,
+    }
+    with open(os.path.join(directory, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+class CompiledVectorizer:
+    def __init__(self, meta, arrays):
+        self._pattern = re.compile(meta['token_pattern'])
+        self._ngram_range = tuple(meta['ngram_range'])
+        self._lowercase = meta['lowercase']
+        self._binary = meta['binary']
+        self._sublinear_tf = meta['sublinear_tf']
+        self._norm = meta['norm']
+        self._idf = arrays['idf'] if meta['use_idf'] else None
+        # Term -> feature index, built once from the mapped vocabulary arrays (about 2 ms for
+        # 5000 terms) so each term of a document costs one dict lookup in C, not a hash, a
+        # search and a byte comparison in Python
+        terms = arrays['vocab_terms'].tobytes()
+        offsets = arrays['vocab_offsets'].tolist()
+        self._vocabulary = {
+            terms[start:end].decode('utf-8'): index
+            for start, end, index in zip(offsets, offsets[1:], arrays['vocab_index'].tolist())
+        }
+        self.n_features = meta['n_features']
+
+    def _ngrams(self, doc):
+        # Same tokenization and n-gram expansion as sklearn's word analyzer
+        tokens = self._pattern.findall(doc.lower() if self._lowercase else doc)
+        min_n, max_n = self._ngram_range
+        if max_n == 1:
+            return tokens
+        grams = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), min(max_n, len(tokens)) + 1):
+            grams.extend(map(' '.join, zip(*(tokens[k:] for k in range(n)))))
+        return grams
+
+    def _lookup(self, terms):
+        """
+        Map a list of distinct terms to feature indices (-1 for out-of-vocabulary).
+        """
+        return np.fromiter(map(self._vocabulary.get, terms, repeat(-1)), dtype=np.int64, count=len(terms))
+
+    def transform_one(self, doc):
+        """
+        Return (feature indices, tf-idf values) for a single document.
+        """
+        counts = Counter(self._ngrams(doc))
+        return self._weigh(self._lookup(list(counts)), counts)
+
+    def _weigh(self, features, counts):
+        """
+        (feature indices, tf-idf values) of one document from its term counts and the
+        feature index of each term, in the same order (-1 for out-of-vocabulary).
+        """
+        known = features >= 0
+        indices = features[known]
+        values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))[known]
+
+        if self._binary:
+            values[:] = 1.0
+        elif self._sublinear_tf:
+            values = np.log(values) + 1.0
+        if self._idf is not None:
+            values = values * self._idf[indices]
+        if self._norm == 'l2':
+            length = np.sqrt(np.dot(values, values))
+            if length > 0:
+                values = values / length
+        elif self._norm == 'l1':
+            length = np.abs(values).sum()
+            if length > 0:
+                values = values / length
+        return indices, values
+
+    def transform(self, docs):
+        # Terms shared between documents (e.g. the windows of one long CV) are looked up once
+        counts = [Counter(self._ngrams(doc)) for doc in docs]
+        terms = {}
+        for doc_counts in counts:
+            for term in doc_counts:
+                terms.setdefault(term, len(terms))
+        features = self._lookup(list(terms))
+
+        indptr, indices, data = [0], [], []
+        for doc_counts in counts:
+            doc_features = features[np.fromiter(map(terms.__getitem__, doc_counts), dtype=np.int64,
+                                                count=len(doc_counts))]
+            doc_indices, doc_values = self._weigh(doc_features, doc_counts)
+            indices.append(doc_indices)
+            data.append(doc_values)
+            indptr.append(indptr[-1] + len(doc_indices))
+        return sparse.csr_matrix(
+            (np.concatenate(data) if data else np.zeros(0),
+             np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64),
+             np.array(indptr)),
+            shape=(len(indptr) - 1, self.n_features),
+        )
+
+def _sigmoid(x):
+    with np.errstate(over='ignore'):
+        return 1.0 / (1.0 + np.exp(-x))
+
+class CompiledClassifier:
+    def __init__(self, meta, arrays):
+        self._mode = meta['mode']
+        self._weights = arrays['weights']
+        self._intercepts = arrays['intercepts']
+        self._calibration_a = arrays['calibration_a']
+        self._calibration_b = arrays['calibration_b']
+        offsets = arrays['calibration_offsets']
+        self._isotonic_tables = [
+            (arrays['calibration_x'][start:end], arrays['calibration_y'][start:end])
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+        self.classes_ = np.arange(len(meta['classes']))
+        self.n_features_in_ = meta['n_features']
+
+    def decision_function(self, X):
+        return np.asarray(X @ self._weights) + self._intercepts
+
+    def predict_proba(self, X):
+        return self._probabilities(self.decision_function(X))
+
+    def predict_proba_one(self, indices, values):
+        """
+        Probabilities for one document given its sparse (indices, values) features.
+        Gathers only the weight rows of the features present, skipping sparse-matrix setup.
+        """
+        scores = values @ self._weights[indices] + self._intercepts
+        return self._probabilities(scores[np.newaxis, :])[0]
+
+    def _probabilities(self, scores):
+        n_classes = len(self.classes_)
+
+        if self._mode == 'softmax':
+            scores = scores - scores.max(axis=1, keepdims=True)
+            proba = np.exp(scores)
+            return proba / proba.sum(axis=1, keepdims=True)
+
+        if self._mode == 'ovr':
+            proba = _sigmoid(scores)
+            return proba / proba.sum(axis=1, keepdims=True)
+
+        # Calibrated ensemble: calibrate and normalise each fold, then average the folds
+        if self._mode == 'sigmoid':
+            proba = _sigmoid(-(self._calibration_a * scores + self._calibration_b))
+        else:
+            proba = np.column_stack([
+                np.interp(scores[:, column], x, y) for column, (x, y) in enumerate(self._isotonic_tables)
+            ])
+        proba = proba.reshape(len(scores), -1, n_classes)
+        denominator = proba.sum(axis=2, keepdims=True)
+        proba = np.divide(proba, denominator, out=np.full_like(proba, 1.0 / n_classes),
+                          where=denominator != 0)
+        proba[(1.0 < proba) & (proba <= 1.0 + 1e-5)] = 1.0
+        return proba.mean(axis=1)
+
+    def predict(self, X):
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+class CompiledLabels:
+    def __init__(self, meta):
+        self.classes_ = np.array(meta['classes'], dtype=object)
+
+    def inverse_transform(self, encoded):
+        return self.classes_[np.asarray(encoded)]
+
+def read_meta(directory=COMPILED_DIR):
+    with open(os.path.join(directory, 'meta.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+def load_compiled(directory=COMPILED_DIR):
+    """
+    Memory-map a compiled model read-only. Returns (vectorizer, labels, classifier, meta).
+    """
+    meta = read_meta(directory)
+    if meta.get('format_version') != COMPILED_FORMAT_VERSION:
+        raise ValueError(f"unsupported compiled model format {meta.get('format_version')}")
+    # Mapped files are used through plain ndarray views: same pages, but indexing skips
+    # np.memmap's Python-level __getitem__ on every idf/weight gather
+    arrays = {
+        name: np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r' if name in _MAPPED else None).view(np.ndarray)
+        for name in _ARRAYS
+    }
+    if arrays['weights'].shape[0] != meta['n_features'] or len(arrays['idf']) != meta['n_features']:
+        raise ValueError("compiled weights do not match the vocabulary size")
+    return CompiledVectorizer(meta, arrays), CompiledLabels(meta), CompiledClassifier(meta, arrays), meta
+
+def verify_compiled(tfidf, model, docs, directory=COMPILED_DIR, atol=1e-9):
+    """
+    Check a compiled model against the sklearn objects it was exported from on `docs`
+    (batch and single-document paths). Returns the largest absolute probability
+    difference; raises ValueError if it exceeds `atol` or any prediction differs.
+    """
+    vectorizer, _, classifier, _ = load_compiled(directory)
+    expected = model.predict_proba(tfidf.transform(docs))
+    batch = classifier.predict_proba(vectorizer.transform(docs))
+    single = np.array([classifier.predict_proba_one(*vectorizer.transform_one(doc)) for doc in docs])
+
+    max_diff = max(np.abs(expected - batch).max(), np.abs(expected - single).max())
+    if max_diff > atol:
+        raise ValueError(f"compiled probabilities differ from sklearn by up to {max_diff:.3g}")
+    if (np.argmax(expected, axis=1) != np.argmax(single, axis=1)).any():
+        raise ValueError("compiled model predicts a different class than sklearn")
+    return max_diff
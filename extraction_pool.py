@@ -0,0 +1,176 @@
+"""
+Process pool for PDF text extraction.
+
+Every file is parsed in a separate worker process with a hard wall-clock timeout
+and an address-space cap, so a pathological or malicious PDF only costs its own
+worker (which is killed and replaced) instead of stalling the caller.
+"""
+import multiprocessing as mp
+import os
+import threading
+import time
+from collections import deque
+from io import BytesIO
+from multiprocessing.connection import wait
+
+try:
+    import resource
+except ImportError:  # Windows has no setrlimit; workers run without a memory cap
+    resource = None
+
+from metrics import STAGE_SECONDS
+from pdf_extraction import (
+    DEFAULT_MAX_CHARS, DEFAULT_MAX_PAGES, extract_text_from_file, extract_text_from_pdf,
+)
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_MAX_MEMORY_MB = 1024
+
+def _limit_memory(max_memory_mb):
+    if resource is None or not max_memory_mb:
+        return
+    limit = max_memory_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):
+        pass
+
+def _extract(source, max_pages, max_chars):
+    # Paths are read by the worker itself; raw bytes (e.g. Streamlit uploads) are parsed in memory
+    if isinstance(source, (bytes, bytearray)):
+        return extract_text_from_pdf(BytesIO(source), max_pages, max_chars)
+    return extract_text_from_file(source, max_pages, max_chars)
+
+def _worker_main(conn, max_memory_mb, max_pages, max_chars):
+    _limit_memory(max_memory_mb)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        task_id, source = task
+        try:
+            text = _extract(source, max_pages, max_chars)
+            error = None if text and text.strip() else 'no text extracted'
+        except MemoryError:
+            text, error = None, 'memory limit exceeded'
+        except Exception as e:
+            text, error = None, str(e)
+        conn.send((task_id, text, error))
+
+class PdfExtractionPool:
+    """
+    Pool of extraction worker processes.
+
+    `imap_unordered(sources)` takes file paths and/or raw PDF bytes and yields
+    (index, text, error) tuples as soon as each file finishes, where index is the
+    position of the source in the input. Files that exceed `timeout` seconds or
+    crash their worker are reported with an error and the worker is replaced.
+    Only the first `max_pages` pages / `max_chars` characters of each file are parsed.
+    """
+
+    def __init__(self, workers=None, timeout=DEFAULT_TIMEOUT, max_memory_mb=DEFAULT_MAX_MEMORY_MB,
+                 max_pages=DEFAULT_MAX_PAGES, max_chars=DEFAULT_MAX_CHARS):
+        self.timeout = timeout
+        self.max_memory_mb = max_memory_mb
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self._context = mp.get_context('spawn')
+        self._lock = threading.Lock()
+        self._workers = [self._start_worker() for _ in range(workers or os.cpu_count() or 1)]
+
+    def _start_worker(self):
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main, args=(child_conn, self.max_memory_mb, self.max_pages, self.max_chars),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    def _replace_worker(self, slot):
+        process, conn = self._workers[slot]
+        process.kill()
+        process.join()
+        conn.close()
+        self._workers[slot] = self._start_worker()
+
+    def _receive(self, slot, running):
+        task_id, _, started = running.pop(slot)
+        # Wall time seen by the caller, including the round trip to the worker
+        STAGE_SECONDS.observe(time.monotonic() - started, 'extract')
+        try:
+            _, text, error = self._workers[slot][1].recv()
+        except (EOFError, OSError):
+            text, error = None, 'extraction worker crashed'
+            self._replace_worker(slot)
+        return task_id, text, error
+
+    def imap_unordered(self, sources):
+        with self._lock:
+            pending = deque(enumerate(sources))
+            running = {}  # worker slot -> (task index, deadline, start time)
+            try:
+                while pending or running:
+                    for slot in range(len(self._workers)):
+                        if slot not in running and pending:
+                            task_id, source = pending.popleft()
+                            self._workers[slot][1].send((task_id, source))
+                            started = time.monotonic()
+                            running[slot] = (task_id, started + self.timeout, started)
+
+                    next_deadline = min(deadline for _, deadline, _ in running.values())
+                    conns = {self._workers[slot][1]: slot for slot in running}
+                    # The caller may have spent a while between our yields, so collect every
+                    # result that is already waiting before any deadline is enforced
+                    ready = wait(list(conns), timeout=max(0.0, next_deadline - time.monotonic()))
+                    finished = [self._receive(conns[conn], running) for conn in ready]
+
+                    now = time.monotonic()
+                    for slot, (task_id, deadline, started) in list(running.items()):
+                        if deadline > now:
+                            continue
+                        if self._workers[slot][1].poll(0):
+                            # Finished just before the deadline check, so not a timeout
+                            finished.append(self._receive(slot, running))
+                            continue
+                        del running[slot]
+                        STAGE_SECONDS.observe(now - started, 'extract')
+                        self._replace_worker(slot)
+                        finished.append((task_id, None, f'timed out after {self.timeout}s'))
+
+                    # Only yield once no worker is waiting on a deadline check
+                    yield from finished
+            finally:
+                # Workers still busy on an abandoned iteration would hand stale results to the next caller
+                for slot in list(running):
+                    self._replace_worker(slot)
+
+    def extract(self, source):
+        """
+        Extract a single file or PDF byte string, returning (text, error).
+        """
+        (_, text, error), = self.imap_unordered([source])
+        return text, error
+
+    def close(self):
+        for process, conn in self._workers:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process, conn in self._workers:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.kill()
+            conn.close()
+        self._workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
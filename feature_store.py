@@ -0,0 +1,91 @@
+"""
+On-disk cache of the training features, so reruns of trainning.py that only change
+classifier settings skip reading, cleaning and vectorizing the corpus.
+
+Two kinds of entries live under one directory:
+
+- the cleaned corpus (Category + Cleaned_Text), keyed by the SHA-256 of the CSV and
+  the cleaner fingerprint;
+- a fitted vectorizer plus its CSR feature matrix, keyed by the corpus key, the
+  vectorizer's class and parameters, and the scikit-learn version.
+
+Entries are written to a temporary directory and renamed into place, so an
+interrupted run never leaves a half-written entry behind. Delete the directory to
+reclaim the space.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import joblib
+import pandas as pd
+import sklearn
+
+from model_selection import load_csr, save_csr
+from prediction_cache import file_hash
+from text_processing import cleaner_fingerprint
+
+DEFAULT_FEATURE_STORE_DIR = 'feature_store'
+
+def _key(*parts):
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=repr).encode('utf-8')).hexdigest()[:24]
+
+def vectorizer_params(vectorizer):
+    """
+    Constructor parameters of an unfitted vectorizer, for use in a cache key.
+    """
+    if hasattr(vectorizer, 'get_params'):
+        return vectorizer.get_params()
+    return {name: value for name, value in vars(vectorizer).items()
+            if not name.startswith('_') and not name.endswith('_')}
+
+class FeatureStore:
+    def __init__(self, directory=DEFAULT_FEATURE_STORE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, kind, key):
+        return os.path.join(self.directory, f'{kind}-{key}')
+
+    def _publish(self, build_dir, path):
+        try:
+            os.replace(build_dir, path)
+        except OSError:
+            # Another run published the same entry first; both hold the same content
+            shutil.rmtree(build_dir, ignore_errors=True)
+
+    def cleaned_corpus(self, csv_path, build):
+        """
+        Return (df, corpus_key). `build(csv_path)` must return a DataFrame with Category
+        and Cleaned_Text columns; it only runs when no entry exists for this CSV content.
+        """
+        corpus_key = _key('corpus', file_hash(csv_path), cleaner_fingerprint())
+        path = self._path('corpus', corpus_key)
+        if os.path.isdir(path):
+            return pd.read_pickle(os.path.join(path, 'corpus.pkl')), corpus_key
+
+        df = build(csv_path)[['Category', 'Cleaned_Text']]
+        build_dir = tempfile.mkdtemp(prefix='.corpus-', dir=self.directory)
+        df.to_pickle(os.path.join(build_dir, 'corpus.pkl'))
+        self._publish(build_dir, path)
+        return df, corpus_key
+
+    def features(self, corpus_key, vectorizer, docs):
+        """
+        Return (fitted vectorizer, X) for `docs`, fitting `vectorizer` only on a cache miss.
+        X is memory-mapped when it comes from the store.
+        """
+        key = _key('features', corpus_key, type(vectorizer).__name__, vectorizer_params(vectorizer),
+                   sklearn.__version__)
+        path = self._path('features', key)
+        if os.path.isdir(path):
+            return joblib.load(os.path.join(path, 'vectorizer.joblib')), load_csr(path)
+
+        X = vectorizer.fit_transform(docs)
+        build_dir = tempfile.mkdtemp(prefix='.features-', dir=self.directory)
+        joblib.dump(vectorizer, os.path.join(build_dir, 'vectorizer.joblib'))
+        save_csr(X, build_dir)
+        self._publish(build_dir, path)
+        return vectorizer, X
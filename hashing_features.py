@@ -0,0 +1,92 @@
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+DEFAULT_N_FEATURES = 2 ** 18
+
+class HashedTfidfVectorizer:
+    """
+    TF-IDF over hashed word n-grams: HashingVectorizer counts re-weighted by a stored IDF array.
+
+    There is no vocabulary dict, so memory is fixed by n_features whatever the corpus
+    size. Document frequencies can be accumulated chunk by chunk with partial_fit, and
+    shards fitted in separate processes can be combined with merge(). The weighting
+    matches TfidfVectorizer (smooth idf, optional sublinear tf, l2 norm); min_df / max_df
+    zero out the IDF of hashed features instead of pruning a vocabulary.
+    """
+
+    def __init__(self, n_features=DEFAULT_N_FEATURES, ngram_range=(1, 2), min_df=1, max_df=1.0,
+                 sublinear_tf=False):
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+        self.min_df = min_df
+        self.max_df = max_df
+        self.sublinear_tf = sublinear_tf
+        self.n_docs_ = 0
+        self.document_frequency_ = np.zeros(n_features, dtype=np.int64)
+        self._idf = None
+
+    @property
+    def hasher(self):
+        return HashingVectorizer(
+            n_features=self.n_features, ngram_range=self.ngram_range,
+            alternate_sign=False, norm=None, dtype=np.float64,
+        )
+
+    def _accumulate(self, counts):
+        self.document_frequency_ += np.bincount(counts.indices, minlength=self.n_features)
+        self.n_docs_ += counts.shape[0]
+        self._idf = None
+
+    def partial_fit(self, docs):
+        self._accumulate(self.hasher.transform(docs))
+        return self
+
+    def fit(self, docs):
+        self.n_docs_ = 0
+        self.document_frequency_[:] = 0
+        return self.partial_fit(docs)
+
+    def fit_transform(self, docs):
+        counts = self.hasher.transform(docs)
+        self.n_docs_ = 0
+        self.document_frequency_[:] = 0
+        self._accumulate(counts)
+        return self._weight(counts)
+
+    def merge(self, other):
+        """
+        Fold in the document frequencies of a shard fitted elsewhere.
+        """
+        if other.n_features != self.n_features or tuple(other.ngram_range) != tuple(self.ngram_range):
+            raise ValueError("can only merge vectorizers with the same hashing configuration")
+        self.document_frequency_ += other.document_frequency_
+        self.n_docs_ += other.n_docs_
+        self._idf = None
+        return self
+
+    @property
+    def idf_(self):
+        if self._idf is None:
+            df = self.document_frequency_
+            idf = np.log((1 + self.n_docs_) / (1 + df)) + 1
+            max_df = self.max_df if isinstance(self.max_df, int) else self.max_df * self.n_docs_
+            idf[(df < self.min_df) | (df > max_df)] = 0.0
+            self._idf = idf
+        return self._idf
+
+    def _weight(self, counts):
+        if self.sublinear_tf:
+            np.log(counts.data, counts.data)
+            counts.data += 1
+        counts.data *= self.idf_[counts.indices]
+        counts.eliminate_zeros()
+        return normalize(counts, norm='l2', copy=False)
+
+    def transform(self, docs):
+        return self._weight(self.hasher.transform(docs))
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_idf'] = None
+        return state
@@ -0,0 +1,147 @@
+import numpy as np
+
+from metrics import timed
+from text_processing import clean_text
+
+# Every function takes an optional `timings` dict that receives the seconds spent per stage
+# (clean / vectorize / predict); the stages are also recorded in metrics.STAGE_SECONDS.
+
+# Long documents are scored as fixed-size word windows (about two pages each). Only the
+# first MAX_WINDOWS windows are ever read, so the cost of a 40-page CV is bounded.
+DEFAULT_WINDOW_WORDS = 1000
+DEFAULT_MAX_WINDOWS = 8
+DEFAULT_WINDOWS_PER_PASS = 4
+DEFAULT_EARLY_EXIT_CONFIDENCE = 90.0
+AGGREGATIONS = ('mean', 'max')
+
+def classify_cleaned(cleaned, tfidf, label_encoder, model, timings=None):
+    """
+    Classify a batch of already-cleaned texts with one transform and one predict_proba call.
+    Returns (categories, confidences, probabilities) where probabilities is an
+    (n_documents, n_classes) array ordered like label_encoder.classes_.
+    """
+    with timed('vectorize', timings):
+        text_vectors = tfidf.transform(cleaned)
+    with timed('predict', timings):
+        probabilities = model.predict_proba(text_vectors)
+
+    # argmax of predict_proba is what predict() returns for both LR and the calibrated SVM
+    best = np.argmax(probabilities, axis=1)
+    categories = label_encoder.inverse_transform(model.classes_[best])
+    confidences = probabilities[np.arange(len(best)), best] * 100
+    return categories, confidences, probabilities
+
+def classify_one(cleaned, tfidf, label_encoder, model, timings=None):
+    """
+    Classify a single cleaned text. Returns (category, confidence, probabilities).
+    With a compiled model only the weight rows of the features present in the text are
+    touched; otherwise this is one transform and one predict_proba call.
+    """
+    if hasattr(model, 'predict_proba_one'):
+        with timed('vectorize', timings):
+            features = tfidf.transform_one(cleaned)
+        with timed('predict', timings):
+            probabilities = model.predict_proba_one(*features)
+    else:
+        with timed('vectorize', timings):
+            features = tfidf.transform([cleaned])
+        with timed('predict', timings):
+            probabilities = model.predict_proba(features)[0]
+    best = int(np.argmax(probabilities))
+    category = label_encoder.inverse_transform(model.classes_[[best]])[0]
+    return category, probabilities[best] * 100, probabilities
+
+def classify_rows(cleaned, tfidf, label_encoder, model, timings=None):
+    """
+    Classify a batch of cleaned texts into one (category, confidence, probabilities)
+    tuple per text, e.g. for MicroBatcher. A batch of one takes the classify_one path.
+    """
+    if len(cleaned) == 1:
+        return [classify_one(cleaned[0], tfidf, label_encoder, model, timings)]
+    return list(zip(*classify_cleaned(cleaned, tfidf, label_encoder, model, timings)))
+
+
+def needs_chunking(cleaned, window_words=DEFAULT_WINDOW_WORDS):
+    """
+    True if a cleaned text is longer than one window and classify_chunked would split it.
+    """
+    return len(cleaned.split(maxsplit=window_words)) > window_words
+
+def split_windows(cleaned, window_words=DEFAULT_WINDOW_WORDS, max_windows=DEFAULT_MAX_WINDOWS):
+    """
+    The first `max_windows` consecutive windows of `window_words` words of a cleaned text.
+    Words past the last window are never split out.
+    """
+    words = cleaned.split(maxsplit=window_words * max_windows)[:window_words * max_windows]
+    return [' '.join(words[i:i + window_words]) for i in range(0, len(words), window_words)]
+
+def aggregate_probabilities(window_probabilities, aggregate='mean'):
+    """
+    Combine (n_windows, n_classes) probabilities into one distribution: their mean, or
+    the per-class maximum renormalised to sum to 1.
+    """
+    if aggregate == 'mean':
+        return window_probabilities.mean(axis=0)
+    if aggregate == 'max':
+        combined = window_probabilities.max(axis=0)
+        return combined / combined.sum()
+    raise ValueError(f"aggregate must be one of {AGGREGATIONS}, not {aggregate!r}")
+
+def classify_chunked(cleaned, tfidf, label_encoder, model, window_words=DEFAULT_WINDOW_WORDS,
+                     aggregate='mean', early_exit_confidence=DEFAULT_EARLY_EXIT_CONFIDENCE,
+                     max_windows=DEFAULT_MAX_WINDOWS, windows_per_pass=DEFAULT_WINDOWS_PER_PASS, timings=None):
+    """
+    Classify one long cleaned text from its leading windows. Windows are scored
+    `windows_per_pass` at a time with one transform and one predict_proba call, and
+    scoring stops as soon as the aggregated confidence reaches `early_exit_confidence`
+    (in percent; None scores all windows). A text of at most one window is classified
+    whole by classify_one. Returns (category, confidence, probabilities).
+    """
+    if aggregate not in AGGREGATIONS:
+        raise ValueError(f"aggregate must be one of {AGGREGATIONS}, not {aggregate!r}")
+    if not needs_chunking(cleaned, window_words):
+        return classify_one(cleaned, tfidf, label_encoder, model, timings)
+
+    windows = split_windows(cleaned, window_words, max_windows)
+    scored = []
+    for start in range(0, len(windows), windows_per_pass):
+        with timed('vectorize', timings):
+            features = tfidf.transform(windows[start:start + windows_per_pass])
+        with timed('predict', timings):
+            scored.append(model.predict_proba(features))
+        probabilities = aggregate_probabilities(np.concatenate(scored), aggregate)
+        if early_exit_confidence is not None and probabilities.max() * 100 >= early_exit_confidence:
+            break
+    best = int(np.argmax(probabilities))
+    category = label_encoder.inverse_transform(model.classes_[[best]])[0]
+    return category, probabilities[best] * 100, probabilities
+
+def classify_documents(cleaned, tfidf, label_encoder, model, timings=None):
+    """
+    classify_cleaned for cleaned texts of any length: texts of at most one window are
+    scored together, longer ones one by one with classify_chunked, exactly as the app
+    scores them, so a long CV gets the same prediction (and cache entry) on every surface.
+    """
+    long = [i for i, text in enumerate(cleaned) if needs_chunking(text)]
+    if not long:
+        return classify_cleaned(cleaned, tfidf, label_encoder, model, timings)
+
+    categories = np.empty(len(cleaned), dtype=object)
+    confidences = np.empty(len(cleaned))
+    probabilities = np.empty((len(cleaned), len(model.classes_)))
+    short = sorted(set(range(len(cleaned))) - set(long))
+    if short:
+        scored = classify_cleaned([cleaned[i] for i in short], tfidf, label_encoder, model, timings)
+        categories[short], confidences[short], probabilities[short] = scored
+    for i in long:
+        categories[i], confidences[i], probabilities[i] = classify_chunked(
+            cleaned[i], tfidf, label_encoder, model, timings=timings)
+    return categories, confidences, probabilities
+
+def classify_texts(texts, tfidf, label_encoder, model, timings=None):
+    """
+    Clean and classify a batch of raw resume texts.
+    """
+    with timed('clean', timings):
+        cleaned = [clean_text(text) for text in texts]
+    return classify_documents(cleaned, tfidf, label_encoder, model, timings)
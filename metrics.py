@@ -0,0 +1,154 @@
+"""
+Latency instrumentation for the classification hot path.
+
+Stage timings (extract, clean, vectorize, predict, total) are recorded into
+process-wide histograms, and can also be collected per request into a plain
+dict for display. The histograms render in the Prometheus text exposition
+format, either served over HTTP (service.py /metrics) or written to a file that
+node_exporter's textfile collector, or a person, can pick up.
+"""
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+# Seconds; spans sub-millisecond scoring through slow PDF extraction
+STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+INF_BOUND = 'le="+Inf"'
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Histogram:
+    """
+    Cumulative-bucket histogram with an optional single label (e.g. stage="predict").
+    """
+
+    def __init__(self, name, help, buckets=STAGE_BUCKETS, label=None):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self.label = label
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def observe(self, value, label_value=None):
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = [[0] * len(self.buckets), 0.0, 0]
+            counts = series[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def _labels(self, label_value, extra=''):
+        parts = []
+        if self.label is not None:
+            parts.append(f'{self.label}="{label_value}"')
+        if extra:
+            parts.append(extra)
+        return '{' + ','.join(parts) + '}' if parts else ''
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            series = sorted(self._series.items(), key=lambda item: str(item[0]))
+            for label_value, (counts, total, count) in series:
+                for bound, bucket_count in zip(self.buckets, counts):
+                    le = f'le="{_format_value(bound)}"'
+                    lines.append(f'{self.name}_bucket{self._labels(label_value, le)} {bucket_count}')
+                lines.append(f'{self.name}_bucket{self._labels(label_value, INF_BOUND)} {count}')
+                lines.append(f'{self.name}_sum{self._labels(label_value)} {_format_value(total)}')
+                lines.append(f'{self.name}_count{self._labels(label_value)} {count}')
+        return lines
+
+class Gauge:
+    """
+    Value read from a callback at render time (e.g. a queue depth).
+    """
+
+    def __init__(self, name, help, read):
+        self.name = name
+        self.help = help
+        self.read = read
+
+    def render(self):
+        return [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} gauge',
+                f'{self.name} {_format_value(self.read())}']
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def _register(self, metric):
+        with self._lock:
+            # Re-registering a name (e.g. a Streamlit rerun) returns the existing metric
+            return self._metrics.setdefault(metric.name, metric)
+
+    def histogram(self, name, help, buckets=STAGE_BUCKETS, label=None):
+        return self._register(Histogram(name, help, buckets, label))
+
+    def gauge(self, name, help, read):
+        with self._lock:
+            self._metrics[name] = Gauge(name, help, read)
+            return self._metrics[name]
+
+    def render(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+REGISTRY = Registry()
+STAGE_SECONDS = REGISTRY.histogram(
+    'resume_stage_seconds', 'Time spent in each classification stage', label='stage'
+)
+
+@contextmanager
+def timed(stage, timings=None):
+    """
+    Time the enclosed block into the stage histogram, and add it to `timings[stage]` if given.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        STAGE_SECONDS.observe(elapsed, stage)
+        if timings is not None:
+            timings[stage] = timings.get(stage, 0.0) + elapsed
+
+def observe_timings(timings):
+    """
+    Record timings measured elsewhere (e.g. in a worker process) into the stage histogram.
+    """
+    for stage, seconds in timings.items():
+        STAGE_SECONDS.observe(seconds, stage)
+
+def render_prometheus(registry=REGISTRY):
+    return registry.render()
+
+def write_metrics_file(path, registry=REGISTRY):
+    """
+    Atomically replace `path` with the current metrics in Prometheus text format.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.metrics-', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(registry.render())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,153 @@
+"""
+Parallel model selection for trainning.py.
+
+Each distinct vectorizer configuration is fitted once and its train/test feature
+matrices are written to disk as plain CSR arrays. Candidate classifiers are then
+fitted in a joblib process pool; every worker memory-maps the same files read-only
+instead of receiving its own pickled copy of the matrix.
+"""
+import os
+import shutil
+import tempfile
+import time
+from itertools import product
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from scipy import sparse
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.svm import LinearSVC
+
+LEADERBOARD_PATH = 'model_selection_leaderboard.csv'
+LATENCY_DOCS = 200
+
+def save_csr(X, directory):
+    """
+    Write a CSR matrix as data/indices/indptr .npy files plus its shape.
+    """
+    X = sparse.csr_matrix(X)
+    os.makedirs(directory, exist_ok=True)
+    np.save(os.path.join(directory, 'data.npy'), X.data)
+    np.save(os.path.join(directory, 'indices.npy'), X.indices)
+    np.save(os.path.join(directory, 'indptr.npy'), X.indptr)
+    np.save(os.path.join(directory, 'shape.npy'), np.array(X.shape, dtype=np.int64))
+
+def load_csr(directory, mmap_mode='r'):
+    """
+    Memory-map a matrix written by save_csr; the arrays are shared through the page cache.
+    """
+    arrays = [np.load(os.path.join(directory, f'{name}.npy'), mmap_mode=mmap_mode)
+              for name in ('data', 'indices', 'indptr')]
+    shape = tuple(np.load(os.path.join(directory, 'shape.npy')))
+    return sparse.csr_matrix(tuple(arrays), shape=shape, copy=False)
+
+def vectorizer_grid(max_features=(5000,), ngram_ranges=((1, 2),)):
+    return [{'max_features': features, 'ngram_range': tuple(ngrams)}
+            for features, ngrams in product(max_features, ngram_ranges)]
+
+def model_grid(lr_c=(1.0,), svm_c=(0.5,), svm_calibration='single'):
+    models = [{'model': 'logistic_regression', 'C': c} for c in lr_c]
+    models += [{'model': 'svm', 'C': c, 'calibration': svm_calibration} for c in svm_c]
+    return models
+
+def make_vectorizer(config):
+    return TfidfVectorizer(
+        max_features=config['max_features'],
+        ngram_range=config['ngram_range'],
+        min_df=2,
+        max_df=0.85,
+        sublinear_tf=True
+    )
+
+def make_model(spec):
+    if spec['model'] == 'logistic_regression':
+        return LogisticRegression(C=spec['C'], solver='liblinear', max_iter=1000, random_state=42)
+    svm = LinearSVC(C=spec['C'], max_iter=2000, random_state=42, dual=False)
+    return CalibratedClassifierCV(svm, cv=3, ensemble=spec.get('calibration') == 'ensemble')
+
+def _fit_candidate(spec, matrix_dir, y_train, y_test):
+    # Runs in a worker process: the feature matrices are mapped, not copied
+    X_train = load_csr(os.path.join(matrix_dir, 'train'))
+    X_test = load_csr(os.path.join(matrix_dir, 'test'))
+    model = make_model(spec)
+
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+
+    accuracy = accuracy_score(y_test, model.predict(X_test))
+
+    latencies = []
+    for i in range(min(LATENCY_DOCS, X_test.shape[0])):
+        start = time.perf_counter()
+        model.predict_proba(X_test[i])
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        'accuracy': accuracy,
+        'fit_s': fit_seconds,
+        'predict_p50_ms': float(np.percentile(latencies, 50) * 1000),
+        'predict_p99_ms': float(np.percentile(latencies, 99) * 1000),
+    }, model
+
+def select_model(docs, y, train_index, test_index, vectorizers, models, workers=-1,
+                 leaderboard_path=LEADERBOARD_PATH, vectorizer_factory=make_vectorizer,
+                 feature_store=None, corpus_key=None):
+    """
+    Fit every (vectorizer config, model spec) pair and rank them by test accuracy.
+    With a feature_store (and the corpus_key it returned for `docs`), fitted
+    vectorizers and their matrices are reused from earlier runs.
+    Returns (leaderboard DataFrame, results) where results[i] = (vectorizer, model,
+    accuracy) for leaderboard row i. Latencies are measured while other candidates
+    are fitting, so compare them with each other rather than as absolute numbers.
+    """
+    y = np.asarray(y)
+    y_train, y_test = y[train_index], y[test_index]
+    work_dir = tempfile.mkdtemp(prefix='resume_features_')
+    try:
+        fitted_vectorizers, jobs = [], []
+        for v, config in enumerate(vectorizers):
+            print(f"  Vectorizing with {config}...")
+            vectorizer = vectorizer_factory(config)
+            if feature_store is not None:
+                vectorizer, X = feature_store.features(corpus_key, vectorizer, docs)
+            else:
+                X = vectorizer.fit_transform(docs)
+            matrix_dir = os.path.join(work_dir, f'vectorizer_{v}')
+            save_csr(X[train_index], os.path.join(matrix_dir, 'train'))
+            save_csr(X[test_index], os.path.join(matrix_dir, 'test'))
+            fitted_vectorizers.append(vectorizer)
+            jobs.extend((v, spec, matrix_dir) for spec in models)
+
+        print(f"  Fitting {len(jobs)} candidates...")
+        outcomes = Parallel(n_jobs=workers)(
+            delayed(_fit_candidate)(spec, matrix_dir, y_train, y_test) for _, spec, matrix_dir in jobs
+        )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    rows, results = [], []
+    for (v, spec, _), (metrics, model) in zip(jobs, outcomes):
+        config = vectorizers[v]
+        rows.append({
+            'model': spec['model'],
+            'C': spec['C'],
+            'calibration': spec.get('calibration', ''),
+            'max_features': config.get('max_features'),
+            'ngram_range': f"{config['ngram_range'][0]}-{config['ngram_range'][1]}",
+            'n_features': fitted_vectorizers[v].transform(['']).shape[1],
+            **metrics,
+        })
+        results.append((fitted_vectorizers[v], model, metrics['accuracy']))
+
+    leaderboard = pd.DataFrame(rows)
+    order = leaderboard.sort_values(['accuracy', 'predict_p50_ms'], ascending=[False, True]).index
+    leaderboard = leaderboard.loc[order].reset_index(drop=True)
+    results = [results[i] for i in order]
+    if leaderboard_path:
+        leaderboard.to_csv(leaderboard_path, index=False)
+    return leaderboard, results
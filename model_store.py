@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import time
+
+import joblib
+
+from compiled_model import COMPILED_DIR, load_compiled, read_meta
+from text_processing import clean_text, cleaner_fingerprint
+
+# Single fused artifact written by trainning.py, plus its manifest
+PIPELINE_PATH = 'resume_pipeline.joblib'
+MANIFEST_PATH = 'resume_pipeline.manifest.json'
+PIPELINE_FORMAT_VERSION = 1
+
+# Legacy loose pickles, still loaded when no pipeline artifact exists
+VECTORIZER_PATH = 'vectorizer.pkl'
+LABEL_ENCODER_PATH = 'labelencoder.pkl'
+CLASSIFIER_PATH = 'classifier.pkl'
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def vectorizer_size(tfidf):
+    """
+    Number of output features: the vocabulary size, or the bucket count for hashed features.
+    """
+    if hasattr(tfidf, 'vocabulary_'):
+        return len(tfidf.vocabulary_)
+    return tfidf.n_features
+
+def check_consistency(tfidf, label_encoder, model):
+    """
+    Raise ValueError if the vectorizer, label encoder and classifier don't belong together.
+    """
+    vocab_size = vectorizer_size(tfidf)
+    n_features = getattr(model, 'n_features_in_', vocab_size)
+    if n_features != vocab_size:
+        raise ValueError(
+            f"classifier expects {n_features} features but the vectorizer produces {vocab_size}"
+        )
+    if len(model.classes_) != len(label_encoder.classes_):
+        raise ValueError(
+            f"classifier has {len(model.classes_)} classes but the label encoder has {len(label_encoder.classes_)}"
+        )
+
+def save_pipeline(tfidf, label_encoder, model, metrics=None):
+    """
+    Write the fitted cleaner/vectorizer/classifier/labels as one artifact plus a JSON manifest.
+    """
+    check_consistency(tfidf, label_encoder, model)
+    pipeline = {
+        'format_version': PIPELINE_FORMAT_VERSION,
+        'cleaner': clean_text,
+        'vectorizer': tfidf,
+        'label_encoder': label_encoder,
+        'classifier': model,
+    }
+    joblib.dump(pipeline, PIPELINE_PATH)
+
+    manifest = {
+        'format_version': PIPELINE_FORMAT_VERSION,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'artifact': PIPELINE_PATH,
+        'artifact_sha256': _file_sha256(PIPELINE_PATH),
+        'cleaner': f'{clean_text.__module__}.{clean_text.__name__}',
+        'cleaner_fingerprint': cleaner_fingerprint(),
+        'vectorizer': type(tfidf).__name__,
+        'vocab_size': vectorizer_size(tfidf),
+        'classifier': type(model).__name__,
+        'classes': [str(label) for label in label_encoder.classes_],
+        'metrics': metrics or {},
+    }
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def load_pipeline():
+    """
+    Load the fused artifact in one call, verifying it against its manifest.
+    Returns (tfidf, label_encoder, model, manifest); raises ValueError on any mismatch.
+    """
+    manifest = _read_manifest()
+    if manifest.get('format_version') != PIPELINE_FORMAT_VERSION:
+        raise ValueError(f"unsupported pipeline format {manifest.get('format_version')}")
+    if _file_sha256(PIPELINE_PATH) != manifest['artifact_sha256']:
+        raise ValueError(f"{PIPELINE_PATH} does not match the hash recorded in {MANIFEST_PATH}")
+    if cleaner_fingerprint() != manifest['cleaner_fingerprint']:
+        raise ValueError("clean_text output differs from the normaliser the model was trained with")
+
+    pipeline = joblib.load(PIPELINE_PATH)
+    tfidf, label_encoder, model = pipeline['vectorizer'], pipeline['label_encoder'], pipeline['classifier']
+    check_consistency(tfidf, label_encoder, model)
+    if vectorizer_size(tfidf) != manifest['vocab_size']:
+        raise ValueError(f"vocabulary size {vectorizer_size(tfidf)} != manifest {manifest['vocab_size']}")
+    if [str(label) for label in label_encoder.classes_] != manifest['classes']:
+        raise ValueError("label classes do not match the manifest")
+    return tfidf, label_encoder, model, manifest
+
+def _read_manifest():
+    with open(MANIFEST_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+def _compiled_is_current():
+    if not os.path.exists(MANIFEST_PATH) or not os.path.exists(os.path.join(COMPILED_DIR, 'meta.json')):
+        return False
+    return read_meta(COMPILED_DIR).get('source_sha256') == _read_manifest()['artifact_sha256']
+
+# Load models with error handling
+def load_models():
+    try:
+        # Memory-mapped arrays load in milliseconds and are shared between worker processes
+        if _compiled_is_current():
+            try:
+                tfidf, label_encoder, model, _ = load_compiled(COMPILED_DIR)
+                return tfidf, label_encoder, model, None
+            except (OSError, ValueError):
+                # An older or damaged compiled directory: fall back to the pipeline artifact
+                pass
+
+        if os.path.exists(MANIFEST_PATH):
+            tfidf, label_encoder, model, _ = load_pipeline()
+            return tfidf, label_encoder, model, None
+
+        tfidf = joblib.load(VECTORIZER_PATH)
+        label_encoder = joblib.load(LABEL_ENCODER_PATH)
+        model = joblib.load(CLASSIFIER_PATH)
+        check_consistency(tfidf, label_encoder, model)
+        return tfidf, label_encoder, model, None
+    except Exception as e:
+        return None, None, None, str(e)
+
+def model_version():
+    """
+    Short content hash of the saved model; changes whenever the model is retrained.
+    """
+    if os.path.exists(MANIFEST_PATH):
+        return _read_manifest()['artifact_sha256'][:16]
+
+    digest = hashlib.sha256()
+    for path in (VECTORIZER_PATH, LABEL_ENCODER_PATH, CLASSIFIER_PATH):
+        digest.update(_file_sha256(path).encode('ascii'))
+    return digest.hexdigest()[:16]
@@ -0,0 +1,215 @@
+"""
+Near-duplicate detection over cleaned resume text with MinHash and LSH.
+
+Each document becomes a set of word k-shingles; a MinHash signature of `num_perm`
+32-bit values (multiply-shift hashes of the 32-bit shingle hashes) estimates the Jaccard similarity of two such sets as the fraction of
+positions where their signatures agree. The LSH index cuts signatures into `bands`
+of `rows` values and buckets documents by each band, so a lookup only compares
+against documents sharing at least one whole band, not against the whole pool.
+Candidates are confirmed with the signature estimate before they count.
+
+Shingle and band hashes come from zlib.crc32 and fixed seeds, never Python's hash(),
+so signatures are stable across processes and an index can be saved and reloaded.
+"""
+import os
+import tempfile
+import zlib
+from itertools import chain
+
+import numpy as np
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_NUM_PERM = 128
+DEFAULT_SHINGLE_SIZE = 3
+
+MAX_HASH = (1 << 32) - 1
+SHINGLE_MULTIPLIER = 1000003
+# Largest shingle count hashed in one numpy pass (num_perm x this many uint64 values)
+MAX_SHINGLES_PER_PASS = 1 << 16
+
+class _WordHashes(dict):
+    """
+    crc32 of each word, filled in on first sight so `map(table.__getitem__, words)` stays in C.
+    """
+
+    def __missing__(self, word):
+        value = self[word] = zlib.crc32(word.encode('utf-8'))
+        return value
+
+def optimal_bands(threshold, num_perm):
+    """
+    (bands, rows) with bands * rows <= num_perm minimising the false positive plus
+    false negative probability mass around `threshold`.
+    """
+    # Midpoint-rule integrals of the LSH candidate probability 1 - (1 - s**rows)**bands
+    below = (np.arange(100) + 0.5) / 100 * threshold
+    above = threshold + (np.arange(100) + 0.5) / 100 * (1 - threshold)
+    best, best_error = None, None
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            false_positive = np.mean(1 - (1 - below ** rows) ** bands) * threshold
+            false_negative = np.mean((1 - above ** rows) ** bands) * (1 - threshold)
+            error = false_positive + false_negative
+            if best_error is None or error < best_error:
+                best, best_error = (bands, rows), error
+    return best
+
+class NearDuplicateIndex:
+    def __init__(self, threshold=DEFAULT_THRESHOLD, num_perm=DEFAULT_NUM_PERM, shingle_size=DEFAULT_SHINGLE_SIZE,
+                 seed=1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+
+        rng = np.random.RandomState(seed)
+        # Multiply-shift hashing: the top 32 bits of a * h + b (mod 2**64), a odd; no modulo needed
+        self._a = rng.randint(0, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+        self._b = rng.randint(0, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._band_weights = rng.randint(1, MAX_HASH, size=self.rows, dtype=np.uint64)
+        self._word_hashes = _WordHashes()
+
+        self.keys = []
+        self._positions = {}
+        self._signatures = np.empty((1024, num_perm), dtype=np.uint32)
+        self._buckets = [{} for _ in range(self.bands)]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def _shingle_hashes(self, cleaned_docs):
+        """
+        32-bit hashes of every word k-shingle of a batch, as one flat array plus the
+        number of shingles per document. A document shorter than k words is one shingle.
+        """
+        words = list(map(str.split, cleaned_docs))
+        lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+        ids = np.fromiter(map(self._word_hashes.__getitem__, chain.from_iterable(words)),
+                          dtype=np.uint64, count=int(lengths.sum()))
+        ends = np.repeat(np.cumsum(lengths), lengths)
+        starts = ends - np.repeat(lengths, lengths)
+        positions = np.arange(len(ids))
+
+        padded = np.concatenate([ids, np.zeros(self.shingle_size, dtype=np.uint64)])
+        shingles = ids.copy()
+        for offset in range(1, self.shingle_size):
+            # Words past the end of a document only matter for short documents; zero them out
+            following = np.where(positions + offset < ends, padded[offset:offset + len(ids)], np.uint64(0))
+            shingles = (shingles * np.uint64(SHINGLE_MULTIPLIER) + following) & np.uint64(MAX_HASH)
+
+        keep = (positions + self.shingle_size <= ends) | ((positions == starts) & (ends - starts < self.shingle_size))
+        counts = np.maximum(lengths - self.shingle_size + 1, np.minimum(lengths, 1))
+        return shingles[keep], counts
+
+    def signatures(self, cleaned_docs):
+        """
+        MinHash signatures, one uint32 row per document; documents without words get
+        an all-MAX_HASH row.
+        """
+        signatures = np.full((len(cleaned_docs), self.num_perm), MAX_HASH, dtype=np.uint32)
+        if not len(cleaned_docs):
+            return signatures
+        shingles, counts = self._shingle_hashes(cleaned_docs)
+        bounds = np.concatenate([[0], np.cumsum(counts)])
+        start = 0
+        while start < len(counts):
+            # Hash as many documents per numpy pass as fit in MAX_SHINGLES_PER_PASS
+            stop = max(start + 1, int(np.searchsorted(bounds, bounds[start] + MAX_SHINGLES_PER_PASS, 'right')) - 1)
+            stop = min(stop, len(counts))
+            docs = start + np.flatnonzero(counts[start:stop])
+            if len(docs):
+                permuted = np.multiply.outer(self._a, shingles[bounds[start]:bounds[stop]])
+                permuted += self._b[:, None]
+                permuted >>= np.uint64(32)
+                minima = np.minimum.reduceat(permuted, bounds[docs] - bounds[start], axis=1)
+                signatures[docs] = minima.T
+            start = stop
+        return signatures
+
+    def _band_keys(self, signatures):
+        bands = signatures[:, :self.bands * self.rows].reshape(len(signatures), self.bands, self.rows)
+        # Wrapping uint64 arithmetic is fine here: the keys only need to be stable, not invertible
+        return (bands.astype(np.uint64) * self._band_weights).sum(axis=2).tolist()
+
+    def _match(self, signature, band_keys):
+        seen = set()
+        for bucket, key in zip(self._buckets, band_keys):
+            candidates = bucket.get(key)
+            if candidates is None:
+                continue
+            for position in candidates if isinstance(candidates, list) else (candidates,):
+                if position in seen:
+                    continue
+                seen.add(position)
+                if np.mean(self._signatures[position] == signature) >= self.threshold:
+                    return position
+        return None
+
+    def _insert(self, key, signature, band_keys):
+        position = len(self.keys)
+        if position == len(self._signatures):
+            self._signatures = np.concatenate([self._signatures, np.empty_like(self._signatures)])
+        self._signatures[position] = signature
+        self.keys.append(key)
+        self._positions[key] = position
+        for bucket, band_key in zip(self._buckets, band_keys):
+            # Most buckets hold a single document, so store a bare position until they don't
+            existing = bucket.get(band_key)
+            if existing is None:
+                bucket[band_key] = position
+            elif isinstance(existing, list):
+                existing.append(position)
+            else:
+                bucket[band_key] = [existing, position]
+
+    def add_batch(self, keys, cleaned_docs):
+        """
+        For each document return the key of its representative: an earlier near-duplicate
+        (from this batch or before), or its own key, in which case it is indexed. Keys
+        already in the index are their own representative. Documents are processed in
+        order, so the first copy of a resume becomes the representative of the rest.
+        """
+        signatures = self.signatures(cleaned_docs)
+        all_band_keys = self._band_keys(signatures)
+        representatives = []
+        for key, doc, signature, band_keys in zip(keys, cleaned_docs, signatures, all_band_keys):
+            if key in self._positions or not doc.strip():
+                representatives.append(key)
+                continue
+            position = self._match(signature, band_keys)
+            if position is None:
+                self._insert(key, signature, band_keys)
+                representatives.append(key)
+            else:
+                representatives.append(self.keys[position])
+        return representatives
+
+    def save(self, path):
+        """
+        Atomically write keys, signatures and parameters to `path` (an .npz archive).
+        """
+        fd, tmp_path = tempfile.mkstemp(prefix='.near-duplicates-', dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(
+                    f, keys=np.array(self.keys, dtype=str), signatures=self._signatures[:len(self.keys)],
+                    params=np.array([self.threshold, self.num_perm, self.shingle_size, self.seed], dtype=np.float64),
+                )
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            threshold, num_perm, shingle_size, seed = data['params']
+            index = cls(float(threshold), int(num_perm), int(shingle_size), int(seed))
+            signatures = data['signatures']
+            for key, signature, band_keys in zip(data['keys'].tolist(), signatures, index._band_keys(signatures)):
+                index._insert(key, signature, band_keys)
+        return index
@@ -0,0 +1,99 @@
+import re
+from importlib.util import find_spec
+
+# PDF backends are only probed here; they are imported on first use, so the app's
+# main process (which hands extraction to worker processes) never pays for them
+PDF_AVAILABLE = find_spec('PyPDF2') is not None
+PDFPLUMBER_AVAILABLE = find_spec('pdfplumber') is not None
+
+# Text budget for classification: enough to classify, without parsing a whole portfolio
+DEFAULT_MAX_PAGES = 10
+DEFAULT_MAX_CHARS = 50000
+
+def _pypdf2_pages(pdf_file, max_pages):
+    import PyPDF2
+
+    pdf_reader = PyPDF2.PdfReader(pdf_file)
+    # reader.pages is lazy, so pages past the budget are never parsed
+    for index, page in enumerate(pdf_reader.pages):
+        if max_pages is not None and index >= max_pages:
+            return
+        yield page.extract_text() or ""
+
+def _pdfplumber_pages(pdf_file, max_pages):
+    import pdfplumber
+
+    pages = list(range(1, max_pages + 1)) if max_pages is not None else None
+    with pdfplumber.open(pdf_file, pages=pages) as pdf:
+        for page in pdf.pages:
+            yield page.extract_text() or ""
+
+# Installed page-text backends, in the order they are tried
+PDF_BACKENDS = {}
+if PDF_AVAILABLE:
+    PDF_BACKENDS['pypdf2'] = _pypdf2_pages
+if PDFPLUMBER_AVAILABLE:
+    PDF_BACKENDS['pdfplumber'] = _pdfplumber_pages
+
+def iter_pdf_pages(pdf_file, max_pages=None, max_chars=None):
+    """
+    Lazily yield the text of each page, stopping once max_pages pages or
+    max_chars characters have been produced (the last page is truncated).
+    Tries PyPDF2 first and falls back to pdfplumber if it yields nothing.
+    """
+    for backend in PDF_BACKENDS.values():
+        produced = 0
+        try:
+            pdf_file.seek(0)
+            for page_text in backend(pdf_file, max_pages):
+                if not page_text.strip():
+                    continue
+                if max_chars is not None and produced + len(page_text) >= max_chars:
+                    yield page_text[:max_chars - produced]
+                    return
+                produced += len(page_text)
+                yield page_text
+        except Exception:
+            # Log error internally but don't show to user
+            pass
+        # Once a backend has produced text we can't switch mid-document
+        if produced:
+            return
+
+# PDF text extraction function
+def extract_text_from_pdf(pdf_file, max_pages=None, max_chars=None):
+    """
+    Extract text from PDF file using multiple methods for better compatibility
+    """
+    # Methods 1 and 2: PyPDF2, then pdfplumber, page by page
+    text = "\n".join(iter_pdf_pages(pdf_file, max_pages, max_chars))
+    if text.strip():
+        return text.strip()
+
+    # Method 3: Fallback - try to read as bytes and decode
+    try:
+        pdf_file.seek(0)  # Reset file pointer
+        content = pdf_file.read()
+        # Try to extract text using basic text extraction
+        text = content.decode('utf-8', errors='ignore')
+        # Remove non-printable characters
+        text = re.sub(r'[^\x20-\x7E\n\r\t]', '', text)
+        if max_chars is not None:
+            text = text[:max_chars]
+        if text.strip():
+            return text.strip()
+    except Exception:
+        # Log error internally but don't show to user
+        pass
+
+    return None
+
+def extract_text_from_file(path, max_pages=DEFAULT_MAX_PAGES, max_chars=DEFAULT_MAX_CHARS):
+    """
+    Extract text from a resume on disk (.pdf or plain text)
+    """
+    if path.lower().endswith('.pdf'):
+        with open(path, 'rb') as pdf_file:
+            return extract_text_from_pdf(pdf_file, max_pages, max_chars)
+    with open(path, 'rb') as text_file:
+        return text_file.read().decode('utf-8', errors='ignore')[:max_chars]
@@ -0,0 +1,121 @@
+"""
+Persistent cache of extracted text and predictions, keyed by the SHA-256 of the
+uploaded bytes and the model version.
+
+Entries live in a small SQLite file and are evicted least-recently-used once
+the stored payload grows past `max_bytes`. Entries written by any other model
+version are purged when the cache is opened, so a retrain invalidates them.
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+
+DEFAULT_CACHE_PATH = 'prediction_cache.sqlite3'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+def content_hash(data):
+    """
+    SHA-256 hex digest of raw upload bytes (str input is hashed as UTF-8)
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+def file_hash(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class PredictionCache:
+    def __init__(self, model_version, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.model_version = model_version
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS entries (
+                content_hash TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                extracted_text TEXT,
+                cleaned_text TEXT,
+                category TEXT,
+                confidence REAL,
+                probabilities BLOB,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (content_hash, model_version)
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access)')
+        # A retrained model changes the version, which makes every older entry stale
+        self._conn.execute('DELETE FROM entries WHERE model_version != ?', (model_version,))
+
+    def get(self, key):
+        """
+        Return the cached entry for a content hash as a dict, or None on a miss.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT extracted_text, cleaned_text, category, confidence, probabilities '
+                'FROM entries WHERE content_hash = ? AND model_version = ?',
+                (key, self.model_version),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                'UPDATE entries SET last_access = ? WHERE content_hash = ? AND model_version = ?',
+                (time.time(), key, self.model_version),
+            )
+
+        extracted_text, cleaned_text, category, confidence, probabilities = row
+        if probabilities is not None:
+            probabilities = array('d', probabilities).tolist()
+        return {
+            'extracted_text': extracted_text,
+            'cleaned_text': cleaned_text,
+            'category': category,
+            'confidence': confidence,
+            'probabilities': probabilities,
+        }
+
+    def put(self, key, extracted_text=None, cleaned_text=None, category=None,
+            confidence=None, probabilities=None):
+        """
+        Store (or overwrite) the entry for a content hash, evicting LRU entries if over budget.
+        """
+        blob = array('d', probabilities).tobytes() if probabilities is not None else None
+        size = len(extracted_text or '') + len(cleaned_text or '') + len(blob or b'')
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, self.model_version, extracted_text, cleaned_text, category,
+                 None if confidence is None else float(confidence), blob, size, time.time()),
+            )
+            self._evict()
+
+    def _evict(self):
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        while total > self.max_bytes:
+            oldest = self._conn.execute(
+                'SELECT content_hash, model_version, size FROM entries ORDER BY last_access LIMIT 64'
+            ).fetchall()
+            if not oldest:
+                break
+            victims = []
+            for key, version, size in oldest:
+                if total <= self.max_bytes:
+                    break
+                victims.append((key, version))
+                total -= size
+            self._conn.executemany(
+                'DELETE FROM entries WHERE content_hash = ? AND model_version = ?', victims
+            )
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,627 @@
+"""
+Static content shared by the app and the benchmarks.
+
+Streamlit re-executes app.py on every interaction, but imported modules run once per
+process, so everything here is built once and the app only looks it up. Treat it
+as read-only.
+"""
+
+# Sample resume texts
+sample_resumes = {
+    "Data Science": """John Doe
+Data Scientist
+San Francisco, CA | john.doe@email.com | (123) 456-7890
+
+SUMMARY
+Experienced Data Scientist with 5+ years of expertise in machine learning, statistical analysis, and data visualization. Skilled in Python, R, SQL, and various ML frameworks.
+
+EXPERIENCE
+Senior Data Scientist, Tech Company Inc. (2020-Present)
+- Developed predictive models that improved customer retention by 25%
+- Implemented machine learning pipelines processing 1TB+ of daily data
+- Created data visualizations that informed key business decisions
+
+Data Analyst, Analytics Corp (2018-2020)
+- Performed statistical analysis on large datasets
+- Built ETL processes to streamline data workflows
+- Created dashboards for executive reporting
+
+SKILLS
+Python, R, SQL, TensorFlow, PyTorch, Scikit-learn, Pandas, NumPy, Data Visualization, Statistical Analysis, Machine Learning, Big Data
+
+EDUCATION
+MS in Data Science, University of Technology (2018)
+BS in Computer Science, State University (2016)""",
+
+    "Web Development": """Jane Smith
+Full Stack Developer
+New York, NY | jane.smith@email.com | (987) 654-3210
+
+SUMMARY
+Full Stack Developer with 6 years of experience building scalable web applications. Proficient in JavaScript, React, Node.js, and modern development practices.
+
+EXPERIENCE
+Senior Developer, Web Solutions Inc. (2019-Present)
+- Led development of customer-facing React applications serving 100k+ users
+- Built RESTful APIs using Node.js and Express
+- Implemented CI/CD pipelines reducing deployment time by 40%
+
+Frontend Developer, Digital Agency LLC (2017-2019)
+- Developed responsive web applications using React and Vue.js
+- Collaborated with designers to implement UI/UX best practices
+- Optimized frontend performance improving load times by 30%
+
+SKILLS
+JavaScript, TypeScript, React, Node.js, Express, HTML5, CSS3, MongoDB, PostgreSQL, Git, AWS, Docker, REST APIs
+
+EDUCATION
+BS in Computer Science, Tech University (2017)""",
+
+    "Design": """Alex Johnson
+Product Designer
+Austin, TX | alex.j@email.com | (555) 123-4567
+
+SUMMARY
+Creative Product Designer with 4+ years of experience in UI/UX design for digital products. Passionate about creating intuitive user experiences.
+
+EXPERIENCE
+Lead Product Designer, Design Studio (2020-Present)
+- Designed mobile and web applications for Fortune 500 clients
+- Conducted user research and usability testing
+- Created design systems and component libraries
+
+UI Designer, Creative Agency (2018-2020)
+- Designed interfaces for e-commerce platforms
+- Created wireframes, prototypes, and high-fidelity mockups
+- Collaborated with developers to ensure design implementation
+
+SKILLS
+Figma, Sketch, Adobe Creative Suite, UI Design, UX Research, Wireframing, Prototyping, Design Systems, User Testing, HTML/CSS
+
+EDUCATION
+BFA in Design, Art Institute (2018)""",
+
+    "Mobile Development": """Sarah Chen
+iOS Developer
+Seattle, WA | sarah.chen@email.com | (206) 555-0123
+
+SUMMARY
+iOS Developer with 4+ years of experience building native iOS applications. Expert in Swift, SwiftUI, and iOS development best practices.
+
+EXPERIENCE
+Senior iOS Developer, Mobile Tech Inc. (2020-Present)
+- Led development of iOS apps with 500k+ downloads
+- Implemented advanced features using Core Data and Core Animation
+- Mentored junior developers and conducted code reviews
+
+iOS Developer, App Studio (2018-2020)
+- Developed consumer-facing iOS applications
+- Integrated third-party APIs and payment systems
+- Optimized app performance and reduced crash rates
+
+SKILLS
+Swift, SwiftUI, iOS SDK, Core Data, Core Animation, Xcode, Git, REST APIs, JSON, App Store Connect, TestFlight
+
+EDUCATION
+BS in Computer Science, University of Washington (2018)""",
+
+    "Software Engineering": """Michael Rodriguez
+Software Engineer
+Mountain View, CA | michael.r@email.com | (650) 555-0456
+
+SUMMARY
+Software Engineer with 6+ years of experience in system design, algorithms, and scalable software development. Passionate about clean code and efficient solutions.
+
+EXPERIENCE
+Senior Software Engineer, Tech Giant Inc. (2019-Present)
+- Designed and implemented microservices architecture serving 10M+ users
+- Led technical design reviews and architecture decisions
+- Mentored junior engineers and conducted technical interviews
+
+Software Engineer, Startup Corp (2017-2019)
+- Built backend services using Java and Spring Boot
+- Implemented CI/CD pipelines and automated testing
+- Collaborated with cross-functional teams on product features
+
+SKILLS
+Java, Python, C++, Algorithms, Data Structures, System Design, Microservices, Docker, Kubernetes, AWS, Git, Agile, Scrum
+
+EDUCATION
+MS in Computer Science, Stanford University (2017)
+BS in Computer Science, UC Berkeley (2015)""",
+
+    "Marketing": """Emily Watson
+Digital Marketing Manager
+Los Angeles, CA | emily.w@email.com | (310) 555-0789
+
+SUMMARY
+Digital Marketing Manager with 5+ years of experience in digital marketing, growth strategies, and campaign optimization. Results-driven professional with proven track record.
+
+EXPERIENCE
+Digital Marketing Manager, E-commerce Inc. (2020-Present)
+- Managed $2M+ annual digital marketing budget
+- Increased conversion rates by 35% through A/B testing
+- Led team of 5 marketing specialists
+
+Marketing Specialist, Digital Agency (2018-2020)
+- Executed paid advertising campaigns across multiple platforms
+- Developed content marketing strategies and social media presence
+- Analyzed campaign performance and provided optimization recommendations
+
+SKILLS
+SEO, SEM, Google Ads, Facebook Ads, Google Analytics, Content Marketing, Social Media Marketing, Email Marketing, A/B Testing, Conversion Optimization
+
+EDUCATION
+BS in Marketing, UCLA (2018)""",
+
+    "Finance": """David Kim
+Financial Analyst
+New York, NY | david.kim@email.com | (212) 555-0321
+
+SUMMARY
+Financial Analyst with 4+ years of experience in financial modeling, analysis, and reporting. Strong analytical skills and attention to detail.
+
+EXPERIENCE
+Senior Financial Analyst, Investment Bank (2020-Present)
+- Built complex financial models for M&A transactions
+- Conducted due diligence and financial analysis
+- Prepared presentations for senior management and clients
+
+Financial Analyst, Corporate Finance (2018-2020)
+- Created monthly financial reports and variance analysis
+- Assisted with budgeting and forecasting processes
+- Developed financial dashboards and KPIs
+
+SKILLS
+Financial Modeling, Excel, VBA, Financial Analysis, Valuation, M&A, Capital Markets, Bloomberg Terminal, PowerPoint, Accounting, Risk Assessment
+
+EDUCATION
+BS in Finance, NYU Stern (2018)""",
+
+    "Healthcare": """Dr. Lisa Thompson
+Healthcare Data Analyst
+Boston, MA | lisa.thompson@email.com | (617) 555-0654
+
+SUMMARY
+Healthcare Data Analyst with 3+ years of experience in healthcare analytics and data management. Background in clinical research and healthcare informatics.
+
+EXPERIENCE
+Healthcare Data Analyst, Health System Inc. (2020-Present)
+- Analyzed patient data to identify trends and improve care quality
+- Developed healthcare dashboards and reporting systems
+- Ensured HIPAA compliance in all data handling processes
+
+Clinical Research Coordinator, Medical Center (2018-2020)
+- Coordinated clinical trials and research studies
+- Collected and managed clinical data
+- Prepared regulatory submissions and reports
+
+SKILLS
+Healthcare Data, SQL, Python, Statistical Analysis, Healthcare Regulations, Clinical Trials, Medical Terminology, Health Informatics, HIPAA Compliance
+
+EDUCATION
+MPH in Epidemiology, Harvard University (2018)
+BS in Biology, Boston University (2016)""",
+
+    "Education": """Robert Wilson
+Educational Technology Specialist
+San Diego, CA | robert.w@email.com | (619) 555-0987
+
+SUMMARY
+Educational Technology Specialist with 4+ years of experience in edtech, instructional design, and digital learning solutions. Passionate about improving education through technology.
+
+EXPERIENCE
+Educational Technology Specialist, EdTech Company (2020-Present)
+- Designed and implemented learning management systems
+- Created interactive digital learning content
+- Provided training and support to educators
+
+Instructional Designer, University (2018-2020)
+- Developed online courses and curriculum materials
+- Implemented educational technology solutions
+- Conducted faculty training on digital tools
+
+SKILLS
+EdTech, Learning Management Systems, Instructional Design, Digital Learning, Educational Content, Curriculum Design, Assessment Design, User Experience, Training
+
+EDUCATION
+MEd in Educational Technology, San Diego State University (2018)
+BS in Education, UC San Diego (2016)"""
+}
+
+# Stylesheet injected at the top of every page
+APP_CSS = """
+<style>
+    /* Main styles */
+    .main-header {
+        font-size: 3rem;
+        color: #1E3A8A;
+        font-weight: 700;
+        margin-bottom: 0.5rem;
+    }
+    
+    .sub-header {
+        font-size: 1.2rem;
+        color: #64748B;
+        margin-bottom: 2rem;
+    }
+    
+    .card {
+        background-color: #FFFFFF;
+        border-radius: 12px;
+        padding: 1.5rem;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        margin-bottom: 1.5rem;
+        border-left: 4px solid #3B82F6;
+    }
+    
+    .result-card {
+        background: linear-gradient(135deg, #1E40AF 0%, #3B82F6 100%);
+        color: white;
+        border-radius: 12px;
+        padding: 2rem;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    
+    .confidence-meter {
+        height: 8px;
+        background-color: #E5E7EB;
+        border-radius: 4px;
+        margin: 1rem 0;
+        overflow: hidden;
+    }
+    
+    .confidence-fill {
+        height: 100%;
+        background: linear-gradient(90deg, #10B981 0%, #3B82F6 100%);
+        border-radius: 4px;
+    }
+    
+    .job-card {
+        background-color: #F8FAFC;
+        border-radius: 8px;
+        padding: 1rem;
+        margin-bottom: 0.5rem;
+        border-left: 3px solid #3B82F6;
+        transition: all 0.3s ease;
+    }
+    
+    .job-card:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 6px 12px rgba(0, 0, 0, 0.1);
+    }
+    
+    .skill-pill {
+        display: inline-block;
+        background-color: #DBEAFE;
+        color: #1E40AF;
+        padding: 0.3rem 0.8rem;
+        border-radius: 20px;
+        margin: 0.2rem;
+        font-size: 0.8rem;
+    }
+    .skill-pill.missing {
+        background-color: #F3F4F6;
+        color: #6B7280;
+    }
+    
+    .stProgress > div > div > div > div {
+        background: linear-gradient(90deg, #10B981 0%, #3B82F6 100%);
+    }
+    
+    /* Sidebar styles */
+    .sidebar-header {
+        text-align: center;
+        padding: 1rem 0;
+        border-bottom: 1px solid #E5E7EB;
+        margin-bottom: 1rem;
+    }
+    
+    /* Button styles */
+    .stButton > button {
+        background: linear-gradient(135deg, #1E40AF 0%, #3B82F6 100%);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 0.7rem 1.5rem;
+        font-weight: 600;
+        transition: all 0.3s ease;
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 4px 8px rgba(59, 130, 246, 0.4);
+    }
+    
+    /* Text area styling */
+    .stTextArea > div > div > textarea {
+        border-radius: 8px;
+        border: 2px solid #E5E7EB;
+        padding: 1rem;
+    }
+    
+    /* Metric styling */
+    .stMetric {
+        background-color: #F8FAFC;
+        padding: 1rem;
+        border-radius: 8px;
+        border-left: 4px solid #3B82F6;
+    }
+</style>
+"""
+
+# Job recommendations per category
+JOB_RECOMMENDATIONS = {
+    'Data Science': [
+        {"title": "Data Scientist", "companies": ["Google", "Amazon", "Netflix", "Meta", "Microsoft"], "skills": ["Python", "Machine Learning", "Statistics", "SQL", "Data Visualization"]},
+        {"title": "Machine Learning Engineer", "companies": ["Facebook", "Apple", "Uber", "Tesla", "OpenAI"], "skills": ["TensorFlow", "PyTorch", "Deep Learning", "MLOps", "Cloud Platforms"]},
+        {"title": "Data Analyst", "companies": ["Microsoft", "Spotify", "Airbnb", "Salesforce", "Adobe"], "skills": ["SQL", "Excel", "Tableau", "Python", "Business Intelligence"]},
+        {"title": "Data Engineer", "companies": ["Netflix", "Uber", "Airbnb", "Stripe", "Shopify"], "skills": ["Apache Spark", "Hadoop", "Kafka", "Python", "Data Pipelines"]}
+    ],
+    'Design': [
+        {"title": "UI/UX Designer", "companies": ["Adobe", "Figma", "InVision", "Google", "Apple"], "skills": ["Figma", "User Research", "Wireframing", "Prototyping", "Design Systems"]},
+        {"title": "Product Designer", "companies": ["Apple", "Google", "Facebook", "Netflix", "Airbnb"], "skills": ["Design Thinking", "Prototyping", "User Testing", "Product Strategy", "Visual Design"]},
+        {"title": "Graphic Designer", "companies": ["Canva", "Adobe", "Behance", "Nike", "Coca-Cola"], "skills": ["Illustrator", "Photoshop", "Typography", "Brand Identity", "Print Design"]},
+        {"title": "Visual Designer", "companies": ["Spotify", "Instagram", "TikTok", "Snapchat", "Pinterest"], "skills": ["Motion Graphics", "3D Design", "Animation", "Visual Effects", "Digital Art"]}
+    ],
+    'Web Development': [
+        {"title": "Frontend Developer", "companies": ["Netflix", "Twitter", "Shopify", "Discord", "Notion"], "skills": ["React", "JavaScript", "CSS", "TypeScript", "Responsive Design"]},
+        {"title": "Backend Developer", "companies": ["Amazon", "PayPal", "Stripe", "Uber", "Airbnb"], "skills": ["Node.js", "Python", "APIs", "Databases", "Microservices"]},
+        {"title": "Full Stack Developer", "companies": ["Google", "Microsoft", "Meta", "Netflix", "Spotify"], "skills": ["MERN Stack", "DevOps", "Databases", "Cloud Services", "System Design"]},
+        {"title": "DevOps Engineer", "companies": ["Netflix", "Uber", "Airbnb", "Spotify", "Discord"], "skills": ["Docker", "Kubernetes", "AWS", "CI/CD", "Infrastructure"]}
+    ],
+    'Mobile Development': [
+        {"title": "iOS Developer", "companies": ["Apple", "Uber", "Instagram", "TikTok", "Spotify"], "skills": ["Swift", "SwiftUI", "iOS SDK", "Core Data", "App Store"]},
+        {"title": "Android Developer", "companies": ["Google", "Snapchat", "Discord", "TikTok", "Uber"], "skills": ["Kotlin", "Android SDK", "Jetpack", "Material Design", "Google Play"]},
+        {"title": "React Native Developer", "companies": ["Facebook", "Instagram", "Discord", "Skype", "Shopify"], "skills": ["React Native", "JavaScript", "Mobile Development", "Cross-platform", "Native Modules"]}
+    ],
+    'Software Engineering': [
+        {"title": "Software Engineer", "companies": ["Google", "Microsoft", "Amazon", "Meta", "Apple"], "skills": ["Algorithms", "Data Structures", "System Design", "Programming", "Problem Solving"]},
+        {"title": "Cloud Engineer", "companies": ["Amazon", "Microsoft", "Google", "Netflix", "Uber"], "skills": ["AWS", "Azure", "GCP", "Terraform", "Kubernetes"]},
+        {"title": "Security Engineer", "companies": ["Google", "Microsoft", "Amazon", "Meta", "Netflix"], "skills": ["Cybersecurity", "Network Security", "Penetration Testing", "Security Tools", "Compliance"]}
+    ],
+    'Marketing': [
+        {"title": "Digital Marketing Manager", "companies": ["Google", "Facebook", "Amazon", "Netflix", "Spotify"], "skills": ["SEO", "SEM", "Social Media", "Analytics", "Content Strategy"]},
+        {"title": "Content Marketing Specialist", "companies": ["HubSpot", "Mailchimp", "Canva", "Buffer", "Hootsuite"], "skills": ["Content Creation", "SEO", "Social Media", "Email Marketing", "Analytics"]},
+        {"title": "Growth Marketing Manager", "companies": ["Uber", "Airbnb", "Spotify", "Discord", "Notion"], "skills": ["Growth Hacking", "A/B Testing", "Conversion Optimization", "Data Analysis", "Marketing Automation"]}
+    ],
+    'Sales': [
+        {"title": "Sales Development Representative", "companies": ["Salesforce", "HubSpot", "Microsoft", "Oracle", "Adobe"], "skills": ["Lead Generation", "Cold Calling", "CRM", "Sales Process", "Communication"]},
+        {"title": "Account Executive", "companies": ["Salesforce", "Microsoft", "Oracle", "Adobe", "Workday"], "skills": ["Relationship Building", "Solution Selling", "Negotiation", "Pipeline Management", "Revenue Growth"]}
+    ],
+    'Finance': [
+        {"title": "Financial Analyst", "companies": ["Goldman Sachs", "JPMorgan", "Morgan Stanley", "BlackRock", "Vanguard"], "skills": ["Financial Modeling", "Excel", "VBA", "Financial Analysis", "Risk Assessment"]},
+        {"title": "Investment Banker", "companies": ["Goldman Sachs", "JPMorgan", "Morgan Stanley", "Bank of America", "Citigroup"], "skills": ["Financial Modeling", "Valuation", "M&A", "Capital Markets", "Financial Analysis"]}
+    ],
+    'Healthcare': [
+        {"title": "Healthcare Data Analyst", "companies": ["UnitedHealth", "Anthem", "Kaiser", "CVS Health", "Walgreens"], "skills": ["Healthcare Data", "SQL", "Python", "Statistical Analysis", "Healthcare Regulations"]},
+        {"title": "Clinical Research Associate", "companies": ["Pfizer", "Johnson & Johnson", "Roche", "Novartis", "Merck"], "skills": ["Clinical Trials", "Regulatory Compliance", "Data Management", "Medical Writing", "Research Protocols"]}
+    ],
+    'Education': [
+        {"title": "Educational Technology Specialist", "companies": ["Coursera", "Udemy", "edX", "Khan Academy", "Duolingo"], "skills": ["EdTech", "Learning Management Systems", "Instructional Design", "Digital Learning", "Educational Content"]},
+        {"title": "Curriculum Developer", "companies": ["Khan Academy", "Coursera", "Udemy", "edX", "Codecademy"], "skills": ["Curriculum Design", "Instructional Design", "Educational Content", "Assessment Design", "Learning Objectives"]}
+    ]
+}
+DEFAULT_RECOMMENDATIONS = [{"title": "Senior roles in your field", "companies": ["Various"], "skills": ["Leadership", "Strategy", "Management", "Communication", "Problem Solving"]}]
+
+# Skills to highlight per category
+SKILL_SUGGESTIONS = {
+    'Data Science': ["Python", "R", "SQL", "Machine Learning", "Statistics", "Data Visualization", "Big Data", "Deep Learning", "TensorFlow", "PyTorch", "Scikit-learn", "Pandas", "NumPy", "Matplotlib", "Seaborn", "Jupyter", "Git", "Docker", "AWS", "Azure"],
+    'Design': ["Figma", "Adobe Creative Suite", "UI/UX Design", "Typography", "Color Theory", "Wireframing", "Prototyping", "User Research", "Design Systems", "Sketch", "InVision", "Principle", "After Effects", "Illustrator", "Photoshop", "XD", "User Testing", "Accessibility"],
+    'Web Development': ["JavaScript", "HTML/CSS", "React", "Node.js", "APIs", "Databases", "Git", "DevOps", "TypeScript", "Vue.js", "Angular", "Express.js", "MongoDB", "PostgreSQL", "MySQL", "AWS", "Docker", "Kubernetes", "CI/CD", "REST APIs"],
+    'Mobile Development': ["Swift", "Kotlin", "React Native", "Flutter", "iOS Development", "Android Development", "Mobile UI/UX", "App Store", "Google Play", "Mobile Testing", "Performance Optimization", "Push Notifications", "In-App Purchases", "Mobile Analytics"],
+    'Software Engineering': ["Algorithms", "Data Structures", "System Design", "Programming", "Problem Solving", "Java", "C++", "Python", "Go", "Rust", "Microservices", "API Design", "Database Design", "System Architecture", "Code Review", "Testing", "Agile", "Scrum"],
+    'Marketing': ["SEO", "SEM", "Social Media Marketing", "Content Marketing", "Email Marketing", "Google Analytics", "Facebook Ads", "Google Ads", "Marketing Automation", "A/B Testing", "Conversion Optimization", "Brand Management", "Market Research", "Customer Segmentation"],
+    'Sales': ["Lead Generation", "Cold Calling", "CRM", "Sales Process", "Communication", "Negotiation", "Relationship Building", "Solution Selling", "Pipeline Management", "Revenue Growth", "Sales Strategy", "Account Management", "Prospecting", "Closing Techniques"],
+    'Finance': ["Financial Modeling", "Excel", "VBA", "Financial Analysis", "Risk Assessment", "Valuation", "Investment Analysis", "Portfolio Management", "Financial Planning", "Accounting", "Budgeting", "Forecasting", "Financial Reporting", "Compliance"],
+    'Healthcare': ["Healthcare Data", "SQL", "Python", "Statistical Analysis", "Healthcare Regulations", "Clinical Trials", "Medical Terminology", "Health Informatics", "Patient Data", "Medical Coding", "HIPAA Compliance", "Healthcare Analytics", "Population Health"],
+    'Education': ["EdTech", "Learning Management Systems", "Instructional Design", "Digital Learning", "Educational Content", "Curriculum Design", "Assessment Design", "Learning Objectives", "Student Engagement", "Educational Technology", "Online Learning", "Blended Learning"]
+}
+DEFAULT_SKILL_SUGGESTIONS = ["Python", "JavaScript", "SQL", "Communication", "Project Management", "Leadership", "Problem Solving", "Critical Thinking", "Teamwork", "Adaptability"]
+
+# Improvement tips per domain (markdown)
+IMPROVEMENT_TIPS = {
+    'Data Science': """**📊 Data Science & Analytics:**
+- Showcase specific ML projects with metrics and business impact
+- Highlight your proficiency with Python data stack (Pandas, NumPy, Scikit-learn)
+- Include any cloud platform experience (AWS, GCP, Azure)
+- Quantify your impact with percentages and numbers
+- Add data visualization examples and storytelling skills""",
+    'Design': """**🎨 Design & Creative:**
+- Create a comprehensive portfolio with case studies
+- Highlight your design process and thinking methodology
+- Include specific tools proficiency (Figma, Adobe XD, Sketch)
+- Show before/after examples and user research insights
+- Demonstrate understanding of accessibility and user experience""",
+    'Web Development': """**🌐 Web Development:**
+- Highlight specific technologies and frameworks you've used
+- Include GitHub profile with sample projects and contributions
+- Mention performance optimization and scalability experience
+- Detail any DevOps, CI/CD, or deployment experience
+- Showcase responsive design and cross-browser compatibility skills""",
+    'Mobile Development': """**📱 Mobile Development:**
+- Showcase apps in app stores with download numbers
+- Highlight platform-specific skills (iOS/Android)
+- Include performance optimization and testing experience
+- Demonstrate knowledge of mobile UI/UX best practices
+- Show experience with cross-platform frameworks if applicable""",
+    'Software Engineering': """**⚙️ Software Engineering:**
+- Highlight system design and architecture experience
+- Showcase algorithm and data structure knowledge
+- Include experience with microservices and distributed systems
+- Demonstrate code quality and testing practices
+- Show leadership and mentoring experience""",
+    'Marketing': """**📈 Marketing & Growth:**
+- Quantify campaign results with specific metrics
+- Highlight experience with marketing automation tools
+- Showcase A/B testing and conversion optimization skills
+- Include experience with various marketing channels
+- Demonstrate data-driven decision making""",
+    'Sales': """**💼 Sales & Business Development:**
+- Highlight revenue generation and quota achievement
+- Showcase relationship building and negotiation skills
+- Include experience with CRM systems and sales processes
+- Demonstrate market research and prospecting abilities
+- Show leadership in sales teams if applicable""",
+    'Finance': """**💰 Finance & Investment:**
+- Highlight financial modeling and analysis skills
+- Showcase experience with financial software and tools
+- Include specific deal experience and transaction sizes
+- Demonstrate understanding of regulations and compliance
+- Show quantitative and analytical capabilities""",
+    'Healthcare': """**🏥 Healthcare & Life Sciences:**
+- Highlight healthcare-specific data analysis experience
+- Showcase knowledge of healthcare regulations (HIPAA, etc.)
+- Include experience with clinical trials or patient data
+- Demonstrate understanding of healthcare workflows
+- Show experience with healthcare-specific tools and systems""",
+    'Education': """**🎓 Education & Learning:**
+- Highlight instructional design and curriculum development
+- Showcase experience with learning management systems
+- Include experience with different learning methodologies
+- Demonstrate understanding of educational technology trends
+- Show experience with student engagement and assessment""",
+}
+DEFAULT_IMPROVEMENT_TIPS = """**💡 General Career Tips:**
+- Quantify your achievements with specific numbers and metrics
+- Highlight leadership and project management experience
+- Showcase continuous learning and skill development
+- Include industry-specific certifications and training
+- Demonstrate problem-solving and critical thinking abilities"""
+
+# Trained label -> content domain, for labels whose name doesn't contain the domain name
+CATEGORY_DOMAINS = {
+    'Accountant': 'Finance',
+    'Arts': 'Design',
+    'Banking': 'Finance',
+    'Blockchain': 'Software Engineering',
+    'Business Analyst': 'Data Science',
+    'Database': 'Data Science',
+    'Designing': 'Design',
+    'DevOps': 'Software Engineering',
+    'Digital Media': 'Marketing',
+    'DotNet Developer': 'Software Engineering',
+    'ETL Developer': 'Data Science',
+    'Health and Fitness': 'Healthcare',
+    'Information Technology': 'Software Engineering',
+    'Java Developer': 'Software Engineering',
+    'Network Security Engineer': 'Software Engineering',
+    'Public Relations': 'Marketing',
+    'Python Developer': 'Software Engineering',
+    'React Developer': 'Web Development',
+    'SAP Developer': 'Software Engineering',
+    'SQL Developer': 'Data Science',
+    'Testing': 'Software Engineering',
+    'Web Designing': 'Web Development',
+}
+
+GENERAL_CONTENT = {
+    'domain': None,
+    'recommendations': DEFAULT_RECOMMENDATIONS,
+    'skills': DEFAULT_SKILL_SUGGESTIONS,
+    'tips': DEFAULT_IMPROVEMENT_TIPS,
+}
+
+def category_domain(label):
+    """
+    Content domain for a trained label, or None if there is no tailored content.
+    """
+    if label in CATEGORY_DOMAINS:
+        return CATEGORY_DOMAINS[label]
+    for domain in JOB_RECOMMENDATIONS:
+        if domain.lower() in label.lower():
+            return domain
+    return None
+
+def build_content_index(classes):
+    """
+    Map every trained label to its recommendations, skills and tips, resolved once so
+    the results page only does a dict lookup. Labels without a domain get GENERAL_CONTENT.
+    """
+    index = {}
+    for label in map(str, classes):
+        domain = category_domain(label)
+        if domain is None:
+            index[label] = GENERAL_CONTENT
+        else:
+            index[label] = {
+                'domain': domain,
+                'recommendations': JOB_RECOMMENDATIONS.get(domain, DEFAULT_RECOMMENDATIONS),
+                'skills': SKILL_SUGGESTIONS.get(domain, DEFAULT_SKILL_SUGGESTIONS),
+                'tips': IMPROVEMENT_TIPS.get(domain, DEFAULT_IMPROVEMENT_TIPS),
+            }
+    return index
+
+def skill_catalog():
+    """
+    Every skill named in the skill suggestions and the job recommendations, first
+    spelling first, for compiling a SkillMatcher.
+    """
+    skills = [skill for domain_skills in SKILL_SUGGESTIONS.values() for skill in domain_skills]
+    skills += DEFAULT_SKILL_SUGGESTIONS
+    for jobs in list(JOB_RECOMMENDATIONS.values()) + [DEFAULT_RECOMMENDATIONS]:
+        skills += [skill for job in jobs for skill in job['skills']]
+    return skills
+
+def missing_content(index):
+    """
+    Labels in the index that fall back to the general content.
+    """
+    return sorted(label for label, content in index.items() if content['domain'] is None)
+
+# Market insights page: one dict of columns per chart
+SALARY_BY_LEVEL = {
+    'Level': ['Entry (0-2 yrs)', 'Mid (3-5 yrs)', 'Senior (6-8 yrs)', 'Lead (8+ yrs)'],
+    'Data Science': [85000, 125000, 165000, 210000],
+    'Web Development': [75000, 115000, 155000, 190000],
+    'Design': [70000, 100000, 140000, 175000],
+    'Mobile Development': [80000, 120000, 160000, 200000],
+    'Software Engineering': [90000, 130000, 170000, 220000],
+    'Marketing': [65000, 95000, 130000, 160000],
+    'Sales': [70000, 110000, 150000, 200000],
+    'Finance': [75000, 115000, 155000, 200000],
+    'Healthcare': [70000, 100000, 135000, 170000],
+    'Education': [60000, 85000, 115000, 140000]
+}
+TECH_SKILL_DEMAND = {
+    'Skill': ['Python', 'JavaScript', 'React', 'SQL', 'Machine Learning', 'AWS', 'Docker', 'Kubernetes'],
+    'Demand Score': [95, 92, 88, 85, 90, 87, 82, 78]
+}
+BUSINESS_SKILL_DEMAND = {
+    'Skill': ['SEO', 'Google Analytics', 'Sales CRM', 'Financial Modeling', 'Project Management', 'Leadership', 'Communication'],
+    'Demand Score': [85, 80, 75, 88, 82, 90, 95]
+}
+HIRING_TRENDS = {
+    'Month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
+    'Data Science': [100, 120, 130, 115, 140, 160, 150, 145, 155, 165, 170, 180],
+    'Web Development': [150, 160, 170, 165, 180, 190, 185, 190, 195, 200, 210, 220],
+    'Design': [80, 90, 95, 100, 110, 120, 115, 120, 125, 130, 135, 140],
+    'Mobile Development': [70, 80, 85, 90, 95, 100, 105, 110, 115, 120, 125, 130],
+    'Software Engineering': [120, 130, 140, 135, 150, 160, 155, 160, 165, 170, 175, 180],
+    'Marketing': [90, 100, 110, 105, 115, 125, 120, 125, 130, 135, 140, 145],
+    'Sales': [110, 120, 130, 125, 135, 145, 140, 145, 150, 155, 160, 165],
+    'Finance': [85, 95, 100, 95, 105, 115, 110, 115, 120, 125, 130, 135],
+    'Healthcare': [60, 70, 75, 80, 85, 90, 95, 100, 105, 110, 115, 120],
+    'Education': [50, 60, 65, 70, 75, 80, 85, 90, 95, 100, 105, 110]
+}
+REGIONAL_SALARIES = {
+    'Region': ['San Francisco', 'New York', 'Seattle', 'Austin', 'Boston', 'Los Angeles', 'Chicago', 'Denver'],
+    'Data Science': [180000, 175000, 170000, 160000, 165000, 155000, 150000, 145000],
+    'Web Development': [170000, 165000, 160000, 150000, 155000, 145000, 140000, 135000],
+    'Design': [150000, 145000, 140000, 130000, 135000, 125000, 120000, 115000]
+}
+
+def insights_frames():
+    """
+    Chart-ready DataFrames for the insights page, already indexed and sorted.
+    """
+    import pandas as pd
+
+    return {
+        'salary': pd.DataFrame(SALARY_BY_LEVEL).set_index('Level'),
+        'tech_skills': pd.DataFrame(TECH_SKILL_DEMAND).sort_values('Demand Score', ascending=False).set_index('Skill'),
+        'business_skills': pd.DataFrame(BUSINESS_SKILL_DEMAND).sort_values('Demand Score', ascending=False).set_index('Skill'),
+        'trends': pd.DataFrame(HIRING_TRENDS).set_index('Month'),
+        'regional': pd.DataFrame(REGIONAL_SALARIES).set_index('Region'),
+    }
@@ -0,0 +1,104 @@
+"""
+Section-aware resume parsing.
+
+parse_sections reads a resume line by line, once, and files every line under the
+section whose header it last saw: SUMMARY, EXPERIENCE, EDUCATION, SKILLS (plus common
+spellings such as "Work Experience" or "Technical Skills:"), with anything before the
+first header under 'header' (name and contact details) and sections it does not
+model (projects, certifications, ...) under 'other'. A header is a line that is
+nothing but a known section name, optionally followed by a colon and inline content
+("Skills: Python, SQL").
+
+parse_resume adds the known skills found by a SkillMatcher, so the app parses each
+document once and the results page only reads the record.
+"""
+from skill_matcher import SkillMatcher
+
+SECTION_NAMES = ('header', 'summary', 'experience', 'education', 'skills', 'other')
+
+SECTION_HEADERS = {
+    'SUMMARY': 'summary',
+    'PROFESSIONAL SUMMARY': 'summary',
+    'PROFILE': 'summary',
+    'OBJECTIVE': 'summary',
+    'CAREER OBJECTIVE': 'summary',
+    'ABOUT ME': 'summary',
+    'EXPERIENCE': 'experience',
+    'WORK EXPERIENCE': 'experience',
+    'PROFESSIONAL EXPERIENCE': 'experience',
+    'EMPLOYMENT': 'experience',
+    'EMPLOYMENT HISTORY': 'experience',
+    'WORK HISTORY': 'experience',
+    'EDUCATION': 'education',
+    'ACADEMIC BACKGROUND': 'education',
+    'QUALIFICATIONS': 'education',
+    'SKILLS': 'skills',
+    'TECHNICAL SKILLS': 'skills',
+    'KEY SKILLS': 'skills',
+    'CORE COMPETENCIES': 'skills',
+    'PROJECTS': 'other',
+    'CERTIFICATIONS': 'other',
+    'AWARDS': 'other',
+    'PUBLICATIONS': 'other',
+    'LANGUAGES': 'other',
+    'INTERESTS': 'other',
+    'REFERENCES': 'other',
+}
+# Longer lines are never headers, which keeps the per-line check to one short lookup
+MAX_HEADER_LENGTH = max(map(len, SECTION_HEADERS)) + 1
+
+def _header(line):
+    """
+    (section, inline content) if `line` is a section header, else None.
+    """
+    name, colon, rest = line.partition(':')
+    if len(name) > MAX_HEADER_LENGTH:
+        return None
+    section = SECTION_HEADERS.get(' '.join(name.split()).upper())
+    if section is None:
+        return None
+    return section, rest.strip() if colon else ''
+
+def parse_sections(lines):
+    """
+    Split a resume (a string, or any iterable of lines such as an open file) into a
+    dict of section name -> text, with every name in SECTION_NAMES present. Blank
+    lines are dropped and repeated sections are concatenated.
+    """
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+    sections = {name: [] for name in SECTION_NAMES}
+    current = sections['header']
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        header = _header(line)
+        if header is None:
+            current.append(line)
+            continue
+        current = sections[header[0]]
+        if header[1]:
+            current.append(header[1])
+    return {name: '\n'.join(section) for name, section in sections.items()}
+
+def build_skill_matcher():
+    from resume_data import skill_catalog
+
+    return SkillMatcher(skill_catalog())
+
+def parse_resume(text, matcher):
+    """
+    Structured record of one resume: {'sections': parse_sections(text), 'skills': known
+    skills mentioned anywhere in it, in order of first mention}.
+    """
+    return {'sections': parse_sections(text), 'skills': matcher.find(text)}
+
+def skill_coverage(record, skills):
+    """
+    (found, missing): the given skills split by whether the parsed resume mentions them.
+    """
+    mentioned = set(record['skills'])
+    found = [skill for skill in skills if skill in mentioned]
+    missing = [skill for skill in skills if skill not in mentioned]
+    return found, missing
@@ -0,0 +1,255 @@
+"""
+Top-k resume search: rank an indexed pool of resumes against a free-text job description.
+
+Resumes are vectorized with the trained TF-IDF vectorizer, L2-normalised and stored as
+an inverted index: a features x documents CSR matrix whose rows are the postings of
+one term, written with save_csr and memory-mapped on load. A query only touches the
+postings rows of its own terms, so its cost follows the number of matching postings,
+not the size of the pool; cosine similarity is the dot product of unit vectors.
+
+Each add() writes a new segment instead of rebuilding the index. Once there are more
+than `max_segments`, the newest segments are merged (oldest ones only when the newer
+data has caught up with them), so every document is rewritten O(log n) times.
+manifest.json lists the live segments and is replaced atomically; the index is tied
+to the model version it was built with and has to be rebuilt after retraining.
+Only one process should add to an index at a time.
+
+Usage:
+    python search_index.py add resumes/ --index resume_index
+    python search_index.py search "Senior Python developer, Django, AWS" --top-k 50
+    python search_index.py search --file job_posting.txt --output shortlist.csv
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+from scipy import sparse
+from sklearn.preprocessing import normalize
+
+from model_selection import load_csr, save_csr
+from text_processing import clean_text
+
+DEFAULT_INDEX_DIR = 'resume_index'
+DEFAULT_TOP_K = 50
+DEFAULT_MAX_SEGMENTS = 8
+MANIFEST_NAME = 'manifest.json'
+
+def _top_k(scores, k):
+    if k < len(scores):
+        return np.argpartition(scores, -k)[-k:]
+    return np.arange(len(scores))
+
+class ResumeIndex:
+    def __init__(self, tfidf, model_version, directory=DEFAULT_INDEX_DIR, max_segments=DEFAULT_MAX_SEGMENTS):
+        self.tfidf = tfidf
+        self.model_version = model_version
+        self.directory = directory
+        self.max_segments = max_segments
+        os.makedirs(directory, exist_ok=True)
+
+        manifest_path = os.path.join(directory, MANIFEST_NAME)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding='utf-8') as f:
+                self._manifest = json.load(f)
+            if self._manifest['model_version'] != model_version:
+                raise ValueError(
+                    f"index {directory} was built with model {self._manifest['model_version']}, "
+                    f"not {model_version}; rebuild it"
+                )
+        else:
+            self._manifest = {'model_version': model_version, 'n_features': None, 'segments': [], 'next_segment': 0}
+
+        self._segments = [self._load_segment(name) for name in self._manifest['segments']]
+        self._known = {doc_id for segment in self._segments for doc_id in segment['ids']}
+
+    def __len__(self):
+        return len(self._known)
+
+    def __contains__(self, doc_id):
+        return str(doc_id) in self._known
+
+    @property
+    def n_segments(self):
+        return len(self._segments)
+
+    def _load_segment(self, name):
+        path = os.path.join(self.directory, name)
+        with open(os.path.join(path, 'ids.json'), encoding='utf-8') as f:
+            ids = json.load(f)
+        return {'name': name, 'postings': load_csr(path), 'ids': ids}
+
+    def _write_segment(self, postings, ids):
+        name = f"segment-{self._manifest['next_segment']:06d}"
+        self._manifest['next_segment'] += 1
+        build_dir = tempfile.mkdtemp(prefix='.segment-', dir=self.directory)
+        save_csr(postings, build_dir)
+        with open(os.path.join(build_dir, 'ids.json'), 'w', encoding='utf-8') as f:
+            json.dump(ids, f)
+        os.replace(build_dir, os.path.join(self.directory, name))
+        return self._load_segment(name)
+
+    def _commit(self, segments):
+        # Readers only ever see the segments listed in a complete manifest
+        dropped = {segment['name'] for segment in self._segments} - {segment['name'] for segment in segments}
+        self._segments = segments
+        self._manifest['segments'] = [segment['name'] for segment in segments]
+        fd, tmp_path = tempfile.mkstemp(prefix='.manifest-', dir=self.directory)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self._manifest, f)
+        os.replace(tmp_path, os.path.join(self.directory, MANIFEST_NAME))
+        for name in dropped:
+            shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+    def vectorize(self, cleaned):
+        return normalize(sparse.csr_matrix(self.tfidf.transform(cleaned)), norm='l2', copy=False)
+
+    def add(self, ids, cleaned):
+        """
+        Index cleaned resume texts under the given ids, skipping ids already indexed.
+        Returns the number of resumes added.
+        """
+        new = {}
+        for doc_id, text in zip(map(str, ids), cleaned):
+            if doc_id not in self._known and doc_id not in new:
+                new[doc_id] = text
+        if not new:
+            return 0
+
+        X = self.vectorize(list(new.values()))
+        if self._manifest['n_features'] is None:
+            self._manifest['n_features'] = X.shape[1]
+        # Transposed, each row holds one term's postings: the documents containing it and their weights
+        segment = self._write_segment(X.T.tocsr(), list(new))
+        self._known.update(new)
+        self._commit(self._segments + [segment])
+        if len(self._segments) > self.max_segments:
+            self._merge(self._merge_start())
+        return len(new)
+
+    def _merge_start(self):
+        # Merge the newest segments, reaching back to an older one only once the newer
+        # data adds up to at least its size, so merges stay geometric in size
+        sizes = [len(segment['ids']) for segment in self._segments]
+        start = len(sizes) - 2
+        while start > 0 and sizes[start - 1] <= sum(sizes[start:]):
+            start -= 1
+        return start
+
+    def _merge(self, start=0):
+        tail = self._segments[start:]
+        if len(tail) < 2:
+            return
+        postings = sparse.hstack([segment['postings'] for segment in tail], format='csr')
+        ids = [doc_id for segment in tail for doc_id in segment['ids']]
+        merged = self._write_segment(postings, ids)
+        self._commit(self._segments[:start] + [merged])
+
+    def compact(self):
+        """
+        Merge every segment into one.
+        """
+        self._merge(0)
+
+    def search_vector(self, query, k=DEFAULT_TOP_K):
+        """
+        Top-k (id, cosine similarity) pairs for one already vectorized, normalised query row.
+        """
+        query = sparse.csr_matrix(query)
+        if not query.nnz:
+            return []
+
+        scored = []
+        for segment in self._segments:
+            # Sparse x sparse: only the postings rows of the query's own terms are read from
+            # the mapped files, and only documents sharing a term get a score
+            scores = (query @ segment['postings']).tocsr()
+            for i in _top_k(scores.data, k):
+                scored.append((float(scores.data[i]), segment['ids'][scores.indices[i]]))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(doc_id, score) for score, doc_id in scored[:k]]
+
+    def search(self, text, k=DEFAULT_TOP_K):
+        """
+        Top-k (id, cosine similarity) pairs for a raw job description.
+        """
+        return self.search_vector(self.vectorize([clean_text(text)]), k)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--index', default=DEFAULT_INDEX_DIR, help="Index directory")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', help="Index a directory or manifest of .pdf/.txt resumes")
+    add.add_argument('source', help="Directory of resumes, or a manifest (.csv with a 'path' column, or one path per line)")
+    add.add_argument('--batch-size', '-b', type=int, default=1024, help="Resumes per new segment")
+    add.add_argument('--workers', '-w', type=int, default=None, help="Extraction processes (default: CPU count)")
+
+    search = commands.add_parser('search', help="Rank the indexed resumes against a job description")
+    search.add_argument('query', nargs='?', default=None, help="Job description text")
+    search.add_argument('--file', default=None, help="Read the job description from this file")
+    search.add_argument('--top-k', '-k', type=int, default=DEFAULT_TOP_K, help="Resumes to return")
+    search.add_argument('--output', '-o', default=None, help="Also write the ranking to this CSV")
+
+    commands.add_parser('compact', help="Merge all segments into one")
+    args = parser.parse_args(argv)
+
+    from model_store import load_models, model_version
+
+    tfidf, _, _, error = load_models()
+    if error:
+        print(f"Error loading models: {error}", file=sys.stderr)
+        print("Please run the training script first to generate the models.", file=sys.stderr)
+        return 1
+    try:
+        index = ResumeIndex(tfidf, model_version(), args.index)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    if args.command == 'add':
+        from batch_classify import collect_paths, iter_batches
+        from extraction_pool import PdfExtractionPool
+
+        # Files indexed earlier are skipped before they are extracted
+        paths = [path for path in collect_paths(args.source) if path not in index]
+        start = time.perf_counter()
+        added = failed = 0
+        with PdfExtractionPool(args.workers) as pool:
+            extracted = ((paths[i], text, error) for i, text, error in pool.imap_unordered(paths))
+            for batch in iter_batches(extracted, args.batch_size):
+                readable = [(path, clean_text(text)) for path, text, error in batch if error is None]
+                failed += len(batch) - len(readable)
+                added += index.add([path for path, _ in readable], [text for _, text in readable])
+                print(f"  {added} added, {failed} failed")
+        print(f"Indexed {added} new resumes in {time.perf_counter() - start:.1f}s "
+              f"({len(index)} total, {index.n_segments} segments)")
+    elif args.command == 'search':
+        if args.file:
+            with open(args.file, encoding='utf-8') as f:
+                query = f.read()
+        elif args.query:
+            query = args.query
+        else:
+            parser.error("give a job description or --file")
+        start = time.perf_counter()
+        results = index.search(query, args.top_k)
+        elapsed = time.perf_counter() - start
+        for rank, (doc_id, score) in enumerate(results, 1):
+            print(f"{rank:>4}  {score:.4f}  {doc_id}")
+        print(f"{len(results)} of {len(index)} resumes in {elapsed * 1000:.1f} ms")
+        if args.output:
+            import pandas as pd
+
+            pd.DataFrame(results, columns=['id', 'score']).to_csv(args.output, index=False)
+    else:
+        index.compact()
+        print(f"Compacted {len(index)} resumes into {index.n_segments} segment(s)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,411 @@
+"""
+HTTP inference service for programmatic access (e.g. from an ATS).
+
+A plain asyncio HTTP/1.1 server with no web framework dependency. The event loop
+only parses requests and writes responses: cleaning and scoring run in a process
+pool whose workers each load the model once, and PDFs are parsed in separate
+extraction pools with per-file timeouts and memory caps.
+
+Endpoints:
+    GET  /health          model version and pool sizes
+    GET  /stats           micro-batching queue depth and batch-size counts
+    GET  /metrics         per-stage latency histograms in Prometheus text format
+    POST /classify        JSON {"text": ...}, a raw PDF body (application/pdf),
+                          or multipart/form-data with a "file" (.pdf/.txt) or "text" field
+    POST /classify/batch  JSON {"texts": [...]}, or multipart/form-data with several files
+
+Usage:
+    python service.py --port 8000
+    curl -s localhost:8000/classify -H 'Content-Type: application/json' -d '{"text": "..."}'
+    curl -s localhost:8000/classify -F file=@resume.pdf
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+
+import numpy as np
+
+import model_store
+from extraction_pool import DEFAULT_MAX_MEMORY_MB, DEFAULT_TIMEOUT, PdfExtractionPool
+from inference import classify_texts
+from metrics import BATCH_SIZE_BUCKETS, REGISTRY, observe_timings, render_prometheus, timed
+from micro_batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS, MicroBatcher
+
+DEFAULT_PORT = 8000
+DEFAULT_MAX_BODY_MB = 20
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BATCH_DOCUMENTS = 1000
+
+REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    413: 'Payload Too Large', 415: 'Unsupported Media Type', 422: 'Unprocessable Entity',
+    431: 'Request Header Fields Too Large', 500: 'Internal Server Error', 501: 'Not Implemented',
+    503: 'Service Unavailable',
+}
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+# Scoring worker processes: the model is loaded once per process, not per request
+_worker_models = None
+
+def _init_scoring_worker():
+    global _worker_models
+    tfidf, label_encoder, model, error = model_store.load_models()
+    if error:
+        raise RuntimeError(f"error loading models: {error}")
+    _worker_models = (tfidf, label_encoder, model)
+
+def _score(texts):
+    """
+    Clean and classify raw texts in a worker. Returns (rows, timings): plain Python rows
+    for pickling and the seconds spent per stage, which the parent records in its metrics.
+    """
+    tfidf, label_encoder, model = _worker_models
+    timings = {}
+    categories, confidences, probabilities = classify_texts(texts, tfidf, label_encoder, model, timings)
+    labels = [str(label) for label in label_encoder.classes_]
+    rows = [
+        {
+            'category': str(category),
+            'confidence': float(confidence),
+            'probabilities': dict(zip(labels, np.asarray(proba, dtype=float).tolist())),
+        }
+        for category, confidence, proba in zip(categories, confidences, probabilities)
+    ]
+    return rows, timings
+
+def _parse_multipart(content_type, body):
+    """
+    Split a multipart/form-data body into (uploads, texts): (filename, bytes) for every
+    file part and the decoded value of every 'text'/'texts' field. Runs off the event loop.
+    """
+    message = BytesParser(policy=HTTP).parsebytes(
+        b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + body
+    )
+    if not message.is_multipart():
+        raise HttpError(400, "malformed multipart body")
+    uploads, texts = [], []
+    for part in message.iter_parts():
+        filename = part.get_filename()
+        payload = part.get_payload(decode=True) or b''
+        if filename is not None:
+            uploads.append((filename, payload))
+        elif part.get_param('name', header='content-disposition') in ('text', 'texts'):
+            texts.append(payload.decode('utf-8', errors='ignore'))
+    return uploads, texts
+
+def _check_document_count(count, batch):
+    if not batch and count > 1:
+        raise HttpError(422, "POST several documents to /classify/batch")
+    if count > MAX_BATCH_DOCUMENTS:
+        raise HttpError(413, f"at most {MAX_BATCH_DOCUMENTS} documents per batch")
+
+class ClassificationService:
+    def __init__(self, scoring_workers=None, extraction_workers=2, timeout=DEFAULT_TIMEOUT,
+                 max_memory_mb=DEFAULT_MAX_MEMORY_MB, max_body_mb=DEFAULT_MAX_BODY_MB,
+                 max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait_ms=DEFAULT_MAX_WAIT_MS):
+        self.max_body_bytes = max_body_mb * 1024 * 1024
+        self.model_version = model_store.model_version()
+        self.scoring_workers = scoring_workers or os.cpu_count() or 1
+        self._scoring = concurrent.futures.ProcessPoolExecutor(
+            self.scoring_workers, mp_context=mp.get_context('spawn'), initializer=_init_scoring_worker
+        )
+        # Single-document requests arriving together are scored as one batch per worker round trip
+        self._batcher = MicroBatcher(
+            self._score_batch, max_batch_size, max_wait_ms, workers=self.scoring_workers
+        )
+        # PdfExtractionPool serves one caller at a time, so concurrent uploads each borrow a
+        # single-worker pool instead of queueing behind one shared pool
+        self.extraction_workers = extraction_workers
+        self._extraction_pools = [
+            PdfExtractionPool(1, timeout, max_memory_mb) for _ in range(extraction_workers)
+        ]
+        self._free_pools = None
+
+        self._batch_sizes = REGISTRY.histogram(
+            'resume_micro_batch_size', 'Documents per micro-batch', BATCH_SIZE_BUCKETS
+        )
+        REGISTRY.gauge('resume_queue_depth', 'Requests waiting for a micro-batch',
+                       lambda: self._batcher.stats()['queue_depth'])
+
+    async def start(self, host, port):
+        self._free_pools = asyncio.Queue()
+        for pool in self._extraction_pools:
+            self._free_pools.put_nowait(pool)
+        # Fail at startup, not on the first request, if the workers cannot load the model
+        await self.score(['warm up'])
+        return await asyncio.start_server(self._handle_connection, host, port, limit=MAX_HEADER_BYTES)
+
+    def close(self):
+        self._batcher.close()
+        self._scoring.shutdown(cancel_futures=True)
+        for pool in self._extraction_pools:
+            pool.close()
+
+    def _score_batch(self, texts):
+        # Runs on a batcher thread; blocks only that thread while a worker process scores
+        rows, timings = self._scoring.submit(_score, texts).result()
+        observe_timings(timings)
+        self._batch_sizes.observe(len(texts))
+        return [(row, timings) for row in rows]
+
+    async def score(self, texts):
+        """
+        Score raw texts, returning (rows, timings). A single text joins the micro-batch
+        queue, a batch goes straight to a worker; timings are those of the whole batch.
+        """
+        if len(texts) == 1:
+            row, timings = await asyncio.wrap_future(self._batcher.submit(texts[0]))
+            return [row], timings
+        loop = asyncio.get_running_loop()
+        rows, timings = await loop.run_in_executor(self._scoring, _score, texts)
+        observe_timings(timings)
+        return rows, timings
+
+    async def extract(self, data, timings=None):
+        pool = await self._free_pools.get()
+        start = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, pool.extract, data)
+        finally:
+            self._free_pools.put_nowait(pool)
+            # The pool records the histogram itself; this is only the per-request breakdown
+            if timings is not None:
+                timings['extract'] = timings.get('extract', 0.0) + time.perf_counter() - start
+
+    async def _document_text(self, data, filename=None, timings=None):
+        """
+        Return (text, error) for an uploaded document: PDFs are parsed, anything else is decoded.
+        """
+        if data[:5] == b'%PDF-' or (filename or '').lower().endswith('.pdf'):
+            return await self.extract(data, timings)
+        return data.decode('utf-8', errors='ignore'), None
+
+    async def _request_documents(self, headers, body, batch, timings=None):
+        """
+        Return [(name, text, error)] for the documents in a request body. Bodies of up to
+        max_body_mb are parsed in the default executor so the event loop never blocks on
+        them, and the document count is checked before any upload is extracted.
+        """
+        content_type = headers.get('content-type', '')
+        media_type = content_type.split(';')[0].strip().lower()
+        loop = asyncio.get_running_loop()
+
+        if media_type == 'application/json':
+            try:
+                payload = await loop.run_in_executor(None, json.loads, body)
+            except ValueError:
+                raise HttpError(400, "body is not valid JSON")
+            if not isinstance(payload, dict):
+                raise HttpError(400, "expected a JSON object")
+            if 'texts' in payload:
+                texts = payload['texts']
+            elif 'text' in payload:
+                texts = [payload['text']]
+            else:
+                raise HttpError(422, "expected a 'text' or 'texts' field")
+            if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                raise HttpError(422, "'texts' must be a list of strings")
+            _check_document_count(len(texts), batch)
+            return [(None, text, None) for text in texts]
+
+        if media_type == 'application/pdf':
+            text, error = await self.extract(body, timings)
+            return [(None, text, error)]
+
+        if media_type == 'text/plain':
+            return [(None, body.decode('utf-8', errors='ignore'), None)]
+
+        if media_type == 'multipart/form-data':
+            uploads, texts = await loop.run_in_executor(None, _parse_multipart, content_type, body)
+            _check_document_count(len(uploads) + len(texts), batch)
+            documents = [(None, text, None) for text in texts]
+            extracted = await asyncio.gather(*(self._document_text(data, name, timings) for name, data in uploads))
+            documents.extend((name, text, error) for (name, _), (text, error) in zip(uploads, extracted))
+            if not documents:
+                raise HttpError(422, "expected a 'file' or 'text' form field")
+            return documents
+
+        raise HttpError(415, f"unsupported content type {media_type or '(none)'}")
+
+    async def classify(self, headers, body, batch):
+        timings = {}
+        with timed('total', timings):
+            results = await self._classify(headers, body, batch, timings)
+        timings_ms = {stage: round(seconds * 1000, 3) for stage, seconds in timings.items()}
+
+        if batch:
+            return {'model_version': self.model_version, 'results': results, 'timings_ms': timings_ms}
+        if results[0].get('category') is None:
+            raise HttpError(422, results[0]['error'])
+        return {'model_version': self.model_version, **results[0], 'timings_ms': timings_ms}
+
+    async def _classify(self, headers, body, batch, timings):
+        documents = await self._request_documents(headers, body, batch, timings)
+        if not batch and len(documents) != 1:
+            raise HttpError(422, "POST several documents to /classify/batch")
+
+        scorable = [i for i, (_, text, error) in enumerate(documents) if error is None and text and text.strip()]
+        scored = []
+        if scorable:
+            scored, score_timings = await self.score([documents[i][1] for i in scorable])
+            timings.update(score_timings)
+        results = [None] * len(documents)
+        for i, row in zip(scorable, scored):
+            results[i] = row
+        for i, (name, text, error) in enumerate(documents):
+            if results[i] is None:
+                results[i] = {'category': None, 'error': error or 'empty document'}
+            if name is not None:
+                results[i]['filename'] = name
+        return results
+
+    async def route(self, method, path, headers, body):
+        path = path.split('?', 1)[0]
+        if path == '/health':
+            if method != 'GET':
+                raise HttpError(405, "use GET")
+            return {
+                'status': 'ok',
+                'model_version': self.model_version,
+                'scoring_workers': self.scoring_workers,
+                'extraction_workers': self.extraction_workers,
+            }
+        if path == '/stats':
+            if method != 'GET':
+                raise HttpError(405, "use GET")
+            return self._batcher.stats()
+        if path == '/metrics':
+            if method != 'GET':
+                raise HttpError(405, "use GET")
+            return render_prometheus()
+        if path in ('/classify', '/classify/batch'):
+            if method != 'POST':
+                raise HttpError(405, "use POST")
+            return await self.classify(headers, body, batch=path == '/classify/batch')
+        raise HttpError(404, f"no route for {path}")
+
+    async def _read_request(self, reader):
+        """
+        Parse one request; returns None when the client closed the connection.
+        """
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError as e:
+            if e.partial.strip():
+                raise HttpError(400, "incomplete request")
+            return None
+        except asyncio.LimitOverrunError:
+            raise HttpError(431, "request headers too large")
+
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ', 2)
+        except ValueError:
+            raise HttpError(400, "malformed request line")
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            raise HttpError(501, "chunked request bodies are not supported; send Content-Length")
+        # Digits only: int() would also take a sign, underscores or non-ASCII digits
+        length = headers.get('content-length', '0')
+        if not (length.isascii() and length.isdigit()):
+            raise HttpError(400, "invalid Content-Length")
+        length = int(length)
+        if length > self.max_body_bytes:
+            raise HttpError(413, f"body larger than {self.max_body_bytes // (1024 * 1024)} MB")
+        body = await reader.readexactly(length) if length else b''
+
+        keep_alive = headers.get('connection', '').lower() != 'close' and version.upper() == 'HTTP/1.1'
+        return method.upper(), target, headers, body, keep_alive
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, target, headers, body, keep_alive = request
+                    status, payload = 200, await self.route(method, target, headers, body)
+                except HttpError as e:
+                    status, payload = e.status, {'error': e.message}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except Exception as e:
+                    status, payload = 500, {'error': str(e)}
+
+                if isinstance(payload, str):
+                    content_type, data = 'text/plain; version=0.0.4', payload.encode('utf-8')
+                else:
+                    content_type, data = 'application/json', json.dumps(payload).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+async def serve(args):
+    service = ClassificationService(args.workers, args.extraction_workers, args.timeout,
+                                    args.max_memory_mb, args.max_body_mb, args.max_batch_size, args.max_wait_ms)
+    try:
+        server = await service.start(args.host, args.port)
+        print(f"Serving model {service.model_version} on http://{args.host}:{args.port} "
+              f"({service.scoring_workers} scoring / {service.extraction_workers} extraction workers)")
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the resume classifier over HTTP.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', '-w', type=int, default=None, help="Scoring processes (default: CPU count)")
+    parser.add_argument('--extraction-workers', type=int, default=2, help="Concurrent PDF extraction processes")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="Per-file extraction timeout in seconds")
+    parser.add_argument('--max-memory-mb', type=int, default=DEFAULT_MAX_MEMORY_MB, help="Address-space cap per extraction worker")
+    parser.add_argument('--max-body-mb', type=int, default=DEFAULT_MAX_BODY_MB, help="Largest accepted request body")
+    parser.add_argument('--max-batch-size', type=int, default=DEFAULT_MAX_BATCH_SIZE,
+                        help="Most single-document requests scored together")
+    parser.add_argument('--max-wait-ms', type=float, default=DEFAULT_MAX_WAIT_MS,
+                        help="How long the first queued request waits for others to join its batch")
+    args = parser.parse_args(argv)
+
+    try:
+        model_store.model_version()
+    except OSError as e:
+        print(f"No trained model found ({e}). Please run the training script first.", file=sys.stderr)
+        return 1
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
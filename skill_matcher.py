@@ -0,0 +1,128 @@
+"""
+Known-skill extraction with an Aho-Corasick automaton.
+
+Skill names and resume text are split into the same tokens: runs of word characters
+and single punctuation characters, so "C++", "Node.js" and "UI/UX Design" are token
+sequences and a skill can only match on token boundaries ("Go" never matches inside
+"Google"). The compiled automaton is a transition table over tokens: a text is
+tokenized with one regex pass and walked once, at most two dict lookups per token, whatever
+the number of skills, and every skill ending at a token is reported with its
+character offsets. Matching ignores case and whitespace between tokens, except for
+skills of at most two characters ("R", "Go", "XD"), which must match their exact spelling.
+"""
+import re
+from collections import deque
+
+_TOKEN = re.compile(r'\w+|[^\w\s]')
+# Skills this short are too likely to be ordinary words in any other case
+EXACT_CASE_MAX_LENGTH = 2
+
+class SkillMatcher:
+    """
+    Build once from an iterable of skill names (later duplicates that differ only in
+    case or spacing are dropped) and reuse: find() does not modify the automaton.
+    """
+
+    def __init__(self, skills):
+        self.skills = []
+        self._tokens = []
+        self._exact_case = []
+        self._goto = [{}]
+        self._outputs = [[]]
+        known = set()
+        for skill in skills:
+            tokens = tuple(map(str.lower, _TOKEN.findall(skill)))
+            if not tokens or tokens in known:
+                continue
+            known.add(tokens)
+            state = 0
+            for token in tokens:
+                following = self._goto[state].get(token)
+                if following is None:
+                    following = self._goto[state][token] = len(self._goto)
+                    self._goto.append({})
+                    self._outputs.append([])
+                state = following
+            self._outputs[state].append(len(self.skills))
+            self.skills.append(skill)
+            self._tokens.append(tokens)
+            self._exact_case.append(tuple(_TOKEN.findall(skill)) if len(skill) <= EXACT_CASE_MAX_LENGTH else None)
+        self._root = self._goto[0]
+        self._transitions = self._compile()
+
+    def __len__(self):
+        return len(self.skills)
+
+    def _compile(self):
+        """
+        Failure links folded into a transition table: transitions[state] maps every token
+        that leads from `state` somewhere other than where it leads from the root, so a
+        scan never follows failure links, only a dict lookup per token plus one in the
+        root's transitions on a miss. Leaving the root's transitions out of every state
+        keeps the table the size of the trie plus its failure chains.
+        """
+        root = self._root
+        # Breadth-first, so a state's failure target (a shorter suffix) is done before it;
+        # outputs are merged along the way and every state lists all skills ending there
+        fail = [0] * len(self._goto)
+        transitions = [None] * len(self._goto)
+        transitions[0] = {}
+        pending = deque(root.values())
+        while pending:
+            state = pending.popleft()
+            transitions[state] = {**transitions[fail[state]], **self._goto[state]}
+            for token, following in self._goto[state].items():
+                fail[following] = transitions[fail[state]].get(token) or root.get(token, 0)
+                self._outputs[following] = self._outputs[following] + self._outputs[fail[following]]
+                pending.append(following)
+        return transitions
+
+    def _scan(self, original):
+        """
+        Yield (skill id, index of its last token) for every skill occurrence, given the
+        tokens of a text in their original case.
+        """
+        transitions, root, outputs, exact_case = self._transitions, self._root, self._outputs, self._exact_case
+        state = 0
+        for i, token in enumerate(map(str.lower, original)):
+            # A stored transition is never to the root, so `or` only falls through on a miss
+            state = transitions[state].get(token) or root.get(token, 0)
+            if not outputs[state]:
+                continue
+            for skill_id in outputs[state]:
+                exact = exact_case[skill_id]
+                if exact is None or tuple(original[i - len(exact) + 1:i + 1]) == exact:
+                    yield skill_id, i
+
+    def finditer(self, text):
+        """
+        Yield (start, end, skill) for every skill occurrence in `text`, overlapping ones
+        included, ordered by where they end; text[start:end] is the matched span.
+        """
+        original = _TOKEN.findall(text)
+        starts = []
+        position = 0
+        for skill_id, last in self._scan(original):
+            # Only whitespace separates tokens, so each one is the next index() from the end of the previous
+            while len(starts) <= last:
+                token = original[len(starts)]
+                position = text.index(token, position)
+                starts.append(position)
+                position += len(token)
+            first = last - len(self._tokens[skill_id]) + 1
+            yield starts[first], starts[last] + len(original[last]), self.skills[skill_id]
+
+    def find(self, text):
+        """
+        Distinct skills mentioned in `text`, in order of first mention.
+        """
+        found = {}
+        for skill_id, _ in self._scan(_TOKEN.findall(text)):
+            found.setdefault(skill_id, None)
+        return [self.skills[skill_id] for skill_id in found]
+
+    def find_many(self, texts):
+        """
+        find() over a batch of texts: one list of distinct skills per text.
+        """
+        return [self.find(text) for text in texts]
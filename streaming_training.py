@@ -0,0 +1,111 @@
+"""
+Out-of-core training for corpora that don't fit in memory.
+
+The labelled CSV is read in chunks and never held whole. A first pass collects the
+label set and the hashed document frequencies (HashedTfidfVectorizer.partial_fit);
+each training epoch then re-reads the file and feeds every cleaned, vectorized chunk
+to SGDClassifier.partial_fit; a last pass scores the held-out rows. Memory is
+bounded by the chunk size and n_features, not by the corpus size.
+
+Rows are assigned to the held-out set by a hash of their text, so the split is the
+same on every pass without storing any row ids.
+"""
+import sys
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDClassifier
+from sklearn.preprocessing import LabelEncoder
+
+try:
+    import resource
+except ImportError:  # Windows has no getrusage; peak RSS is not reported
+    resource = None
+
+from hashing_features import DEFAULT_N_FEATURES, HashedTfidfVectorizer
+from text_processing import clean_texts
+
+DEFAULT_CHUNK_SIZE = 10000
+DEFAULT_EPOCHS = 3
+TEST_FRACTION = 0.2
+
+def _peak_rss_mb():
+    if resource is None:
+        return float('nan')
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux but in bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def _is_test_row(text):
+    return zlib.crc32(text.encode('utf-8')) % 100 < TEST_FRACTION * 100
+
+def iter_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, split=None):
+    """
+    Yield (cleaned_texts, categories) per CSV chunk. split='train' / 'test' keeps only
+    that side of the hash split; None keeps every row.
+    """
+    for chunk in pd.read_csv(path, usecols=['Category', 'Text'], chunksize=chunk_size):
+        chunk = chunk.dropna()
+        if split is not None:
+            test = chunk['Text'].map(_is_test_row)
+            chunk = chunk[test] if split == 'test' else chunk[~test]
+        if len(chunk):
+            yield clean_texts(chunk['Text']), chunk['Category'].to_numpy()
+
+def _report(stage, number, rows, total_rows, seconds):
+    print(f"  [{stage}] chunk {number}: {rows} rows ({total_rows} total), "
+          f"{rows / seconds:.0f} rows/s, peak RSS {_peak_rss_mb():.0f} MB")
+
+def train_streaming(path, chunk_size=DEFAULT_CHUNK_SIZE, epochs=DEFAULT_EPOCHS,
+                    n_features=DEFAULT_N_FEATURES, alpha=1e-5):
+    """
+    Fit a hashed TF-IDF vectorizer and a log-loss SGDClassifier over `path` chunk by chunk.
+    Returns (tfidf, label_encoder, model, accuracy) with accuracy measured on the held-out rows.
+    """
+    tfidf = HashedTfidfVectorizer(
+        n_features=n_features, ngram_range=(1, 2), min_df=2, max_df=0.85, sublinear_tf=True
+    )
+
+    # Pass 1: document frequencies and the label set
+    print("Pass 1: counting document frequencies...")
+    categories = set()
+    total_rows = 0
+    for number, (docs, labels) in enumerate(iter_chunks(path, chunk_size, 'train'), 1):
+        start = time.perf_counter()
+        tfidf.partial_fit(docs)
+        categories.update(labels)
+        total_rows += len(docs)
+        _report('idf', number, len(docs), total_rows, time.perf_counter() - start)
+    if not total_rows:
+        raise ValueError(f"no training rows in {path}")
+
+    label_encoder = LabelEncoder().fit(sorted(categories))
+    classes = np.arange(len(label_encoder.classes_))
+    print("Categories found:", label_encoder.classes_)
+
+    # Training passes: every chunk is one partial_fit step; log loss gives predict_proba for the app
+    model = SGDClassifier(loss='log_loss', alpha=alpha, random_state=42)
+    for epoch in range(1, epochs + 1):
+        print(f"Epoch {epoch}/{epochs}...")
+        total_rows = 0
+        for number, (docs, labels) in enumerate(iter_chunks(path, chunk_size, 'train'), 1):
+            start = time.perf_counter()
+            model.partial_fit(tfidf.transform(docs), label_encoder.transform(labels), classes=classes)
+            total_rows += len(docs)
+            _report(f'epoch {epoch}', number, len(docs), total_rows, time.perf_counter() - start)
+
+    # Held-out pass: accuracy is accumulated chunk by chunk
+    print("Evaluating on held-out rows...")
+    correct = seen = 0
+    known = set(label_encoder.classes_)
+    for docs, labels in iter_chunks(path, chunk_size, 'test'):
+        # Categories that only occur in the held-out rows can never be predicted; count them as misses
+        mask = np.array([label in known for label in labels])
+        if mask.any():
+            predicted = model.predict(tfidf.transform(docs[mask]))
+            correct += int((predicted == label_encoder.transform(labels[mask])).sum())
+        seen += len(labels)
+    accuracy = correct / seen if seen else float('nan')
+    return tfidf, label_encoder, model, accuracy
@@ -0,0 +1,42 @@
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extraction_pool import PdfExtractionPool
+
+def write_resumes(directory, n):
+    paths = []
+    for i in range(n):
+        path = directory / f'resume-{i}.txt'
+        path.write_text(f'resume {i} text')
+        paths.append(str(path))
+    return paths
+
+def test_slow_consumer_does_not_time_out_finished_files(tmp_path):
+    paths = write_resumes(tmp_path, 4)
+    with PdfExtractionPool(workers=2, timeout=1.0) as pool:
+        results = {}
+        for index, text, error in pool.imap_unordered(paths):
+            results[index] = (text, error)
+            # Longer than the timeout: results that arrived meanwhile must still count
+            time.sleep(1.5)
+    assert results == {i: (f'resume {i} text', None) for i in range(4)}
+
+@pytest.mark.skipif(not hasattr(os, 'mkfifo'), reason="needs named pipes")
+def test_hung_file_times_out_with_slow_consumer(tmp_path):
+    paths = write_resumes(tmp_path, 3)
+    # Opening a FIFO nobody writes to blocks the worker forever
+    hung = tmp_path / 'hung.txt'
+    os.mkfifo(hung)
+    paths.insert(1, str(hung))
+    with PdfExtractionPool(workers=2, timeout=1.0) as pool:
+        results = {}
+        for index, text, error in pool.imap_unordered(paths):
+            results[index] = (text, error)
+            time.sleep(1.5)
+    assert results[1] == (None, 'timed out after 1.0s')
+    assert [results[i] for i in (0, 2, 3)] == [(f'resume {i} text', None) for i in range(3)]
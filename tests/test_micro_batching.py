@@ -0,0 +1,40 @@
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micro_batching import MicroBatcher
+
+def test_lone_item_is_dispatched_without_waiting():
+    batcher = MicroBatcher(lambda items: [item * 2 for item in items], max_wait_ms=500)
+    try:
+        for item in range(3):
+            start = time.perf_counter()
+            assert batcher(item) == item * 2
+            assert time.perf_counter() - start < 0.25
+        assert batcher.stats()['batch_size_counts'] == {1: 3}
+    finally:
+        batcher.close()
+
+def test_items_arriving_during_a_batch_are_coalesced():
+    started, release = threading.Event(), threading.Event()
+
+    def batch_fn(items):
+        started.set()
+        release.wait(5)
+        return items
+
+    batcher = MicroBatcher(batch_fn, max_wait_ms=200)
+    try:
+        first = batcher.submit('first')
+        assert started.wait(5)
+        # A batch is in flight, so these wait for each other instead of going out one by one
+        rest = [batcher.submit(i) for i in range(5)]
+        release.set()
+        assert first.result(5) == 'first'
+        assert [future.result(5) for future in rest] == list(range(5))
+        assert batcher.stats()['batch_size_counts'] == {1: 1, 5: 1}
+    finally:
+        batcher.close()
@@ -0,0 +1,58 @@
+import os
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_data import sample_resumes
+from text_processing import clean_text, clean_texts
+
+def legacy_clean_text(text):
+    # The regex chain clean_text replaced; models trained before it saw exactly this output
+    if isinstance(text, str):
+        text = text.lower()
+        text = re.sub(r'[^a-zA-Z\s]', '', text)
+        text = re.sub(r'\s+', ' ', text).strip()
+        return text
+    return ""
+
+RESUMES = list(sample_resumes.values()) + [
+    "",
+    "   \t\n  ",
+    "John Doe\r\nSenior Data Scientist | john.doe@example.com | +1 (555) 010-9999",
+    "• Built ETL pipelines in Python 3.11 & SQL — cut costs by 40%\n• Led a team of 5",
+    "Résumé: José Núñez, Zürich. Compétences: Ça va, naïve café, STRASSE/Straße",
+    "Skills: C++, C#, Node.js​, R　Go Rust Kotlin",
+    "İstanbul ΣΊΣΥΦΟΣ Kelvin K ﬁnance ǅemal 😀 Ω",
+    "line one\x0bline two\x0cline three\x1cfour\x1dfive\x1esix\x1fseven\x85eight",
+]
+
+def test_clean_text_matches_legacy_regex_on_every_code_point():
+    # Every code point between letters, in blocks, so whitespace collapsing and case mapping
+    # are exercised in context as well as the character itself
+    codepoints = range(0x110000)
+    for start in range(0, len(codepoints), 4096):
+        text = 'a'.join(chr(c) for c in codepoints[start:start + 4096])
+        if clean_text(text) != legacy_clean_text(text):
+            mismatched = [hex(c) for c in codepoints[start:start + 4096]
+                          if clean_text(f'a{chr(c)}b') != legacy_clean_text(f'a{chr(c)}b')]
+            pytest.fail(f"clean_text differs from the legacy regex chain for {mismatched[:20]}")
+
+@pytest.mark.parametrize('text', RESUMES)
+def test_clean_text_matches_legacy_regex_on_resumes(text):
+    assert clean_text(text) == legacy_clean_text(text)
+
+def test_clean_text_of_non_str_is_empty():
+    for value in (None, float('nan'), 42, 3.5, b'bytes'):
+        assert clean_text(value) == legacy_clean_text(value) == ""
+
+def test_clean_texts_matches_clean_text_row_by_row():
+    texts = pd.Series(RESUMES + [None, np.nan, 42, 3.5, "   ", "Ünïcödé ONLY"],
+                      index=np.arange(len(RESUMES) + 6) * 10)
+    cleaned = clean_texts(texts)
+    assert cleaned.index.equals(texts.index)
+    assert cleaned.tolist() == list(map(clean_text, texts))
@@ -0,0 +1,62 @@
+import hashlib
+import re
+
+_ASCII_LETTERS = frozenset('abcdefghijklmnopqrstuvwxyz')
+_NON_ASCII = re.compile(r'[^\x00-\x7f]+')
+# Cleaning this string must give the same result at serving time as it did at training time
+_CLEANER_PROBE = "Senior Data-Scientist (5+ yrs)\n\tPython, SQL & Machine Learning — Kubernetes"
+
+class _CleaningTable(dict):
+    """
+    str.translate table equivalent to lower() followed by dropping [^a-zA-Z\\s] and
+    mapping every whitespace character to a space. Entries are filled in on first
+    sight, so the table only ever holds characters that actually occur.
+    """
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        if char.isspace():
+            value = ' '
+        else:
+            # lower() can turn a non-ASCII letter into ASCII (e.g. the Kelvin sign into 'k')
+            value = ''.join(c for c in char.lower() if c in _ASCII_LETTERS) or None
+        self[codepoint] = value
+        return value
+
+_TABLE = _CleaningTable()
+
+def _translate_match(match):
+    return match.group().translate(_TABLE)
+
+# Text cleaning function
+def clean_text(text):
+    """
+    Lowercase, keep only ASCII letters and collapse whitespace to single spaces.
+    """
+    if isinstance(text, str):
+        if not text.isascii():
+            # translate() only has a fast path for pure-ASCII input, so map the rare non-ASCII runs first
+            text = _NON_ASCII.sub(_translate_match, text)
+        return ' '.join(text.translate(_TABLE).split())
+    return ""
+
+def clean_texts(texts):
+    """
+    Batch variant of clean_text for a pandas Series of raw texts, using the .str
+    accessor. Produces exactly the same strings as clean_text for every row
+    (non-string rows become "").
+    """
+    cleaned = (
+        texts.str.replace(_NON_ASCII, _translate_match, regex=True)
+        .str.translate(_TABLE)
+        .str.split()
+        .str.join(' ')
+    )
+    return cleaned.fillna('')
+
+def cleaner_fingerprint():
+    """
+    Short hash of clean_text's output on a fixed probe string. Trained models and cached
+    features record it, so a change in cleaning behaviour invalidates both.
+    """
+    return hashlib.sha256(clean_text(_CLEANER_PROBE).encode('utf-8')).hexdigest()[:16]
@@ -1,38 +1,97 @@
+import argparse
+import shutil
+import sys
+import time
+
 import pandas as pd
-import re
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.preprocessing import LabelEncoder
 from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
-from sklearn.svm import LinearSVC
-from sklearn.calibration import CalibratedClassifierCV
-from sklearn.metrics import accuracy_score, classification_report
-import joblib
+from sklearn.metrics import classification_report
 import matplotlib.pyplot as plt
 import seaborn as sns
 
-print("Loading data...")
-# Load data
-df = pd.read_csv('Cleaned_Data.csv')
-
-# Check for missing values and drop them
-print(f"Original shape: {df.shape}")
-df = df.dropna()
-print(f"After dropping NaN: {df.shape}")
-
-# Quick text cleaning function
-def clean_text(text):
-    if isinstance(text, str):
-        text = text.lower()
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
-    return ""
-
-print("Cleaning text...")
-# Apply cleaning
-df['Cleaned_Text'] = df['Text'].apply(clean_text)
+from compiled_model import COMPILED_DIR, export_compiled, verify_compiled
+from feature_store import DEFAULT_FEATURE_STORE_DIR, FeatureStore
+from hashing_features import DEFAULT_N_FEATURES, HashedTfidfVectorizer
+from model_selection import LEADERBOARD_PATH, make_vectorizer, model_grid, select_model, vectorizer_grid
+from model_store import PIPELINE_PATH, save_pipeline
+from resume_data import build_content_index, missing_content
+from streaming_training import DEFAULT_CHUNK_SIZE, DEFAULT_EPOCHS, train_streaming
+from text_processing import clean_texts
+
+parser = argparse.ArgumentParser(description="Train the resume classifier.")
+parser.add_argument('--data', default='Cleaned_Data.csv', help="Labelled CSV with Category and Text columns")
+parser.add_argument('--vectorizer', choices=['tfidf', 'hashing'], default='tfidf',
+                    help="tfidf: vocabulary-based TfidfVectorizer; hashing: hashed n-grams with a stored IDF array")
+parser.add_argument('--hash-features', type=int, default=DEFAULT_N_FEATURES,
+                    help="Number of hash buckets for --vectorizer hashing")
+parser.add_argument('--svm-calibration', choices=['single', 'ensemble'], default='single',
+                    help="single: one SVM fitted on all training data, calibrated on out-of-fold scores; "
+                         "ensemble: one calibrated SVM per CV fold (3x the inference cost)")
+parser.add_argument('--lr-C', type=float, nargs='+', default=[0.5, 1.0, 2.0],
+                    help="LogisticRegression C values to try")
+parser.add_argument('--svm-C', type=float, nargs='+', default=[0.25, 0.5, 1.0],
+                    help="LinearSVC C values to try")
+parser.add_argument('--max-features', type=int, nargs='+', default=[5000],
+                    help="TF-IDF vocabulary sizes to try")
+parser.add_argument('--ngram-max', type=int, nargs='+', default=[2],
+                    help="Largest word n-gram sizes to try (ngram_range=(1, n))")
+parser.add_argument('--workers', type=int, default=-1,
+                    help="Processes for model selection (-1: one per CPU)")
+parser.add_argument('--feature-store', default=DEFAULT_FEATURE_STORE_DIR,
+                    help="Directory caching the cleaned corpus and fitted feature matrices between runs")
+parser.add_argument('--no-feature-store', dest='feature_store', action='store_const', const=None,
+                    help="Always re-clean and re-vectorize the corpus")
+parser.add_argument('--stream', action='store_true',
+                    help="Out-of-core mode: read the CSV in chunks and train hashed features with SGD")
+parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per chunk in --stream mode")
+parser.add_argument('--epochs', type=int, default=DEFAULT_EPOCHS, help="Passes over the data in --stream mode")
+args = parser.parse_args()
+
+if args.stream:
+    # Memory stays bounded by --chunk-size and --hash-features, whatever the size of the CSV
+    print(f"Streaming training over {args.data} in chunks of {args.chunk_size} rows...")
+    start = time.perf_counter()
+    tfidf, label_encoder, model, accuracy = train_streaming(
+        args.data, args.chunk_size, args.epochs, args.hash_features
+    )
+    print(f"Held-out accuracy: {accuracy:.4f} ({time.perf_counter() - start:.1f}s)")
+    manifest = save_pipeline(tfidf, label_encoder, model, metrics={
+        'sgd_accuracy': accuracy,
+        'best_accuracy': accuracy,
+        'streaming': True,
+    })
+    print(f"Pipeline saved to {PIPELINE_PATH} (sha256 {manifest['artifact_sha256'][:16]}, "
+          f"{manifest['vocab_size']} features)")
+    missing = missing_content(build_content_index(label_encoder.classes_))
+    if missing:
+        print(f"No tailored app content for {len(missing)} categories: {', '.join(missing)}")
+    sys.exit(0)
+
+def load_corpus(path):
+    print("Loading data...")
+    # Load data
+    df = pd.read_csv(path)
+
+    # Check for missing values and drop them
+    print(f"Original shape: {df.shape}")
+    df = df.dropna()
+    print(f"After dropping NaN: {df.shape}")
+
+    print("Cleaning text...")
+    # Apply cleaning (same normaliser the app uses at serving time)
+    df['Cleaned_Text'] = clean_texts(df['Text'])
+    return df
+
+# Cleaned corpus and feature matrices are reused from the feature store when the data hasn't changed
+if args.feature_store:
+    store = FeatureStore(args.feature_store)
+    df, corpus_key = store.cleaned_corpus(args.data, load_corpus)
+    print(f"Corpus: {len(df)} rows (feature store key {corpus_key})")
+else:
+    store, corpus_key = None, None
+    df = load_corpus(args.data)
 
 # Encode categories
 print("Encoding categories...")
@@ -41,72 +100,74 @@ df['Category_Encoded'] = label_encoder.fit_transform(df['Category'])
 
 print("Categories found:", label_encoder.classes_)
 
-# Use a more efficient TF-IDF vectorizer
-print("Creating TF-IDF features...")
-tfidf = TfidfVectorizer(
-    max_features=5000,
-    ngram_range=(1, 2),
-    min_df=2,
-    max_df=0.85,
-    sublinear_tf=True
-)
+# Candidate vectorizers: TF-IDF vocabularies, or hashed n-grams with a stored IDF array
+# (bounded memory and no vocabulary dict; same weighting as TF-IDF)
+if args.vectorizer == 'hashing':
+    vectorizers = vectorizer_grid(max_features=[None], ngram_ranges=[(1, n) for n in args.ngram_max])
+    def vectorizer_factory(config):
+        return HashedTfidfVectorizer(
+            n_features=args.hash_features,
+            ngram_range=config['ngram_range'],
+            min_df=2,
+            max_df=0.85,
+            sublinear_tf=True
+        )
+else:
+    vectorizers = vectorizer_grid(args.max_features, [(1, n) for n in args.ngram_max])
+    vectorizer_factory = make_vectorizer
+models = model_grid(args.lr_C, args.svm_C, args.svm_calibration)
 
-X = tfidf.fit_transform(df['Cleaned_Text'])
-y = df['Category_Encoded']
+y = df['Category_Encoded'].to_numpy()
 
 # Split data
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.2, random_state=42, stratify=y
-)
-
-print(f"Training set: {X_train.shape}, Test set: {X_test.shape}")
-
-# Save the vectorizer and encoder
-joblib.dump(tfidf, 'vectorizer.pkl')
-joblib.dump(label_encoder, 'labelencoder.pkl')
-print("Vectorizer and encoder saved")
-
-# Model 1: Logistic Regression (Fast and effective for text)
-print("Training Logistic Regression...")
-lr = LogisticRegression(
-    C=1.0, 
-    solver='liblinear', 
-    max_iter=1000,
-    random_state=42
+train_index, test_index = train_test_split(
+    np.arange(len(df)), test_size=0.2, random_state=42, stratify=y
 )
-lr.fit(X_train, y_train)
-y_pred_lr = lr.predict(X_test)
-lr_accuracy = accuracy_score(y_test, y_pred_lr)
-print(f"Logistic Regression Accuracy: {lr_accuracy:.4f}")
-
-# Model 2: Linear SVM (Fast and accurate)
-print("Training SVM...")
-svm = LinearSVC(
-    C=0.5, 
-    max_iter=2000, 
-    random_state=42,
-    dual=False
+print(f"Training set: {len(train_index)} rows, Test set: {len(test_index)} rows")
+
+# Model selection: every vectorizer x classifier candidate, fitted in parallel
+print(f"Selecting among {len(vectorizers) * len(models)} candidates...")
+leaderboard, results = select_model(
+    df['Cleaned_Text'], y, train_index, test_index, vectorizers, models,
+    workers=args.workers, vectorizer_factory=vectorizer_factory,
+    feature_store=store, corpus_key=corpus_key
 )
-svm.fit(X_train, y_train)
-
-# Calibrate SVM for probability estimates
-calibrated_svm = CalibratedClassifierCV(svm, cv=3)  # Reduced CV for speed
-calibrated_svm.fit(X_train, y_train)
-y_pred_svm = calibrated_svm.predict(X_test)
-svm_accuracy = accuracy_score(y_test, y_pred_svm)
-print(f"SVM Accuracy: {svm_accuracy:.4f}")
-
-# Save the best model
-if lr_accuracy > svm_accuracy:
-    joblib.dump(lr, 'classifier.pkl')
-    best_model = lr
-    best_accuracy = lr_accuracy
-    print("Logistic Regression model saved as best")
-else:
-    joblib.dump(calibrated_svm, 'classifier.pkl')
-    best_model = calibrated_svm
-    best_accuracy = svm_accuracy
-    print("SVM model saved as best")
+print(leaderboard.round(4).to_string())
+print(f"Leaderboard saved to {LEADERBOARD_PATH}")
+
+tfidf, best_model, best_accuracy = results[0]
+lr_accuracy = leaderboard.loc[leaderboard['model'] == 'logistic_regression', 'accuracy'].max()
+svm_accuracy = leaderboard.loc[leaderboard['model'] == 'svm', 'accuracy'].max()
+best = leaderboard.iloc[0]
+print(f"Selected {best['model']} (C={best['C']}, ngram_range={best['ngram_range']}, "
+      f"max_features={best['max_features']})")
+
+X_test = tfidf.transform(df['Cleaned_Text'].iloc[test_index])
+y_test = y[test_index]
+
+# Save cleaner, vectorizer, classifier and labels as one versioned artifact
+manifest = save_pipeline(tfidf, label_encoder, best_model, metrics={
+    'logistic_regression_accuracy': lr_accuracy,
+    'svm_accuracy': svm_accuracy,
+    'svm_calibration': args.svm_calibration,
+    'candidates': len(leaderboard),
+    'best_accuracy': best_accuracy,
+})
+print(f"Pipeline saved to {PIPELINE_PATH} (sha256 {manifest['artifact_sha256'][:16]}, "
+      f"{manifest['vocab_size']} features)")
+missing = missing_content(build_content_index(label_encoder.classes_))
+if missing:
+    print(f"No tailored app content for {len(missing)} categories: {', '.join(missing)}")
+
+# Flat, memory-mappable copy of the same model for fast multi-worker serving
+try:
+    export_compiled(tfidf, label_encoder, best_model, COMPILED_DIR, manifest['artifact_sha256'])
+    # The serving fast path must reproduce sklearn's probabilities, or it is not shipped
+    max_diff = verify_compiled(tfidf, best_model, list(df['Cleaned_Text'].iloc[:500]), COMPILED_DIR)
+    print(f"Compiled model saved to {COMPILED_DIR}/ (max probability diff {max_diff:.2g})")
+except ValueError as e:
+    shutil.rmtree(COMPILED_DIR, ignore_errors=True)
+    print(f"Skipping compiled model export: {e}")
 
 # Evaluation
 print("\n=== FINAL EVALUATION ===")